@@ -39,6 +39,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         exchange=settings.rabbitmq_exchange,
         queue=settings.rabbitmq_queue,
         engine=engine,
+        prefetch_count=settings.rabbitmq_prefetch_count,
     )
     await consumer.start()
     app.state.message_consumer = consumer
@@ -14,22 +14,32 @@ IMPORTANT: A/B testing in education requires:
 - Ability to provide intervention to control group after study
 """
 
+from bisect import bisect_right
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from itertools import accumulate
 from typing import Any, Optional
+import asyncio
+import calendar
 import hashlib
 import json
 import logging
 import math
+import time
 import uuid
 
 import numpy as np
-from scipy import stats
+from scipy import special, stats
 
 logger = logging.getLogger(__name__)
 
 
+# Variant names (lowercased) that identify the control group
+CONTROL_NAMES = frozenset({"control", "baseline"})
+
+
 class ExperimentStatus(str, Enum):
     """Experiment lifecycle status"""
     DRAFT = "draft"
@@ -48,7 +58,7 @@ class AssignmentStrategy(str, Enum):
     DETERMINISTIC = "deterministic"        # Hash-based for consistency
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperimentVariant:
     """A variant in an A/B experiment"""
     name: str
@@ -62,6 +72,83 @@ class ExperimentVariant:
     total_value: float = 0.0
 
 
+@dataclass(slots=True)
+class Outcome:
+    """A single outcome metric observation for an experiment participant"""
+    experiment_id: str
+    student_id: str
+    metric_name: str
+    value: float
+    timestamp_ns: int  # Epoch nanoseconds (UTC)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Observation time as an aware UTC datetime (built at write time only)."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, tz=timezone.utc) + timedelta(
+            microseconds=nanos // 1000
+        )
+
+
+# Columnar layout for one chunk of outcomes streamed in for analysis.
+# Variant, metric and student are indices into lookups built during ingest.
+OUTCOME_DTYPE = np.dtype([
+    ("variant", "i2"),
+    ("metric", "i2"),
+    ("value", "f8"),
+    ("student", "i8"),
+])
+
+
+@dataclass(slots=True)
+class SampleMoments:
+    """Count, mean and sum of squared deviations (M2) of one sample"""
+    n: int
+    mean: float
+    m2: float
+    
+    def variance(self, ddof: int = 0) -> float:
+        """Sample variance with the given delta degrees of freedom."""
+        return self.m2 / (self.n - ddof) if self.n > ddof else 0.0
+
+
+@dataclass(slots=True)
+class OutcomeTable:
+    """Per-(variant, metric) outcome moments accumulated for an experiment"""
+    variant_names: list[str]
+    metric_index: dict[str, int]
+    
+    # Moments indexed [variant_idx, metric_idx]; participants by [variant_idx]
+    counts: np.ndarray
+    means: np.ndarray
+    m2: np.ndarray
+    participants: np.ndarray
+    
+    def variant_idx(self, variant_name: str) -> int:
+        """Index of a variant name, or -1 if it has no outcomes."""
+        try:
+            return self.variant_names.index(variant_name)
+        except ValueError:
+            return -1
+    
+    def moments(self, variant_name: str, metric_name: str) -> Optional[SampleMoments]:
+        """Moments for one variant/metric pair, or None if unobserved."""
+        v_idx = self.variant_idx(variant_name)
+        m_idx = self.metric_index.get(metric_name)
+        if v_idx < 0 or m_idx is None or not self.counts[v_idx, m_idx]:
+            return None
+        return SampleMoments(
+            n=int(self.counts[v_idx, m_idx]),
+            mean=float(self.means[v_idx, m_idx]),
+            m2=float(self.m2[v_idx, m_idx]),
+        )
+    
+    def mean(self, variant_name: str, metric_name: str) -> Optional[float]:
+        """Mean for one variant/metric pair, or None if unobserved."""
+        moments = self.moments(variant_name, metric_name)
+        return moments.mean if moments else None
+
+
 @dataclass
 class ExperimentConfig:
     """Configuration for an A/B experiment"""
@@ -114,6 +201,22 @@ class ExperimentConfig:
     status: ExperimentStatus = ExperimentStatus.DRAFT
     created_at: datetime = field(default_factory=datetime.utcnow)
     created_by: Optional[str] = None
+    
+    # Variant roles, resolved once when the experiment starts (variants are
+    # immutable from then on)
+    _variant_index: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _control_name: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _treatment_name: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Critical values for final vs interim analysis, fixed at activation
+    _p_threshold: dict[bool, float] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _z_critical: dict[bool, float] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
 
 @dataclass
@@ -164,6 +267,8 @@ class ABTestingService:
     7. Make decision
     """
     
+    OUTCOME_CHUNK_SIZE = 10_000  # Outcomes folded into the moments per fetch
+    
     def __init__(self, db_connection):
         self.db = db_connection
         self._active_experiments: dict[str, ExperimentConfig] = {}
@@ -211,14 +316,20 @@ class ABTestingService:
         if len(config.variants) < 2:
             errors.append("Experiment must have at least 2 variants")
         
+        # Single pass: total weight and presence of a control group
+        total_weight = 0.0
+        has_control = False
+        for variant in config.variants:
+            total_weight += variant.weight
+            if not has_control and variant.name.lower() in CONTROL_NAMES:
+                has_control = True
+        
         # Weights must sum to 1
-        total_weight = sum(v.weight for v in config.variants)
         if not (0.99 <= total_weight <= 1.01):
             errors.append(f"Variant weights must sum to 1.0 (got {total_weight})")
         
         # Must have control group
-        control_variants = [v for v in config.variants if v.name.lower() in ["control", "baseline"]]
-        if not control_variants:
+        if not has_control:
             errors.append("Experiment must include a 'control' or 'baseline' variant")
         
         # Validate dates if provided
@@ -279,6 +390,8 @@ class ABTestingService:
         
         config.status = ExperimentStatus.ACTIVE
         config.start_date = datetime.now(timezone.utc)
+        self._resolve_variant_roles(config)
+        self._precompute_critical_values(config)
         
         await self._update_experiment(config)
         self._active_experiments[experiment_id] = config
@@ -331,9 +444,10 @@ class ABTestingService:
             stratification_data=stratification_data,
         )
         
+        # Lazy %-formatting: this runs per assignment and debug is usually off
         logger.debug(
-            f"Assigned student {student_id} to variant '{variant.name}' "
-            f"in experiment {experiment_id}"
+            "Assigned student %s to variant '%s' in experiment %s",
+            student_id, variant.name, experiment_id,
         )
         
         return variant.name
@@ -350,20 +464,16 @@ class ABTestingService:
         Ensures same student always gets same variant (for consistency).
         """
         # Create hash from experiment + student
-        hash_input = f"{experiment_id}:{student_id}"
-        hash_value = int(hashlib.md5(hash_input.encode()).hexdigest(), 16)
+        hash_input = f"{experiment_id}:{student_id}".encode()
+        hash_value = int.from_bytes(hashlib.md5(hash_input).digest(), "big")
         
         # Normalize to 0-1
         normalized = (hash_value % 10000) / 10000
         
-        # Select variant based on weights
-        cumulative = 0.0
-        for variant in variants:
-            cumulative += variant.weight
-            if normalized < cumulative:
-                return variant
-        
-        return variants[-1]
+        # Select variant based on weights: first cumulative weight above normalized
+        cumulative = list(accumulate(v.weight for v in variants))
+        idx = bisect_right(cumulative, normalized)
+        return variants[min(idx, len(variants) - 1)]
     
     def _random_assignment(
         self,
@@ -406,107 +516,203 @@ class ABTestingService:
         - mastery_improvement: Change in mastery level
         - intervention_completion_rate: % of intervention completed
         """
-        timestamp = timestamp or datetime.now(timezone.utc)
+        if timestamp is None:
+            # Hot path: keep the raw clock reading, datetime is built on write
+            timestamp_ns = time.time_ns()
+        else:
+            # Naive datetimes are UTC here (datetime.utcnow()), not local time
+            timestamp_ns = (
+                calendar.timegm(timestamp.utctimetuple()) * 1_000_000_000
+                + timestamp.microsecond * 1000
+            )
         
-        await self._store_outcome(
+        await self._store_outcome(Outcome(
             experiment_id=experiment_id,
             student_id=student_id,
             metric_name=metric_name,
             value=value,
-            timestamp=timestamp,
+            timestamp_ns=timestamp_ns,
+        ))
+    
+    async def _build_outcome_table(
+        self,
+        experiment_id: str,
+        variant_index: dict[str, int],
+    ) -> Optional[OutcomeTable]:
+        """
+        Stream outcomes chunk by chunk into per-(variant, metric) moments.
+        
+        Memory stays O(V·M) plus the participant sets instead of holding
+        every outcome. Configured variants keep their config order; variants
+        and metrics that only appear in the data are appended as seen.
+        Returns None if no outcomes were recorded.
+        """
+        variant_index = dict(variant_index)
+        metric_index: dict[str, int] = {}
+        student_index: dict[str, int] = {}
+        pair_moments: dict[tuple[int, int], SampleMoments] = {}
+        enrolled: dict[int, set[int]] = {}
+        
+        async for chunk in self._stream_experiment_outcomes(experiment_id):
+            if not chunk:
+                continue
+            records = np.fromiter(
+                (
+                    (
+                        variant_index.setdefault(o["variant_name"], len(variant_index)),
+                        metric_index.setdefault(o["metric_name"], len(metric_index)),
+                        o["value"],
+                        student_index.setdefault(o["student_id"], len(student_index)),
+                    )
+                    for o in chunk
+                ),
+                dtype=OUTCOME_DTYPE,
+                count=len(chunk),
+            )
+            self._merge_chunk_moments(records, len(metric_index), pair_moments)
+            
+            for v_idx in np.unique(records["variant"]).tolist():
+                students = records["student"][records["variant"] == v_idx]
+                enrolled.setdefault(v_idx, set()).update(students.tolist())
+        
+        if not pair_moments:
+            return None
+        
+        shape = (len(variant_index), len(metric_index))
+        counts = np.zeros(shape, dtype=np.int64)
+        means = np.zeros(shape)
+        m2 = np.zeros(shape)
+        for (v_idx, m_idx), moments in pair_moments.items():
+            counts[v_idx, m_idx] = moments.n
+            means[v_idx, m_idx] = moments.mean
+            m2[v_idx, m_idx] = moments.m2
+        
+        participants = np.zeros(len(variant_index), dtype=np.int64)
+        for v_idx, students in enrolled.items():
+            participants[v_idx] = len(students)
+        
+        return OutcomeTable(
+            variant_names=list(variant_index),
+            metric_index=metric_index,
+            counts=counts,
+            means=means,
+            m2=m2,
+            participants=participants,
         )
     
-    def _group_outcomes_by_variant(
+    def _merge_chunk_moments(
         self,
-        outcomes: list[dict],
-    ) -> dict[str, list[dict]]:
-        """Group outcomes by variant name."""
-        by_variant: dict[str, list[dict]] = {}
-        for outcome in outcomes:
-            variant = outcome["variant_name"]
-            if variant not in by_variant:
-                by_variant[variant] = []
-            by_variant[variant].append(outcome)
-        return by_variant
+        records: np.ndarray,
+        n_metrics: int,
+        pair_moments: dict[tuple[int, int], SampleMoments],
+    ) -> None:
+        """
+        Fold one chunk into the running moments (Chan et al. parallel update).
+        
+        Chunk-level count/mean/M2 per pair come from bincount; merging with
+        the running values is the batch form of Welford's update.
+        """
+        keys = records["variant"].astype(np.int64) * n_metrics + records["metric"]
+        pair_keys, inverse = np.unique(keys, return_inverse=True)
+        values = records["value"]
+        
+        counts = np.bincount(inverse)
+        means = np.bincount(inverse, weights=values) / counts
+        m2 = np.bincount(inverse, weights=(values - means[inverse]) ** 2)
+        
+        for key, n_b, mean_b, m2_b in zip(
+            pair_keys.tolist(), counts.tolist(), means.tolist(), m2.tolist()
+        ):
+            pair = divmod(key, n_metrics)
+            current = pair_moments.get(pair)
+            if current is None:
+                pair_moments[pair] = SampleMoments(n=n_b, mean=mean_b, m2=m2_b)
+                continue
+            
+            n = current.n + n_b
+            delta = mean_b - current.mean
+            current.mean += delta * n_b / n
+            current.m2 += m2_b + delta ** 2 * current.n * n_b / n
+            current.n = n
     
     def _calculate_metrics_by_variant(
         self,
-        by_variant: dict[str, list[dict]],
+        table: OutcomeTable,
         metric_name: str,
     ) -> tuple[dict[str, float], dict[str, int]]:
         """Calculate metric values and participant counts by variant."""
+        metric_idx = table.metric_index.get(metric_name)
         metric_by_variant = {}
         participants_by_variant = {}
         
-        for variant, variant_outcomes in by_variant.items():
-            metric_values = [
-                o["value"] for o in variant_outcomes
-                if o["metric_name"] == metric_name
-            ]
-            if metric_values:
-                metric_by_variant[variant] = np.mean(metric_values)
-            participants_by_variant[variant] = len({o["student_id"] for o in variant_outcomes})
+        for idx, variant in enumerate(table.variant_names):
+            if not table.participants[idx]:
+                continue
+            if metric_idx is not None and table.counts[idx, metric_idx]:
+                metric_by_variant[variant] = float(table.means[idx, metric_idx])
+            participants_by_variant[variant] = int(table.participants[idx])
         
         return metric_by_variant, participants_by_variant
     
-    def _get_control_treatment_names(
-        self,
-        variants: list,
-    ) -> tuple[str, str]:
-        """Identify control and treatment variant names."""
-        control_name = next(
-            (v.name for v in variants if v.name.lower() in ["control", "baseline"]),
-            variants[0].name
-        )
-        treatment_name = next(
-            (v.name for v in variants if v.name != control_name),
+    def _resolve_variant_roles(self, config: ExperimentConfig) -> None:
+        """Cache the variant index and control/treatment names on the config."""
+        variants = config.variants
+        variant_index: dict[str, int] = {}
+        control_name = None
+        for idx, variant in enumerate(variants):
+            variant_index[variant.name] = idx
+            if control_name is None and variant.name.lower() in CONTROL_NAMES:
+                control_name = variant.name
+        
+        config._variant_index = variant_index
+        config._control_name = control_name or variants[0].name
+        config._treatment_name = next(
+            (v.name for v in variants if v.name != config._control_name),
             variants[-1].name
         )
-        return control_name, treatment_name
     
-    def _extract_metric_values(
-        self,
-        by_variant: dict[str, list[dict]],
-        variant_name: str,
-        metric_name: str,
-    ) -> list[float]:
-        """Extract metric values for a specific variant."""
-        return [
-            o["value"] for o in by_variant.get(variant_name, [])
-            if o["metric_name"] == metric_name
-        ]
+    def _precompute_critical_values(self, config: ExperimentConfig) -> None:
+        """
+        Cache p-value thresholds and two-sided z critical values on the config.
+        
+        Interim looks spend half of alpha (Bonferroni over the interim and
+        final looks); both entries are keyed by the `interim` flag.
+        """
+        alpha = config.significance_level
+        config._p_threshold = {False: alpha, True: alpha / 2}
+        config._z_critical = {
+            interim: float(special.ndtri(1 - threshold / 2))
+            for interim, threshold in config._p_threshold.items()
+        }
     
     def _calculate_effect_size(
         self,
-        control_outcomes: list[float],
-        treatment_outcomes: list[float],
+        control: SampleMoments,
+        treatment: SampleMoments,
     ) -> tuple[float, float]:
         """Calculate pooled std and Cohen's d effect size."""
-        pooled_std = np.sqrt(
-            (np.std(control_outcomes) ** 2 + np.std(treatment_outcomes) ** 2) / 2
-        )
+        pooled_std = math.sqrt((control.variance() + treatment.variance()) / 2)
         effect_size = (
-            (np.mean(treatment_outcomes) - np.mean(control_outcomes)) / pooled_std
+            (treatment.mean - control.mean) / pooled_std
             if pooled_std > 0 else 0
         )
         return pooled_std, effect_size
     
     def _calculate_confidence_interval(
         self,
-        control_outcomes: list[float],
-        treatment_outcomes: list[float],
+        control: SampleMoments,
+        treatment: SampleMoments,
         pooled_std: float,
-        significance_level: float,
+        z: float,
     ) -> tuple[float, float]:
-        """Calculate confidence interval for difference."""
-        se = pooled_std * np.sqrt(1 / len(control_outcomes) + 1 / len(treatment_outcomes))
-        z = stats.norm.ppf(1 - significance_level / 2)
-        diff = np.mean(treatment_outcomes) - np.mean(control_outcomes)
-        return (diff - z * se, diff + z * se)
+        """Calculate confidence interval for difference at critical value z."""
+        se = pooled_std * math.sqrt(1 / control.n + 1 / treatment.n)
+        diff = treatment.mean - control.mean
+        return (float(diff - z * se), float(diff + z * se))
     
     def _check_guardrails(
         self,
-        by_variant: dict[str, list[dict]],
+        table: OutcomeTable,
         control_name: str,
         treatment_name: str,
         guardrail_metrics: list[str],
@@ -515,11 +721,11 @@ class ABTestingService:
         """Check guardrail metrics."""
         guardrail_status = {}
         for guardrail in guardrail_metrics:
-            control_vals = self._extract_metric_values(by_variant, control_name, guardrail)
-            treatment_vals = self._extract_metric_values(by_variant, treatment_name, guardrail)
+            control_mean = table.mean(control_name, guardrail)
+            treatment_mean = table.mean(treatment_name, guardrail)
             
-            if control_vals and treatment_vals:
-                delta = np.mean(treatment_vals) - np.mean(control_vals)
+            if control_mean is not None and treatment_mean is not None:
+                delta = treatment_mean - control_mean
                 guardrail_status[guardrail] = "pass" if abs(delta) <= max_delta else "fail"
         return guardrail_status
     
@@ -540,6 +746,36 @@ class ABTestingService:
             warnings.append("Interim analysis - final results may differ")
         return warnings
     
+    async def analyze_all_active(
+        self,
+        interim: bool = True,
+    ) -> dict[str, ExperimentResults]:
+        """
+        Analyze every active experiment concurrently.
+        
+        Each analysis streams its own outcomes, so the fetches overlap
+        instead of running back to back. Experiments that fail to analyze
+        (e.g. no outcomes yet) are logged and left out of the result;
+        cancellation of any analysis is re-raised.
+        """
+        experiment_ids = list(self._active_experiments)
+        results = await asyncio.gather(
+            *(self.analyze_results(eid, interim=interim) for eid in experiment_ids),
+            return_exceptions=True,
+        )
+        
+        analyzed = {}
+        for experiment_id, result in zip(experiment_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Analysis failed for experiment {experiment_id}: {result}")
+                continue
+            # CancelledError (and other non-Exception errors) must propagate
+            if isinstance(result, BaseException):
+                raise result
+            analyzed[experiment_id] = result
+        
+        return analyzed
+    
     async def analyze_results(
         self,
         experiment_id: str,
@@ -556,28 +792,32 @@ class ABTestingService:
             ExperimentResults with statistical analysis
         """
         config = await self._get_experiment(experiment_id)
-        outcomes = self._get_experiment_outcomes(experiment_id)
+        if config._control_name is None:
+            # Loaded without going through start_experiment
+            self._resolve_variant_roles(config)
+            self._precompute_critical_values(config)
+        
+        table = await self._build_outcome_table(experiment_id, config._variant_index)
         
-        if not outcomes:
+        if table is None:
             raise ValueError(f"No outcomes recorded for experiment {experiment_id}")
         
-        by_variant = self._group_outcomes_by_variant(outcomes)
         primary_by_variant, participants_by_variant = self._calculate_metrics_by_variant(
-            by_variant, config.primary_metric
+            table, config.primary_metric
         )
-        control_name, treatment_name = self._get_control_treatment_names(config.variants)
+        control_name, treatment_name = config._control_name, config._treatment_name
         
-        control_outcomes = self._extract_metric_values(by_variant, control_name, config.primary_metric)
-        treatment_outcomes = self._extract_metric_values(by_variant, treatment_name, config.primary_metric)
+        control = table.moments(control_name, config.primary_metric)
+        treatment = table.moments(treatment_name, config.primary_metric)
         
-        if len(control_outcomes) < 10 or len(treatment_outcomes) < 10:
+        if control is None or treatment is None or control.n < 10 or treatment.n < 10:
             return self._insufficient_data_result(
                 experiment_id, config, participants_by_variant, primary_by_variant
             )
         
         return await self._compute_full_results(
-            experiment_id, config, by_variant, participants_by_variant, primary_by_variant,
-            control_name, treatment_name, control_outcomes, treatment_outcomes, interim
+            experiment_id, config, table, participants_by_variant, primary_by_variant,
+            control_name, treatment_name, control, treatment, interim
         )
     
     def _insufficient_data_result(
@@ -610,28 +850,30 @@ class ABTestingService:
         self,
         experiment_id: str,
         config,  # noqa: ANN001
-        by_variant: dict[str, list[dict]],
+        table: OutcomeTable,
         participants_by_variant: dict[str, int],
         primary_by_variant: dict[str, float],
         control_name: str,
         treatment_name: str,
-        control_outcomes: list[float],
-        treatment_outcomes: list[float],
+        control: SampleMoments,
+        treatment: SampleMoments,
         interim: bool,
     ) -> ExperimentResults:
         """Compute full experiment results with statistical analysis."""
-        _t_stat, p_value = stats.ttest_ind(treatment_outcomes, control_outcomes)
-        significance = config.significance_level / 2 if interim else config.significance_level
-        is_significant = p_value < significance
+        _t_stat, p_value = stats.ttest_ind_from_stats(
+            treatment.mean, math.sqrt(treatment.variance(ddof=1)), treatment.n,
+            control.mean, math.sqrt(control.variance(ddof=1)), control.n,
+        )
+        is_significant = p_value < config._p_threshold[interim]
         
-        pooled_std, effect_size = self._calculate_effect_size(control_outcomes, treatment_outcomes)
+        pooled_std, effect_size = self._calculate_effect_size(control, treatment)
         ci = self._calculate_confidence_interval(
-            control_outcomes, treatment_outcomes, pooled_std, config.significance_level
+            control, treatment, pooled_std, config._z_critical[interim]
         )
         
-        secondary_metrics = self._calculate_secondary_metrics(by_variant, config.secondary_metrics)
+        secondary_metrics = self._calculate_secondary_metrics(table, config.secondary_metrics)
         guardrail_status = self._check_guardrails(
-            by_variant, control_name, treatment_name,
+            table, control_name, treatment_name,
             config.guardrail_metrics, config.max_guardrail_delta
         )
         
@@ -653,7 +895,7 @@ class ABTestingService:
             p_value=float(p_value),
             confidence_interval=ci,
             effect_size=float(effect_size),
-            is_significant=is_significant,
+            is_significant=bool(is_significant),
             secondary_metrics=secondary_metrics,
             guardrail_status=guardrail_status,
             recommendation=recommendation,
@@ -666,22 +908,16 @@ class ABTestingService:
     
     def _calculate_secondary_metrics(
         self,
-        by_variant: dict[str, list[dict]],
+        table: OutcomeTable,
         secondary_metrics: list[str],
     ) -> dict[str, dict[str, float]]:
         """Calculate secondary metrics by variant."""
         result = {}
         for metric in secondary_metrics:
-            metric_by_variant, _ = self._calculate_metrics_by_variant(by_variant, metric)
+            metric_by_variant, _ = self._calculate_metrics_by_variant(table, metric)
             result[metric] = metric_by_variant
         return result
-            is_significant=is_significant,
-            effect_size=effect_size,
-            guardrail_status=guardrail_status,
-            sample_sizes=participants_by_variant,
-            min_sample=config.min_sample_size,
-        )
-        
+    
     def _generate_recommendation(
         self,
         is_significant: bool,
@@ -795,14 +1031,7 @@ class ABTestingService:
         """Store variant assignment"""
         pass
     
-    async def _store_outcome(
-        self,
-        experiment_id: str,
-        student_id: str,
-        metric_name: str,
-        value: float,
-        timestamp: datetime,
-    ) -> None:
+    async def _store_outcome(self, outcome: Outcome) -> None:
         """Store outcome metric"""
         pass
     
@@ -813,6 +1042,16 @@ class ABTestingService:
         """Get all outcomes for experiment"""
         return []
     
+    async def _stream_experiment_outcomes(
+        self,
+        experiment_id: str,
+    ) -> AsyncIterator[list[dict]]:
+        """Yield outcomes for experiment in pages of OUTCOME_CHUNK_SIZE"""
+        # A DB-backed implementation should page through a server-side cursor
+        outcomes = self._get_experiment_outcomes(experiment_id)
+        for start in range(0, len(outcomes), self.OUTCOME_CHUNK_SIZE):
+            yield outcomes[start:start + self.OUTCOME_CHUNK_SIZE]
+    
     async def _store_results(self, results: ExperimentResults) -> None:
         """Store analysis results"""
         pass
@@ -12,17 +12,19 @@ IMPORTANT: Bias detection is critical for ensuring equitable outcomes.
 All detected biases should be reviewed and addressed promptly.
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Optional
-import json
+import hashlib
 import logging
 import math
-from collections import defaultdict
+import sys
 
+import msgspec
 import numpy as np
-from scipy import stats
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +58,7 @@ class ProtectedAttribute(str, Enum):
     GRADE_LEVEL = "grade_level"
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupStatistics:
     """Statistics for a demographic group"""
     group_name: str
@@ -70,7 +72,89 @@ class GroupStatistics:
     calibration_error: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class GroupStatsBatch:
+    """
+    Statistics for all groups of one attribute, one array entry per group.
+    
+    Outcome-based rates are NaN where they could not be computed.
+    """
+    group_names: list[str]
+    sample_size: np.ndarray
+    mean_prediction: np.ndarray
+    std_prediction: np.ndarray
+    positive_rate: np.ndarray
+    true_positive_rate: np.ndarray
+    false_positive_rate: np.ndarray
+    false_negative_rate: np.ndarray
+    calibration_error: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.group_names)
+    
+    @classmethod
+    def from_group_statistics(cls, stats: list[GroupStatistics]) -> "GroupStatsBatch":
+        """Stack per-group statistics into a batch"""
+        def column(name: str) -> np.ndarray:
+            return np.array(
+                [np.nan if (v := getattr(g, name)) is None else v for g in stats],
+                dtype=np.float64,
+            )
+        
+        return cls(
+            group_names=[g.group_name for g in stats],
+            sample_size=np.array([g.sample_size for g in stats], dtype=np.int64),
+            mean_prediction=column("mean_prediction"),
+            std_prediction=column("std_prediction"),
+            positive_rate=column("positive_rate"),
+            true_positive_rate=column("true_positive_rate"),
+            false_positive_rate=column("false_positive_rate"),
+            false_negative_rate=column("false_negative_rate"),
+            calibration_error=column("calibration_error"),
+        )
+    
+    def to_group_statistics(self) -> list[GroupStatistics]:
+        """Unpack into one GroupStatistics per group, with None for NaN"""
+        def optional(values: np.ndarray) -> list[Optional[float]]:
+            return [None if math.isnan(v) else v for v in values.tolist()]
+        
+        return [
+            GroupStatistics(
+                group_name=name,
+                sample_size=size,
+                mean_prediction=mean,
+                std_prediction=std,
+                positive_rate=rate,
+                true_positive_rate=tpr,
+                false_positive_rate=fpr,
+                false_negative_rate=fnr,
+                calibration_error=cal_error
+            )
+            for name, size, mean, std, rate, tpr, fpr, fnr, cal_error in zip(
+                self.group_names,
+                self.sample_size.tolist(),
+                self.mean_prediction.tolist(),
+                self.std_prediction.tolist(),
+                self.positive_rate.tolist(),
+                optional(self.true_positive_rate),
+                optional(self.false_positive_rate),
+                optional(self.false_negative_rate),
+                optional(self.calibration_error),
+            )
+        ]
+
+
+@dataclass(slots=True)
+class PredictionArrays:
+    """Column view of a prediction batch, aligned by row index"""
+    student_ids: np.ndarray  # object array of student ids
+    scores: np.ndarray  # risk_score as float64
+    predicted_positive: np.ndarray  # bool, scores >= 0.5 (high-risk classification)
+    has_outcome: np.ndarray  # bool, True where a ground-truth outcome exists
+    actuals: np.ndarray  # bool actual outcome, False where has_outcome is False
+
+
+@dataclass(slots=True)
 class FairnessResult:
     """Result of a fairness metric evaluation"""
     metric: FairnessMetric
@@ -87,7 +171,7 @@ class FairnessResult:
     explanation: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BiasReport:
     """Comprehensive bias analysis report"""
     report_id: str
@@ -106,7 +190,7 @@ class BiasReport:
     confidence_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BiasAlert:
     """Alert for detected bias requiring attention"""
     alert_id: str
@@ -158,6 +242,115 @@ BIAS_THRESHOLDS = {
 }
 
 
+# Severity levels in increasing order, indexed by the number of thresholds crossed
+SEVERITY_LEVELS = (
+    BiasSeverity.NONE,
+    BiasSeverity.LOW,
+    BiasSeverity.MODERATE,
+    BiasSeverity.HIGH,
+    BiasSeverity.CRITICAL,
+)
+
+SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITY_LEVELS)}
+
+# Ascending threshold tuples per metric, for bisecting a value into a severity
+SEVERITY_THRESHOLDS = {
+    metric: tuple(sorted(t[level] for level in ("low", "moderate", "high", "critical")))
+    for metric, t in BIAS_THRESHOLDS.items()
+}
+
+# Display names for protected attributes used in explanations
+ATTRIBUTE_NAMES = {
+    attr: attr.value.replace("_", " ") for attr in ProtectedAttribute
+}
+
+# Explanation templates per metric, filled by _generate_explanation
+EXPLANATION_TEMPLATES = {
+    FairnessMetric.STATISTICAL_PARITY: (
+        "High-risk prediction rates differ by {diff_pct:.1f}% between {attr} groups. "
+        "The {higher} group has a higher rate of high-risk classifications. "
+        "Severity: {severity}."
+    ),
+    FairnessMetric.DISPARATE_IMPACT: (
+        "Disparate impact ratio is {ratio:.2f} for {attr}. "
+        "A ratio below 0.80 may indicate bias. "
+        "Severity: {severity}."
+    ),
+    FairnessMetric.FALSE_POSITIVE_RATE: (
+        "False positive rates differ by {diff_pct:.1f}% between {attr} groups. "
+        "This means one group may be incorrectly flagged as high-risk more often. "
+        "Severity: {severity}."
+    ),
+    FairnessMetric.FALSE_NEGATIVE_RATE: (
+        "False negative rates differ by {diff_pct:.1f}% between {attr} groups. "
+        "The {higher} group may have at-risk students missed more often. "
+        "Severity: {severity}."
+    ),
+}
+DEFAULT_EXPLANATION_TEMPLATE = "Fairness metric {metric} analyzed for {attr}. Severity: {severity}."
+
+
+# Recommended alert actions, composed by _get_alert_actions
+CRITICAL_ALERT_ACTIONS = (
+    "Immediately notify equity committee and data science team",
+    "Consider temporarily adjusting predictions for affected group",
+)
+ALERT_ACTIONS_BY_METRIC = {
+    FairnessMetric.FALSE_NEGATIVE_RATE: (
+        "Review at-risk students in affected group manually",
+        "Ensure no students are missing needed support",
+    ),
+    FairnessMetric.FALSE_POSITIVE_RATE: (
+        "Review high-risk classifications in affected group",
+        "Ensure students aren't being over-identified unfairly",
+    ),
+    FairnessMetric.STATISTICAL_PARITY: (
+        "Analyze feature contributions for this demographic group",
+        "Consider retraining with bias mitigation techniques",
+    ),
+}
+COMMON_ALERT_ACTIONS = ("Document findings and remediation steps",)
+
+# Leading byte of stored full reports; legacy JSON reports start with "{"
+REPORT_BLOB_VERSION = b"\x01"
+
+# Move an alert to the resolved list: KEYS[1] source list, KEYS[2] resolved
+# list, ARGV[1] stored alert, ARGV[2] resolved alert, ARGV[3] resolved list
+# size. Pushes only if this call removed the alert, so concurrent resolves
+# of the same alert leave a single resolved record.
+RESOLVE_ALERT_SCRIPT = """
+if redis.call('LREM', KEYS[1], 1, ARGV[1]) == 0 then
+    return 0
+end
+redis.call('LPUSH', KEYS[2], ARGV[2])
+redis.call('LTRIM', KEYS[2], 0, tonumber(ARGV[3]) - 1)
+return 1
+"""
+
+
+def intern_group_name(name: Any) -> Any:
+    """
+    Intern string group names.
+    
+    Group names repeat across every result of every report, so interning
+    lets all results share one string object per group. Non-string
+    demographic values (e.g. grade levels) are returned unchanged.
+    """
+    return sys.intern(name) if isinstance(name, str) else name
+
+
+def _encode_report_value(obj: Any) -> Any:
+    """msgspec ``enc_hook`` for NumPy scalars left in report fields."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot serialize {type(obj).__name__} in bias report")
+
+
+# msgspec walks the result dataclasses, enums and datetimes in C
+_REPORT_ENCODER = msgspec.msgpack.Encoder(enc_hook=_encode_report_value)
+_REPORT_DECODER = msgspec.msgpack.Decoder()
+
+
 class BiasDetectionService:
     """
     Service for detecting and monitoring bias in ML predictions.
@@ -171,6 +364,10 @@ class BiasDetectionService:
     
     MINIMUM_GROUP_SIZE = 30  # Minimum samples for statistical validity
     SIGNIFICANCE_LEVEL = 0.05  # p-value threshold for statistical significance
+    REPORT_CACHE_TTL_SECONDS = 3600  # Reuse reports for an unchanged prediction set
+    REPORT_RETENTION_SECONDS = 86400 * 90  # Keep stored reports for 90 days
+    MAX_STORED_ALERTS = 100  # Alerts kept per tenant
+    MAX_PENDING_ALERTS = 51  # Alerts returned by get_pending_alerts
     
     def __init__(
         self,
@@ -179,6 +376,10 @@ class BiasDetectionService:
     ):
         self.redis = redis_client
         self.db = database
+        self._resolve_alert_script = (
+            redis_client.register_script(RESOLVE_ALERT_SCRIPT)
+            if redis_client else None
+        )
     
     async def analyze_bias(
         self,
@@ -206,14 +407,55 @@ class BiasDetectionService:
         now = datetime.utcnow()
         report_id = f"bias_{tenant_id}_{now.strftime('%Y%m%d_%H%M%S')}"
         
-        # Group predictions by protected attributes
-        grouped_data = self._group_by_demographics(predictions)
+        # Two valid groups are needed for any comparison; below that, skip
+        # the analysis and don't store an uninformative report
+        if len(predictions) < self.MINIMUM_GROUP_SIZE * 2:
+            return BiasReport(
+                report_id=report_id,
+                generated_at=now,
+                tenant_id=tenant_id,
+                model_version=model_version,
+                analysis_period_start=now - timedelta(days=analysis_period_days),
+                analysis_period_end=now,
+                total_predictions=len(predictions),
+                demographic_coverage=self._calculate_demographic_coverage(predictions),
+                fairness_results=[],
+                group_statistics={},
+                overall_bias_severity=BiasSeverity.NONE,
+                recommendations=["Insufficient sample size for bias analysis."],
+                requires_review=False,
+                confidence_score=0.0
+            )
         
         # Build outcome lookup if available
         outcome_map = {}
         if outcomes:
             outcome_map = {o["student_id"]: o["actual_outcome"] for o in outcomes}
         
+        # Extract columns once and group row indices by protected attributes
+        arrays = self._build_prediction_arrays(predictions, outcome_map)
+        grouped_data = self._group_by_demographics(predictions)
+        
+        # Serve a cached report if this exact prediction set was analyzed recently
+        fingerprint = self._report_fingerprint(
+            tenant_id, model_version, analysis_period_days,
+            arrays, grouped_data, bool(outcome_map)
+        )
+        cached = await self._get_cached_report(fingerprint)
+        if cached is not None:
+            # The metrics are reusable, but this is a new analysis run: record
+            # it in the history, without extending the cache entry's lifetime
+            # or re-raising the alerts already created for these findings
+            report = replace(
+                cached,
+                report_id=report_id,
+                generated_at=now,
+                analysis_period_start=now - timedelta(days=analysis_period_days),
+                analysis_period_end=now,
+            )
+            await self._store_report(report)
+            return report
+        
         # Calculate fairness metrics for each protected attribute
         all_results: list[FairnessResult] = []
         all_group_stats: dict[str, list[GroupStatistics]] = {}
@@ -234,30 +476,23 @@ class BiasDetectionService:
                 continue
             
             # Calculate group statistics
-            group_stats = self._calculate_group_statistics(
-                valid_groups, outcome_map
+            batch = self._calculate_group_statistics(
+                valid_groups, arrays
             )
+            group_stats = batch.to_group_statistics()
             all_group_stats[attribute.value] = group_stats
             
             # Select reference group (largest group)
-            reference_group = max(valid_groups.keys(), key=lambda k: len(valid_groups[k]))
-            reference_stats = next(g for g in group_stats if g.group_name == reference_group)
+            reference = int(np.argmax(batch.sample_size))
+            reference_stats = group_stats[reference]
             
-            # Compare each group to reference
-            for stats in group_stats:
-                if stats.group_name == reference_group:
-                    continue
-                
-                # Statistical parity
-                sp_result = self._evaluate_statistical_parity(
-                    attribute, reference_stats, stats
-                )
+            # Compare each group to reference: statistical parity and
+            # disparate impact are evaluated for all groups in one batch
+            comparisons = [g for i, g in enumerate(group_stats) if i != reference]
+            parity_results = self._evaluate_rate_parity(attribute, batch, reference)
+            
+            for stats, (sp_result, di_result) in zip(comparisons, parity_results):
                 all_results.append(sp_result)
-                
-                # Disparate impact
-                di_result = self._evaluate_disparate_impact(
-                    attribute, reference_stats, stats
-                )
                 all_results.append(di_result)
                 
                 # If we have outcomes, evaluate equalized odds
@@ -268,13 +503,16 @@ class BiasDetectionService:
                     all_results.extend(eo_results)
         
         # Calculate demographic coverage
-        coverage = self._calculate_demographic_coverage(predictions)
+        coverage = self._calculate_demographic_coverage(predictions, grouped_data)
+        
+        # Significant findings drive severity, recommendations and alerts
+        significant = [r for r in all_results if r.is_significant]
         
         # Determine overall severity
-        overall_severity = self._determine_overall_severity(all_results)
+        overall_severity = self._determine_overall_severity(all_results, significant)
         
         # Generate recommendations
-        recommendations = self._generate_recommendations(all_results)
+        recommendations = self._generate_recommendations(all_results, significant)
         
         # Determine if review is required
         requires_review = overall_severity in [BiasSeverity.HIGH, BiasSeverity.CRITICAL]
@@ -300,93 +538,156 @@ class BiasDetectionService:
         )
         
         # Store report
-        await self._store_report(report)
+        await self._store_report(report, fingerprint)
         
         # Create alerts for significant biases
         if requires_review:
-            await self._create_alerts(report, all_results)
+            await self._create_alerts(report, significant)
         
         return report
     
+    def _build_prediction_arrays(
+        self,
+        predictions: list[dict],
+        outcome_map: Optional[dict[str, bool]] = None
+    ) -> PredictionArrays:
+        """
+        Extract per-prediction columns into aligned NumPy arrays.
+        
+        Outcomes are joined onto the prediction rows once, by binary search
+        over the sorted outcome ids, so group statistics only need to gather.
+        """
+        n = len(predictions)
+        student_ids = np.empty(n, dtype=object)
+        student_ids[:] = [p["student_id"] for p in predictions]
+        has_outcome = np.zeros(n, dtype=bool)
+        actuals = np.zeros(n, dtype=bool)
+        
+        if outcome_map and n:
+            outcome_sids = np.empty(len(outcome_map), dtype=object)
+            outcome_sids[:] = list(outcome_map)
+            outcome_vals = np.fromiter(
+                (bool(v) for v in outcome_map.values()), dtype=bool, count=len(outcome_map)
+            )
+            order = np.argsort(outcome_sids)
+            sorted_sids = outcome_sids[order]
+            pos = np.searchsorted(sorted_sids, student_ids).clip(max=len(sorted_sids) - 1)
+            has_outcome = sorted_sids[pos] == student_ids
+            actuals = has_outcome & outcome_vals[order][pos]
+        
+        scores = np.fromiter(
+            (p["risk_score"] for p in predictions), dtype=np.float64, count=n
+        )
+        
+        return PredictionArrays(
+            student_ids=student_ids,
+            scores=scores,
+            predicted_positive=scores >= 0.5,
+            has_outcome=has_outcome,
+            actuals=actuals,
+        )
+    
     def _group_by_demographics(
         self,
         predictions: list[dict]
-    ) -> dict[str, dict[str, list[dict]]]:
-        """Group predictions by each protected attribute"""
-        grouped = {attr.value: defaultdict(list) for attr in ProtectedAttribute}
+    ) -> dict[str, dict[Any, np.ndarray]]:
+        """
+        Group prediction row indices by each protected attribute.
         
-        for pred in predictions:
-            demographics = pred.get("demographics", {})
+        Each attribute column is factorized into integer codes, then a single
+        stable argsort splits the row indices into one array per group.
+        Groups keep first-seen order; rows without the attribute are skipped.
+        """
+        n = len(predictions)
+        demographics = [p.get("demographics") or {} for p in predictions]
+        grouped: dict[str, dict[Any, np.ndarray]] = {}
+        
+        for attr in ProtectedAttribute:
+            group_codes: dict[Any, int] = {}
+            codes = np.fromiter(
+                (
+                    -1 if (value := demo.get(attr.value)) is None
+                    else group_codes.setdefault(value, len(group_codes))
+                    for demo in demographics
+                ),
+                dtype=np.int64,
+                count=n,
+            )
             
-            for attr in ProtectedAttribute:
-                value = demographics.get(attr.value)
-                if value is not None:
-                    grouped[attr.value][value].append(pred)
+            present = np.flatnonzero(codes >= 0)
+            rows = present[np.argsort(codes[present], kind="stable")]
+            sizes = np.bincount(codes[present], minlength=len(group_codes))
+            grouped[attr.value] = dict(
+                zip(map(intern_group_name, group_codes), np.split(rows, np.cumsum(sizes)[:-1]))
+            )
         
         return grouped
     
     def _calculate_group_statistics(
         self,
-        groups: dict[str, list[dict]],
-        outcome_map: dict[str, bool]
-    ) -> list[GroupStatistics]:
-        """Calculate statistics for each demographic group"""
-        stats_list = []
-        
-        for group_name, predictions in groups.items():
-            scores = [p["risk_score"] for p in predictions]
-            
-            # Basic statistics
-            mean_pred = np.mean(scores)
-            std_pred = np.std(scores)
-            positive_rate = sum(1 for s in scores if s >= 0.5) / len(scores)
-            
-            # Outcome-based statistics if available
-            tpr = fpr = fnr = cal_error = None
-            
-            if outcome_map:
-                student_ids = [p["student_id"] for p in predictions]
-                matched = [
-                    (p["risk_score"], outcome_map[p["student_id"]])
-                    for p in predictions
-                    if p["student_id"] in outcome_map
-                ]
-                
-                if matched:
-                    pred_scores, actuals = zip(*matched)
-                    pred_binary = [s >= 0.5 for s in pred_scores]
-                    
-                    # True positive rate (sensitivity)
-                    actual_positives = [a for a in actuals if a]
-                    if actual_positives:
-                        tpr = sum(1 for p, a in matched if p >= 0.5 and a) / len(actual_positives)
-                    
-                    # False positive rate
-                    actual_negatives = [a for a in actuals if not a]
-                    if actual_negatives:
-                        fpr = sum(1 for p, a in matched if p >= 0.5 and not a) / len(actual_negatives)
-                    
-                    # False negative rate
-                    if actual_positives:
-                        fnr = sum(1 for p, a in matched if p < 0.5 and a) / len(actual_positives)
-                    
-                    # Calibration error (average difference between predicted and actual)
-                    if len(matched) >= 10:
-                        cal_error = abs(np.mean(pred_scores) - np.mean(actuals))
-            
-            stats_list.append(GroupStatistics(
-                group_name=group_name,
-                sample_size=len(predictions),
-                mean_prediction=mean_pred,
-                std_prediction=std_pred,
-                positive_rate=positive_rate,
-                true_positive_rate=tpr,
-                false_positive_rate=fpr,
-                false_negative_rate=fnr,
-                calibration_error=cal_error
-            ))
+        groups: dict[str, np.ndarray],
+        arrays: PredictionArrays
+    ) -> GroupStatsBatch:
+        """
+        Calculate statistics for each demographic group.
         
-        return stats_list
+        All groups are reduced together: rows are labelled with their group
+        id and every count and sum is a single weighted bincount, so the
+        number of array passes does not grow with the number of groups.
+        """
+        if not groups:
+            return GroupStatsBatch.from_group_statistics([])
+        
+        sizes = np.fromiter((len(idx) for idx in groups.values()), dtype=np.int64, count=len(groups))
+        rows = np.concatenate(list(groups.values()))
+        group_ids = np.repeat(np.arange(len(groups)), sizes)
+        n_groups = len(groups)
+        
+        def group_sum(weights: np.ndarray) -> np.ndarray:
+            return np.bincount(group_ids, weights=weights, minlength=n_groups)
+        
+        scores = arrays.scores[rows]
+        predicted = arrays.predicted_positive[rows]
+        matched = arrays.has_outcome[rows]
+        actuals = arrays.actuals[rows]
+        
+        # Basic statistics; variance from the sum of squares in the same
+        # pass as the mean (scores are bounded, so cancellation is benign)
+        means = group_sum(scores) / sizes
+        mean_squares = group_sum(scores * scores) / sizes
+        stds = np.sqrt(np.maximum(mean_squares - means * means, 0.0))
+        positive_rates = group_sum(predicted) / sizes
+        
+        # Outcome-based counts; actuals is False wherever there is no outcome
+        n_matched = group_sum(matched)
+        positives = group_sum(actuals)
+        negatives = n_matched - positives
+        true_pos = group_sum(predicted & actuals)
+        false_pos = group_sum(predicted & matched & ~actuals)
+        matched_score_sums = group_sum(np.where(matched, scores, 0.0))
+        
+        def rate(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+            return np.divide(
+                numerator, denominator,
+                out=np.full(n_groups, np.nan), where=denominator > 0
+            )
+        
+        # Calibration error (average difference between predicted and actual)
+        calibration_error = np.abs(rate(matched_score_sums, n_matched) - rate(positives, n_matched))
+        calibration_error[n_matched < 10] = np.nan
+        
+        return GroupStatsBatch(
+            group_names=list(groups),
+            sample_size=sizes,
+            mean_prediction=means,
+            std_prediction=stds,
+            positive_rate=positive_rates,
+            # True positive rate (sensitivity) and false negative rate
+            true_positive_rate=rate(true_pos, positives),
+            false_positive_rate=rate(false_pos, negatives),
+            false_negative_rate=rate(positives - true_pos, positives),
+            calibration_error=calibration_error,
+        )
     
     def _evaluate_statistical_parity(
         self,
@@ -400,46 +701,8 @@ class BiasDetectionService:
         Statistical parity requires that the probability of a positive prediction
         is the same across all demographic groups.
         """
-        diff = abs(reference.positive_rate - comparison.positive_rate)
-        
-        # Perform two-proportion z-test
-        n1, n2 = reference.sample_size, comparison.sample_size
-        p1, p2 = reference.positive_rate, comparison.positive_rate
-        p_pool = (p1 * n1 + p2 * n2) / (n1 + n2)
-        
-        se = math.sqrt(p_pool * (1 - p_pool) * (1/n1 + 1/n2))
-        z_stat = (p1 - p2) / se if se > 0 else 0
-        p_value = 2 * (1 - stats.norm.cdf(abs(z_stat)))
-        
-        # Determine severity
-        severity = self._get_severity(FairnessMetric.STATISTICAL_PARITY, diff)
-        
-        is_significant = p_value < self.SIGNIFICANCE_LEVEL and severity != BiasSeverity.NONE
-        
-        explanation = self._generate_explanation(
-            FairnessMetric.STATISTICAL_PARITY,
-            attribute,
-            reference.group_name,
-            comparison.group_name,
-            reference.positive_rate,
-            comparison.positive_rate,
-            severity
-        )
-        
-        return FairnessResult(
-            metric=FairnessMetric.STATISTICAL_PARITY,
-            attribute=attribute,
-            reference_group=reference.group_name,
-            comparison_group=comparison.group_name,
-            reference_value=reference.positive_rate,
-            comparison_value=comparison.positive_rate,
-            difference=diff,
-            ratio=comparison.positive_rate / reference.positive_rate if reference.positive_rate > 0 else None,
-            p_value=p_value,
-            is_significant=is_significant,
-            severity=severity,
-            explanation=explanation
-        )
+        batch = GroupStatsBatch.from_group_statistics([reference, comparison])
+        return self._evaluate_rate_parity(attribute, batch, 0)[0][0]
     
     def _evaluate_disparate_impact(
         self,
@@ -453,42 +716,121 @@ class BiasDetectionService:
         The 80% rule: the selection rate for any protected group should be
         at least 80% of the rate for the group with the highest rate.
         """
-        # For risk predictions, we want to check if high-risk classifications
-        # are distributed fairly (not disproportionately affecting certain groups)
+        batch = GroupStatsBatch.from_group_statistics([reference, comparison])
+        return self._evaluate_rate_parity(attribute, batch, 0)[0][1]
+    
+    def _evaluate_rate_parity(
+        self,
+        attribute: ProtectedAttribute,
+        batch: GroupStatsBatch,
+        reference: int
+    ) -> list[tuple[FairnessResult, FairnessResult]]:
+        """
+        Evaluate statistical parity and disparate impact for every group in
+        the batch against the group at index `reference`.
         
-        ratio = None
-        if reference.positive_rate > 0:
-            ratio = comparison.positive_rate / reference.positive_rate
+        The two-proportion z-test and the rate ratios are computed as array
+        operations; the loop only packages results. Returns one
+        (statistical_parity, disparate_impact) pair per comparison group,
+        in batch order.
+        """
+        is_comparison = np.arange(len(batch)) != reference
+        reference_group = batch.group_names[reference]
+        comparison_groups = [
+            name for i, name in enumerate(batch.group_names) if i != reference
+        ]
         
-        # Invert if comparison group has higher rate
-        normalized_ratio = min(ratio, 1/ratio) if ratio and ratio > 0 else 0
+        p1 = float(batch.positive_rate[reference])
+        n1 = int(batch.sample_size[reference])
+        p2 = batch.positive_rate[is_comparison]
+        n2 = batch.sample_size[is_comparison].astype(np.float64)
         
-        severity = self._get_severity_di(normalized_ratio)
+        diffs = np.abs(p1 - p2)
         
-        explanation = self._generate_explanation(
-            FairnessMetric.DISPARATE_IMPACT,
-            attribute,
-            reference.group_name,
-            comparison.group_name,
-            reference.positive_rate,
-            comparison.positive_rate,
-            severity
-        )
+        # Two-proportion z-test
+        p_pool = (p1 * n1 + p2 * n2) / (n1 + n2)
+        se = np.sqrt(p_pool * (1 - p_pool) * (1/n1 + 1/n2))
+        z_stats = np.divide(p1 - p2, se, out=np.zeros_like(se), where=se > 0)
+        
+        # For risk predictions, we want to check if high-risk classifications
+        # are distributed fairly (not disproportionately affecting certain groups).
+        # Invert the ratio if the comparison group has the higher rate.
+        ratios = p2 / p1 if p1 > 0 else None
+        normalized = np.zeros_like(p2)
+        if ratios is not None:
+            normalized = np.minimum(
+                ratios, np.divide(1, ratios, out=np.full_like(ratios, np.inf), where=ratios > 0)
+            )
+            normalized[ratios <= 0] = 0
         
-        return FairnessResult(
-            metric=FairnessMetric.DISPARATE_IMPACT,
-            attribute=attribute,
-            reference_group=reference.group_name,
-            comparison_group=comparison.group_name,
-            reference_value=reference.positive_rate,
-            comparison_value=comparison.positive_rate,
-            difference=abs(reference.positive_rate - comparison.positive_rate),
-            ratio=ratio,
-            p_value=None,
-            is_significant=severity != BiasSeverity.NONE,
-            severity=severity,
-            explanation=explanation
+        # Severity buckets for all groups in one search per metric
+        sp_levels = np.searchsorted(
+            SEVERITY_THRESHOLDS[FairnessMetric.STATISTICAL_PARITY], diffs, side="right"
         )
+        di_thresholds = SEVERITY_THRESHOLDS[FairnessMetric.DISPARATE_IMPACT]
+        di_levels = len(di_thresholds) - np.searchsorted(di_thresholds, normalized, side="left")
+        
+        results = []
+        for i, comparison_group in enumerate(comparison_groups):
+            comparison_rate = float(p2[i])
+            diff = float(diffs[i])
+            ratio = float(ratios[i]) if ratios is not None else None
+            p_value = math.erfc(abs(z_stats[i]) / math.sqrt(2))  # two-sided normal tail
+            
+            sp_severity = SEVERITY_LEVELS[sp_levels[i]]
+            di_severity = SEVERITY_LEVELS[di_levels[i]]
+            
+            sp_result = FairnessResult(
+                metric=FairnessMetric.STATISTICAL_PARITY,
+                attribute=attribute,
+                reference_group=reference_group,
+                comparison_group=comparison_group,
+                reference_value=p1,
+                comparison_value=comparison_rate,
+                difference=diff,
+                ratio=ratio,
+                p_value=p_value,
+                is_significant=p_value < self.SIGNIFICANCE_LEVEL and sp_severity != BiasSeverity.NONE,
+                severity=sp_severity,
+                explanation=self._generate_explanation(
+                    FairnessMetric.STATISTICAL_PARITY,
+                    attribute,
+                    reference_group,
+                    comparison_group,
+                    p1,
+                    comparison_rate,
+                    sp_severity,
+                    diff
+                )
+            )
+            
+            di_result = FairnessResult(
+                metric=FairnessMetric.DISPARATE_IMPACT,
+                attribute=attribute,
+                reference_group=reference_group,
+                comparison_group=comparison_group,
+                reference_value=p1,
+                comparison_value=comparison_rate,
+                difference=diff,
+                ratio=ratio,
+                p_value=None,
+                is_significant=di_severity != BiasSeverity.NONE,
+                severity=di_severity,
+                explanation=self._generate_explanation(
+                    FairnessMetric.DISPARATE_IMPACT,
+                    attribute,
+                    reference_group,
+                    comparison_group,
+                    p1,
+                    comparison_rate,
+                    di_severity,
+                    diff
+                )
+            )
+            
+            results.append((sp_result, di_result))
+        
+        return results
     
     def _evaluate_equalized_odds(
         self,
@@ -527,7 +869,8 @@ class BiasDetectionService:
                     comparison.group_name,
                     reference.false_positive_rate,
                     comparison.false_positive_rate,
-                    severity
+                    severity,
+                    fpr_diff
                 )
             ))
         
@@ -555,7 +898,8 @@ class BiasDetectionService:
                     comparison.group_name,
                     reference.false_negative_rate,
                     comparison.false_negative_rate,
-                    severity
+                    severity,
+                    fnr_diff
                 )
             ))
         
@@ -563,31 +907,15 @@ class BiasDetectionService:
     
     def _get_severity(self, metric: FairnessMetric, difference: float) -> BiasSeverity:
         """Determine severity based on difference and metric thresholds"""
-        thresholds = BIAS_THRESHOLDS.get(metric, {})
-        
-        if difference >= thresholds.get("critical", float("inf")):
-            return BiasSeverity.CRITICAL
-        elif difference >= thresholds.get("high", float("inf")):
-            return BiasSeverity.HIGH
-        elif difference >= thresholds.get("moderate", float("inf")):
-            return BiasSeverity.MODERATE
-        elif difference >= thresholds.get("low", float("inf")):
-            return BiasSeverity.LOW
-        return BiasSeverity.NONE
+        thresholds = SEVERITY_THRESHOLDS.get(metric)
+        if thresholds is None:
+            return BiasSeverity.NONE
+        return SEVERITY_LEVELS[bisect_right(thresholds, difference)]
     
     def _get_severity_di(self, ratio: float) -> BiasSeverity:
         """Determine severity for disparate impact ratio (lower is worse)"""
-        thresholds = BIAS_THRESHOLDS[FairnessMetric.DISPARATE_IMPACT]
-        
-        if ratio <= thresholds["critical"]:
-            return BiasSeverity.CRITICAL
-        elif ratio <= thresholds["high"]:
-            return BiasSeverity.HIGH
-        elif ratio <= thresholds["moderate"]:
-            return BiasSeverity.MODERATE
-        elif ratio <= thresholds["low"]:
-            return BiasSeverity.LOW
-        return BiasSeverity.NONE
+        thresholds = SEVERITY_THRESHOLDS[FairnessMetric.DISPARATE_IMPACT]
+        return SEVERITY_LEVELS[len(thresholds) - bisect_left(thresholds, ratio)]
     
     def _generate_explanation(
         self,
@@ -597,101 +925,92 @@ class BiasDetectionService:
         comparison_group: str,
         reference_value: float,
         comparison_value: float,
-        severity: BiasSeverity
+        severity: BiasSeverity,
+        difference: Optional[float] = None
     ) -> str:
-        """Generate human-readable explanation of fairness result"""
-        attr_name = attribute.value.replace("_", " ")
-        
-        if metric == FairnessMetric.STATISTICAL_PARITY:
-            diff_pct = abs(reference_value - comparison_value) * 100
-            higher_group = reference_group if reference_value > comparison_value else comparison_group
-            return (
-                f"High-risk prediction rates differ by {diff_pct:.1f}% between {attr_name} groups. "
-                f"The {higher_group} group has a higher rate of high-risk classifications. "
-                f"Severity: {severity.value}."
-            )
-        
-        elif metric == FairnessMetric.DISPARATE_IMPACT:
-            if reference_value > 0:
-                ratio = comparison_value / reference_value
-                return (
-                    f"Disparate impact ratio is {ratio:.2f} for {attr_name}. "
-                    f"A ratio below 0.80 may indicate bias. "
-                    f"Severity: {severity.value}."
-                )
-            return f"Cannot calculate disparate impact - reference group rate is zero."
-        
-        elif metric == FairnessMetric.FALSE_POSITIVE_RATE:
-            diff_pct = abs(reference_value - comparison_value) * 100
-            return (
-                f"False positive rates differ by {diff_pct:.1f}% between {attr_name} groups. "
-                f"This means one group may be incorrectly flagged as high-risk more often. "
-                f"Severity: {severity.value}."
-            )
-        
-        elif metric == FairnessMetric.FALSE_NEGATIVE_RATE:
-            diff_pct = abs(reference_value - comparison_value) * 100
-            higher_group = reference_group if reference_value > comparison_value else comparison_group
-            return (
-                f"False negative rates differ by {diff_pct:.1f}% between {attr_name} groups. "
-                f"The {higher_group} group may have at-risk students missed more often. "
-                f"Severity: {severity.value}."
-            )
+        """
+        Generate human-readable explanation of fairness result.
         
-        return f"Fairness metric {metric.value} analyzed for {attr_name}. Severity: {severity.value}."
+        Callers that already hold the absolute difference pass it in as
+        `difference` to avoid recomputing it.
+        """
+        if metric == FairnessMetric.DISPARATE_IMPACT and reference_value <= 0:
+            return "Cannot calculate disparate impact - reference group rate is zero."
+        
+        if difference is None:
+            difference = abs(reference_value - comparison_value)
+        
+        return EXPLANATION_TEMPLATES.get(metric, DEFAULT_EXPLANATION_TEMPLATE).format(
+            attr=ATTRIBUTE_NAMES[attribute],
+            diff_pct=difference * 100,
+            higher=reference_group if reference_value > comparison_value else comparison_group,
+            ratio=comparison_value / reference_value if reference_value > 0 else 0.0,
+            severity=severity.value,
+            metric=metric.value,
+        )
     
     def _calculate_demographic_coverage(
         self,
-        predictions: list[dict]
+        predictions: list[dict],
+        grouped_data: Optional[dict[str, dict[Any, np.ndarray]]] = None
     ) -> dict[str, int]:
-        """Calculate how many predictions have each demographic attribute"""
-        coverage = {}
+        """
+        Calculate how many predictions have each demographic attribute.
         
-        for attr in ProtectedAttribute:
-            count = sum(
-                1 for p in predictions
-                if p.get("demographics", {}).get(attr.value) is not None
-            )
-            coverage[attr.value] = count
+        With `grouped_data` from _group_by_demographics the counts are the
+        group sizes; otherwise predictions are scanned once.
+        """
+        if grouped_data is not None:
+            return {
+                attr.value: sum(len(idx) for idx in grouped_data[attr.value].values())
+                for attr in ProtectedAttribute
+            }
+        
+        coverage = {attr.value: 0 for attr in ProtectedAttribute}
+        
+        for p in predictions:
+            demographics = p.get("demographics") or {}
+            for attr_name in coverage:
+                if demographics.get(attr_name) is not None:
+                    coverage[attr_name] += 1
         
         return coverage
     
     def _determine_overall_severity(
         self,
-        results: list[FairnessResult]
+        results: list[FairnessResult],
+        significant: Optional[list[FairnessResult]] = None
     ) -> BiasSeverity:
-        """Determine overall bias severity from individual results"""
-        if not results:
-            return BiasSeverity.NONE
-        
-        severities = [r.severity for r in results if r.is_significant]
+        """
+        Determine overall bias severity from individual results.
         
-        if not severities:
-            return BiasSeverity.NONE
+        `significant` may carry the already-filtered significant results.
+        """
+        if significant is None:
+            significant = [r for r in results if r.is_significant]
         
         # Return the highest severity found
-        severity_order = [
-            BiasSeverity.CRITICAL,
-            BiasSeverity.HIGH,
-            BiasSeverity.MODERATE,
-            BiasSeverity.LOW
-        ]
-        
-        for sev in severity_order:
-            if sev in severities:
-                return sev
-        
-        return BiasSeverity.NONE
+        return max(
+            (r.severity for r in significant),
+            key=SEVERITY_RANK.__getitem__,
+            default=BiasSeverity.NONE
+        )
     
     def _generate_recommendations(
         self,
-        results: list[FairnessResult]
+        results: list[FairnessResult],
+        significant: Optional[list[FairnessResult]] = None
     ) -> list[str]:
-        """Generate actionable recommendations based on fairness results"""
+        """
+        Generate actionable recommendations based on fairness results.
+        
+        `significant` may carry the already-filtered significant results.
+        """
         recommendations = []
         
         # Group significant results by attribute
-        significant = [r for r in results if r.is_significant]
+        if significant is None:
+            significant = [r for r in results if r.is_significant]
         
         if not significant:
             recommendations.append(
@@ -766,8 +1085,17 @@ class BiasDetectionService:
         
         return 0.4 * size_factor + 0.6 * avg_coverage
     
-    async def _store_report(self, report: BiasReport) -> None:
-        """Store bias report for historical tracking"""
+    async def _store_report(
+        self,
+        report: BiasReport,
+        fingerprint: Optional[str] = None
+    ) -> None:
+        """
+        Store bias report for historical tracking.
+        
+        The summary, the full report and (given a fingerprint) the report
+        cache entry are written in one pipelined round trip.
+        """
         if not self.redis:
             return
         
@@ -776,72 +1104,144 @@ class BiasDetectionService:
         # Serialize report (simplified for storage)
         report_data = {
             "report_id": report.report_id,
-            "generated_at": report.generated_at.isoformat(),
+            "generated_at": report.generated_at,
             "model_version": report.model_version,
             "total_predictions": report.total_predictions,
-            "overall_severity": report.overall_bias_severity.value,
+            "overall_severity": report.overall_bias_severity,
             "requires_review": report.requires_review,
             "significant_findings": len([r for r in report.fairness_results if r.is_significant]),
             "confidence": report.confidence_score
         }
         
-        await self.redis.lpush(key, json.dumps(report_data))
-        await self.redis.ltrim(key, 0, 99)  # Keep last 100 reports
+        full_report = self._serialize_full_report(report)
         
-        # Store full report separately
-        full_key = f"bias_report_full:{report.report_id}"
-        await self.redis.setex(
-            full_key,
-            86400 * 90,  # Keep for 90 days
-            self._serialize_full_report(report)
-        )
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.lpush(key, orjson.dumps(report_data, option=orjson.OPT_SERIALIZE_NUMPY))
+            pipe.ltrim(key, 0, 99)  # Keep last 100 reports
+            pipe.expire(key, self.REPORT_RETENTION_SECONDS)  # Drop history of idle tenants
+            
+            # Store full report separately
+            pipe.setex(
+                f"bias_report_full:{report.report_id}",
+                self.REPORT_RETENTION_SECONDS,
+                full_report
+            )
+            
+            if fingerprint is not None:
+                pipe.setex(
+                    f"bias_report_cache:{fingerprint}",
+                    self.REPORT_CACHE_TTL_SECONDS,
+                    full_report
+                )
+            
+            await pipe.execute()
     
-    def _serialize_full_report(self, report: BiasReport) -> str:
-        """Serialize full report to JSON"""
-        return json.dumps({
+    def _serialize_full_report(self, report: BiasReport) -> bytes:
+        """Serialize full report to a versioned MessagePack blob"""
+        return REPORT_BLOB_VERSION + _REPORT_ENCODER.encode({
             "report_id": report.report_id,
-            "generated_at": report.generated_at.isoformat(),
+            "generated_at": report.generated_at,
             "tenant_id": report.tenant_id,
             "model_version": report.model_version,
-            "analysis_period_start": report.analysis_period_start.isoformat(),
-            "analysis_period_end": report.analysis_period_end.isoformat(),
+            "analysis_period_start": report.analysis_period_start,
+            "analysis_period_end": report.analysis_period_end,
             "total_predictions": report.total_predictions,
             "demographic_coverage": report.demographic_coverage,
-            "fairness_results": [
-                {
-                    "metric": r.metric.value,
-                    "attribute": r.attribute.value,
-                    "reference_group": r.reference_group,
-                    "comparison_group": r.comparison_group,
-                    "reference_value": r.reference_value,
-                    "comparison_value": r.comparison_value,
-                    "difference": r.difference,
-                    "ratio": r.ratio,
-                    "p_value": r.p_value,
-                    "is_significant": r.is_significant,
-                    "severity": r.severity.value,
-                    "explanation": r.explanation
-                }
-                for r in report.fairness_results
+            "fairness_results": report.fairness_results,
+            "group_statistics": report.group_statistics,
+            "overall_severity": report.overall_bias_severity,
+            "recommendations": report.recommendations,
+            "requires_review": report.requires_review,
+            "confidence_score": report.confidence_score
+        })
+    
+    def _deserialize_full_report(self, data: bytes) -> BiasReport:
+        """Rebuild a BiasReport from its _serialize_full_report blob"""
+        if data[:1] == REPORT_BLOB_VERSION:
+            raw = _REPORT_DECODER.decode(data[1:])
+        else:
+            # Reports written before the MessagePack switch are plain JSON
+            raw = orjson.loads(data)
+        return BiasReport(
+            report_id=raw["report_id"],
+            generated_at=datetime.fromisoformat(raw["generated_at"]),
+            tenant_id=raw["tenant_id"],
+            model_version=raw["model_version"],
+            analysis_period_start=datetime.fromisoformat(raw["analysis_period_start"]),
+            analysis_period_end=datetime.fromisoformat(raw["analysis_period_end"]),
+            total_predictions=raw["total_predictions"],
+            demographic_coverage=raw["demographic_coverage"],
+            fairness_results=[
+                FairnessResult(
+                    metric=FairnessMetric(r["metric"]),
+                    attribute=ProtectedAttribute(r["attribute"]),
+                    reference_group=intern_group_name(r["reference_group"]),
+                    comparison_group=intern_group_name(r["comparison_group"]),
+                    reference_value=r["reference_value"],
+                    comparison_value=r["comparison_value"],
+                    difference=r["difference"],
+                    ratio=r["ratio"],
+                    p_value=r["p_value"],
+                    is_significant=r["is_significant"],
+                    severity=BiasSeverity(r["severity"]),
+                    explanation=r["explanation"]
+                )
+                for r in raw["fairness_results"]
             ],
-            "group_statistics": {
+            group_statistics={
                 attr: [
-                    {
-                        "group_name": g.group_name,
-                        "sample_size": g.sample_size,
-                        "mean_prediction": g.mean_prediction,
-                        "std_prediction": g.std_prediction,
-                        "positive_rate": g.positive_rate
-                    }
+                    GroupStatistics(**{**g, "group_name": intern_group_name(g["group_name"])})
                     for g in stats
                 ]
-                for attr, stats in report.group_statistics.items()
+                for attr, stats in raw["group_statistics"].items()
             },
-            "overall_severity": report.overall_bias_severity.value,
-            "recommendations": report.recommendations,
-            "requires_review": report.requires_review,
-            "confidence_score": report.confidence_score
-        })
+            overall_bias_severity=BiasSeverity(raw["overall_severity"]),
+            recommendations=raw["recommendations"],
+            requires_review=raw["requires_review"],
+            confidence_score=raw["confidence_score"]
+        )
+    
+    def _report_fingerprint(
+        self,
+        tenant_id: str,
+        model_version: str,
+        analysis_period_days: int,
+        arrays: PredictionArrays,
+        grouped_data: dict[str, dict[Any, np.ndarray]],
+        has_outcomes: bool
+    ) -> str:
+        """
+        Content digest of everything a bias report is computed from.
+        
+        Hashes the score and outcome columns and the demographic grouping
+        as raw array bytes, so any change to the inputs changes the key.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{tenant_id}|{model_version}|{analysis_period_days}|{has_outcomes}".encode()
+        )
+        digest.update(arrays.scores.tobytes())
+        digest.update(arrays.has_outcome.tobytes())
+        digest.update(arrays.actuals.tobytes())
+        
+        for attr, groups in grouped_data.items():
+            for group_name, idx in groups.items():
+                digest.update(f"|{attr}={group_name!r}:".encode())
+                digest.update(idx.tobytes())
+        
+        return digest.hexdigest()
+    
+    async def _get_cached_report(self, fingerprint: str) -> Optional[BiasReport]:
+        """Load a previously computed report for the same inputs, if any"""
+        if not self.redis:
+            return None
+        
+        data = await self.redis.get(f"bias_report_cache:{fingerprint}")
+        if not data:
+            return None
+        
+        logger.debug("Serving cached bias report %s", fingerprint)
+        return self._deserialize_full_report(data)
     
     async def _create_alerts(
         self,
@@ -857,6 +1257,10 @@ class BiasDetectionService:
             if r.is_significant and r.severity in [BiasSeverity.HIGH, BiasSeverity.CRITICAL]
         ]
         
+        if not significant:
+            return
+        
+        payloads = []
         for result in significant:
             alert = BiasAlert(
                 alert_id=f"alert_{report.report_id}_{result.attribute.value}_{result.metric.value}",
@@ -871,20 +1275,25 @@ class BiasDetectionService:
                 recommended_actions=self._get_alert_actions(result)
             )
             
-            # Store alert
-            alert_key = f"bias_alerts:{report.tenant_id}"
-            await self.redis.lpush(alert_key, json.dumps({
+            payloads.append(orjson.dumps({
                 "alert_id": alert.alert_id,
-                "created_at": alert.created_at.isoformat(),
-                "metric": alert.metric.value,
-                "attribute": alert.attribute.value,
+                "created_at": alert.created_at,
+                "metric": alert.metric,
+                "attribute": alert.attribute,
                 "affected_group": alert.affected_group,
-                "severity": alert.severity.value,
+                "severity": alert.severity,
                 "description": alert.description,
                 "acknowledged": alert.acknowledged,
                 "resolved": alert.resolved
             }))
         
+        # Store all alerts with one variadic LPUSH, capping the list length
+        alert_key = f"bias_alerts:{report.tenant_id}:pending"
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.lpush(alert_key, *payloads)
+            pipe.ltrim(alert_key, 0, self.MAX_STORED_ALERTS - 1)
+            await pipe.execute()
+        
         logger.warning(
             f"Created {len(significant)} bias alerts for tenant {report.tenant_id}"
         )
@@ -894,22 +1303,10 @@ class BiasDetectionService:
         actions = []
         
         if result.severity == BiasSeverity.CRITICAL:
-            actions.append("Immediately notify equity committee and data science team")
-            actions.append("Consider temporarily adjusting predictions for affected group")
-        
-        if result.metric == FairnessMetric.FALSE_NEGATIVE_RATE:
-            actions.append("Review at-risk students in affected group manually")
-            actions.append("Ensure no students are missing needed support")
+            actions.extend(CRITICAL_ALERT_ACTIONS)
         
-        if result.metric == FairnessMetric.FALSE_POSITIVE_RATE:
-            actions.append("Review high-risk classifications in affected group")
-            actions.append("Ensure students aren't being over-identified unfairly")
-        
-        if result.metric == FairnessMetric.STATISTICAL_PARITY:
-            actions.append("Analyze feature contributions for this demographic group")
-            actions.append("Consider retraining with bias mitigation techniques")
-        
-        actions.append("Document findings and remediation steps")
+        actions.extend(ALERT_ACTIONS_BY_METRIC.get(result.metric, ()))
+        actions.extend(COMMON_ALERT_ACTIONS)
         
         return actions
     
@@ -921,14 +1318,18 @@ class BiasDetectionService:
         if not self.redis:
             return []
         
-        alert_key = f"bias_alerts:{tenant_id}"
-        alerts = await self.redis.lrange(alert_key, 0, 50)
-        
-        if not alerts:
-            return []
-        
-        parsed = [json.loads(a) for a in alerts]
-        return [a for a in parsed if not a.get("resolved")]
+        # Resolved alerts live in a separate list, so pending reads only
+        # parse pending alerts. The list of alerts written before the
+        # pending/resolved split is read in the same round trip, so a
+        # tenant with no alerts costs a single RTT.
+        limit = self.MAX_PENDING_ALERTS
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.lrange(f"bias_alerts:{tenant_id}:pending", 0, limit - 1)
+            pipe.lrange(f"bias_alerts:{tenant_id}", 0, limit - 1)
+            pending, legacy = await pipe.execute()
+        
+        parsed = [orjson.loads(a) for a in (*pending, *legacy)]
+        return [a for a in parsed if not a.get("resolved")][:limit]
     
     async def acknowledge_alert(
         self,
@@ -958,9 +1359,45 @@ class BiasDetectionService:
         if not self.redis:
             return False
         
-        # Log resolution
-        logger.info(
-            f"Alert {alert_id} resolved by user {user_id} for tenant {tenant_id}. "
-            f"Notes: {resolution_notes}"
-        )
-        return True
+        # Move the alert from the pending list, or the list of alerts
+        # written before the pending/resolved split, to the resolved list
+        pending_key = f"bias_alerts:{tenant_id}:pending"
+        legacy_key = f"bias_alerts:{tenant_id}"
+        resolved_key = f"bias_alerts:{tenant_id}:resolved"
+        
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.lrange(pending_key, 0, -1)
+            pipe.lrange(legacy_key, 0, -1)
+            pending, legacy = await pipe.execute()
+        
+        for key, alerts in ((pending_key, pending), (legacy_key, legacy)):
+            for raw in alerts:
+                alert = orjson.loads(raw)
+                if alert.get("alert_id") != alert_id:
+                    continue
+                
+                alert["resolved"] = True
+                alert["resolved_by"] = user_id
+                alert["resolution_notes"] = resolution_notes
+                
+                # The lists were read without a lock, so the script only
+                # pushes the resolved record if it still removes the alert
+                moved = await self._resolve_alert_script(
+                    keys=[key, resolved_key],
+                    args=[raw, orjson.dumps(alert), self.MAX_STORED_ALERTS]
+                )
+                if not moved:
+                    logger.warning(
+                        f"Alert {alert_id} for tenant {tenant_id} was already resolved"
+                    )
+                    return False
+                
+                # Log resolution
+                logger.info(
+                    f"Alert {alert_id} resolved by user {user_id} for tenant {tenant_id}. "
+                    f"Notes: {resolution_notes}"
+                )
+                return True
+        
+        logger.warning(f"Alert {alert_id} not found for tenant {tenant_id}")
+        return False
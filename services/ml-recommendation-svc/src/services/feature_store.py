@@ -2,14 +2,166 @@
 Feature Store - Redis-based feature storage and retrieval.
 """
 
-import json
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
+import lz4.frame
+import numpy as np
+import orjson
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 import structlog
 
 logger = structlog.get_logger()
 
+# Embeddings are stored as b"F4" + uint16 dimension + little-endian float32
+EMBEDDING_MAGIC = b"F4"
+EMBEDDING_HEADER = struct.Struct("<2sH")
+EMBEDDING_DTYPE = np.dtype("<f4")
+
+# Feature dicts are JSON, LZ4-compressed behind a b"Z" marker once large
+# enough for compression to pay; uncompressed JSON always starts with "{"
+COMPRESSED_MAGIC = b"Z"
+COMPRESSION_MIN_BYTES = 512
+
+# Learner features are a hash with one JSON value per field, so counters
+# can be incremented in place; nested dicts are flattened to "name:key"
+LEARNER_FIELD_SEPARATOR = ":"
+# Fields updated with HINCRBY, which needs integer values
+LEARNER_COUNTER_FIELDS = frozenset({
+    "total_practices",
+    "correct_count",
+    "total_sessions",
+    "activities_completed",
+})
+
+# Count a practice attempt and recompute accuracy: KEYS[1] learner hash,
+# ARGV[1] 1 if correct else 0, ARGV[2] TTL seconds
+RECORD_PRACTICE_SCRIPT = """
+local total = redis.call('HINCRBY', KEYS[1], 'total_practices', 1)
+local correct = redis.call('HINCRBY', KEYS[1], 'correct_count', ARGV[1])
+redis.call('HSET', KEYS[1], 'accuracy', string.format('%.17g', correct / total))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+"""
+
+
+def _pack_embedding(embedding: np.ndarray | list[float]) -> bytes:
+    """Encode an embedding as a headered float32 blob."""
+    vector = np.asarray(embedding, dtype=EMBEDDING_DTYPE)
+    return EMBEDDING_HEADER.pack(EMBEDDING_MAGIC, vector.size) + vector.tobytes()
+
+
+def _unpack_embedding(data: bytes) -> np.ndarray:
+    """Decode an embedding blob, accepting legacy JSON-encoded lists."""
+    if data[:2] == EMBEDDING_MAGIC:
+        _, dim = EMBEDDING_HEADER.unpack_from(data)
+        return np.frombuffer(
+            data, dtype=EMBEDDING_DTYPE, count=dim, offset=EMBEDDING_HEADER.size
+        )
+    return np.asarray(orjson.loads(data), dtype=np.float32)
+
+
+def _pack_features(features: dict[str, Any]) -> bytes:
+    """Encode a feature dict as JSON, compressing large payloads."""
+    blob = orjson.dumps(features)
+    if len(blob) > COMPRESSION_MIN_BYTES:
+        return COMPRESSED_MAGIC + lz4.frame.compress(blob)
+    return blob
+
+
+def _unpack_features(data: bytes) -> dict[str, Any]:
+    """Decode a feature blob written by _pack_features."""
+    if data[:1] == COMPRESSED_MAGIC:
+        data = lz4.frame.decompress(data[1:])
+    return orjson.loads(data)
+
+
+def _pack_learner_fields(features: dict[str, Any]) -> dict[str, bytes]:
+    """Flatten a learner feature dict into JSON-encoded hash fields."""
+    fields: dict[str, bytes] = {}
+    for name, value in features.items():
+        if LEARNER_FIELD_SEPARATOR in name:
+            raise ValueError(
+                f"Learner feature name {name!r} must not contain "
+                f"{LEARNER_FIELD_SEPARATOR!r}"
+            )
+
+        if name in LEARNER_COUNTER_FIELDS and isinstance(value, float):
+            if not value.is_integer():
+                raise ValueError(f"Learner counter {name!r} must be an integer, got {value}")
+            value = int(value)
+
+        if isinstance(value, dict) and value:
+            for key, inner in value.items():
+                fields[f"{name}{LEARNER_FIELD_SEPARATOR}{key}"] = orjson.dumps(inner)
+        else:
+            # Empty dicts are kept as a single "{}" field
+            fields[name] = orjson.dumps(value)
+    return fields
+
+
+def _unpack_learner_fields(data: dict[bytes, bytes]) -> dict[str, Any]:
+    """Rebuild a learner feature dict from its hash fields."""
+    features: dict[str, Any] = {}
+    for field, value in data.items():
+        name, nested, key = field.decode().partition(LEARNER_FIELD_SEPARATOR)
+        if nested:
+            features.setdefault(name, {})[key] = orjson.loads(value)
+            continue
+
+        decoded = orjson.loads(value)
+        if isinstance(decoded, dict):
+            # An empty nested dict, possibly since filled by "name:key" fields
+            features.setdefault(name, {}).update(decoded)
+        else:
+            features[name] = decoded
+    return features
+
+
+class _TTLCache:
+    """In-process LRU cache whose entries expire a fixed time after insertion."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+def _parse_bandit_stats(data: dict[bytes, bytes]) -> dict[str, float]:
+    """Convert a raw bandit arm hash into float statistics."""
+    pulls = float(data.get(b"pulls", 0))
+    rewards = float(data.get(b"rewards", 0))
+    return {
+        "pulls": pulls,
+        "rewards": rewards,
+        "mean_reward": rewards / pulls if pulls > 0 else 0.0,
+    }
+
 
 class FeatureStore:
     """
@@ -22,19 +174,44 @@ class FeatureStore:
     - Collaborative filtering matrices
     """
 
+    # Keys per MGET / pipeline execute, to keep single requests bounded
+    BULK_READ_CHUNK_SIZE = 1000
+
+    INTERACTION_TTL_SECONDS = 86400 * 30  # 30 days
+    # Interaction keys get their TTL refreshed at most this often per process
+    TTL_REFRESH_INTERVAL_SECONDS = 3600
+    TTL_REFRESH_TRACKED_KEYS = 100_000
+
+    # In-process cache for item features and embeddings, which change rarely
+    LOCAL_CACHE_SIZE = 50_000
+    LOCAL_CACHE_TTL_SECONDS = 60
+
+    # Connection pool shared by concurrent recommendation requests
+    REDIS_MAX_CONNECTIONS = 64
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS = 30
+
     def __init__(self, redis_url: str) -> None:
         self.redis_url = redis_url
         self.client: redis.Redis | None = None
+        self._record_practice: AsyncScript | None = None
         self.prefix = "ml:features:"
+        self._ttl_refreshed_at: OrderedDict[str, float] = OrderedDict()
+        self._local_cache = _TTLCache(self.LOCAL_CACHE_SIZE, self.LOCAL_CACHE_TTL_SECONDS)
 
     async def connect(self) -> None:
         """Connect to Redis."""
+        # Raw bytes responses: payloads go straight to orjson, and the few
+        # string fields (hash keys, sorted set members) are decoded on read.
+        # Replies are parsed by hiredis when it is installed.
         self.client = redis.from_url(
             self.redis_url,
-            encoding="utf-8",
-            decode_responses=True,
+            decode_responses=False,
+            max_connections=self.REDIS_MAX_CONNECTIONS,
+            socket_keepalive=True,
+            health_check_interval=self.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
         )
         await self.client.ping()
+        self._record_practice = self.client.register_script(RECORD_PRACTICE_SCRIPT)
         logger.info("Connected to Redis feature store")
 
     async def disconnect(self) -> None:
@@ -47,6 +224,54 @@ class FeatureStore:
         """Build a Redis key."""
         return self.prefix + ":".join(parts)
 
+    async def _replace_sorted_set(
+        self, key: str, members: dict[str, float], ttl_seconds: int
+    ) -> None:
+        """Atomically replace a sorted set and set its TTL in one round trip."""
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.zadd(key, members)
+            pipe.expire(key, ttl_seconds)
+            await pipe.execute()
+
+    async def _get_cached(
+        self, key: str, decode: Callable[[bytes], Any]
+    ) -> Any | None:
+        """GET and decode a key through the in-process cache."""
+        value = self._local_cache.get(key)
+        if value is None:
+            data = await self.client.get(key)
+            if not data:
+                return None
+            value = decode(data)
+            self._local_cache.set(key, value)
+        return value
+
+    async def _mget_cached(
+        self, keys: list[str], decode: Callable[[bytes], Any]
+    ) -> list[Any | None]:
+        """MGET and decode keys, fetching only those not in the in-process cache."""
+        values = [self._local_cache.get(key) for key in keys]
+        misses = [i for i, value in enumerate(values) if value is None]
+
+        if misses:
+            fetched = await self._mget([keys[i] for i in misses])
+            for i, data in zip(misses, fetched):
+                if data:
+                    values[i] = decode(data)
+                    self._local_cache.set(keys[i], values[i])
+
+        return values
+
+    async def _mget(self, keys: list[str]) -> list[bytes | None]:
+        """MGET many keys, one round trip per chunk."""
+        values: list[bytes | None] = []
+        for start in range(0, len(keys), self.BULK_READ_CHUNK_SIZE):
+            values.extend(
+                await self.client.mget(keys[start:start + self.BULK_READ_CHUNK_SIZE])
+            )
+        return values
+
     # ─────────────────────────────────────────────────────────────────────────
     # Learner Features
     # ─────────────────────────────────────────────────────────────────────────
@@ -58,11 +283,11 @@ class FeatureStore:
         if not self.client:
             return None
 
-        key = self._key("learner", learner_id)
-        data = await self.client.get(key)
+        key = self._key("learner_features", learner_id)
+        data = await self.client.hgetall(key)
 
         if data:
-            return json.loads(data)
+            return _unpack_learner_fields(data)
         return None
 
     async def set_learner_features(
@@ -75,27 +300,84 @@ class FeatureStore:
         if not self.client:
             return
 
-        key = self._key("learner", learner_id)
-        await self.client.setex(key, ttl_seconds, json.dumps(features))
+        key = self._key("learner_features", learner_id)
+        fields = _pack_learner_fields(features)
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            if fields:
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, ttl_seconds)
+            await pipe.execute()
+
+    async def record_learner_practice(
+        self,
+        learner_id: str,
+        is_correct: bool,
+        ttl_seconds: int = 3600,
+    ) -> None:
+        """Count a practice attempt and update accuracy atomically."""
+        if not self.client:
+            return
+
+        await self._record_practice(
+            keys=[self._key("learner_features", learner_id)],
+            args=[1 if is_correct else 0, ttl_seconds],
+        )
+
+    async def set_learner_skill_mastery(
+        self,
+        learner_id: str,
+        skill_id: str,
+        mastery: float,
+        ttl_seconds: int = 3600,
+    ) -> None:
+        """Set one entry of a learner's skill_masteries feature."""
+        if not self.client:
+            return
+
+        key = self._key("learner_features", learner_id)
+        field = f"skill_masteries{LEARNER_FIELD_SEPARATOR}{skill_id}"
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, field, orjson.dumps(mastery))
+            pipe.expire(key, ttl_seconds)
+            await pipe.execute()
+
+    async def record_learner_session(
+        self,
+        learner_id: str,
+        duration_minutes: float,
+        activities_completed: int,
+        ttl_seconds: int = 3600,
+    ) -> None:
+        """Count a finished session and its completed activities atomically."""
+        if not self.client:
+            return
+
+        key = self._key("learner_features", learner_id)
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hincrby(key, "total_sessions", 1)
+            pipe.hincrby(key, "activities_completed", activities_completed)
+            pipe.hset(key, "last_session_duration", orjson.dumps(duration_minutes))
+            pipe.expire(key, ttl_seconds)
+            await pipe.execute()
 
     async def get_learner_embedding(
         self, learner_id: str
-    ) -> list[float] | None:
+    ) -> np.ndarray | None:
         """Get learner embedding vector for collaborative filtering."""
         if not self.client:
             return None
 
         key = self._key("embedding", "learner", learner_id)
-        data = await self.client.get(key)
-
-        if data:
-            return json.loads(data)
-        return None
+        return await self._get_cached(key, _unpack_embedding)
 
     async def set_learner_embedding(
         self,
         learner_id: str,
-        embedding: list[float],
+        embedding: np.ndarray | list[float],
         ttl_seconds: int = 86400,
     ) -> None:
         """Set learner embedding vector."""
@@ -103,7 +385,8 @@ class FeatureStore:
             return
 
         key = self._key("embedding", "learner", learner_id)
-        await self.client.setex(key, ttl_seconds, json.dumps(embedding))
+        self._local_cache.pop(key)
+        await self.client.setex(key, ttl_seconds, _pack_embedding(embedding))
 
     # ─────────────────────────────────────────────────────────────────────────
     # Item Features
@@ -117,11 +400,7 @@ class FeatureStore:
             return None
 
         key = self._key("item", item_id)
-        data = await self.client.get(key)
-
-        if data:
-            return json.loads(data)
-        return None
+        return await self._get_cached(key, _unpack_features)
 
     async def set_item_features(
         self,
@@ -134,26 +413,35 @@ class FeatureStore:
             return
 
         key = self._key("item", item_id)
-        await self.client.setex(key, ttl_seconds, json.dumps(features))
+        self._local_cache.pop(key)
+        await self.client.setex(key, ttl_seconds, _pack_features(features))
+
+    async def get_items_features(
+        self, item_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Get feature vectors for many items; missing items are omitted."""
+        if not self.client or not item_ids:
+            return {}
+
+        values = await self._mget_cached(
+            [self._key("item", i) for i in item_ids], _unpack_features
+        )
+        return {i: v for i, v in zip(item_ids, values) if v is not None}
 
     async def get_item_embedding(
         self, item_id: str
-    ) -> list[float] | None:
+    ) -> np.ndarray | None:
         """Get item embedding vector."""
         if not self.client:
             return None
 
         key = self._key("embedding", "item", item_id)
-        data = await self.client.get(key)
-
-        if data:
-            return json.loads(data)
-        return None
+        return await self._get_cached(key, _unpack_embedding)
 
     async def set_item_embedding(
         self,
         item_id: str,
-        embedding: list[float],
+        embedding: np.ndarray | list[float],
         ttl_seconds: int = 86400,
     ) -> None:
         """Set item embedding vector."""
@@ -161,7 +449,20 @@ class FeatureStore:
             return
 
         key = self._key("embedding", "item", item_id)
-        await self.client.setex(key, ttl_seconds, json.dumps(embedding))
+        self._local_cache.pop(key)
+        await self.client.setex(key, ttl_seconds, _pack_embedding(embedding))
+
+    async def get_items_embeddings(
+        self, item_ids: list[str]
+    ) -> dict[str, np.ndarray]:
+        """Get embeddings for many items; missing items are omitted."""
+        if not self.client or not item_ids:
+            return {}
+
+        values = await self._mget_cached(
+            [self._key("embedding", "item", i) for i in item_ids], _unpack_embedding
+        )
+        return {i: v for i, v in zip(item_ids, values) if v is not None}
 
     # ─────────────────────────────────────────────────────────────────────────
     # Bandit Statistics
@@ -178,13 +479,31 @@ class FeatureStore:
         data = await self.client.hgetall(key)
 
         if data:
-            return {
-                "pulls": float(data.get("pulls", 0)),
-                "rewards": float(data.get("rewards", 0)),
-                "mean_reward": float(data.get("mean_reward", 0)),
-            }
+            return _parse_bandit_stats(data)
         return None
 
+    async def get_bandit_stats_many(
+        self, arm_ids: list[str]
+    ) -> dict[str, dict[str, float]]:
+        """Get statistics for many bandit arms; arms without stats are omitted."""
+        if not self.client or not arm_ids:
+            return {}
+
+        stats: dict[str, dict[str, float]] = {}
+        for start in range(0, len(arm_ids), self.BULK_READ_CHUNK_SIZE):
+            chunk = arm_ids[start:start + self.BULK_READ_CHUNK_SIZE]
+            async with self.client.pipeline(transaction=False) as pipe:
+                for arm_id in chunk:
+                    pipe.hgetall(self._key("bandit", arm_id))
+                results = await pipe.execute()
+
+            stats.update(
+                (arm_id, _parse_bandit_stats(data))
+                for arm_id, data in zip(chunk, results)
+                if data
+            )
+        return stats
+
     async def update_bandit_stats(
         self,
         arm_id: str,
@@ -196,26 +515,33 @@ class FeatureStore:
 
         key = self._key("bandit", arm_id)
 
-        # Use Redis transaction for atomic update
+        # Server-side increments in one MULTI/EXEC; the mean is derived on read
         async with self.client.pipeline(transaction=True) as pipe:
-            # Get current stats
-            await pipe.hgetall(key)
-            results = await pipe.execute()
-            
-            current = results[0] if results else {}
-            pulls = float(current.get("pulls", 0)) + 1
-            rewards = float(current.get("rewards", 0)) + reward
-            mean_reward = rewards / pulls if pulls > 0 else 0
-
-            # Update stats
-            await self.client.hset(
-                key,
-                mapping={
-                    "pulls": str(pulls),
-                    "rewards": str(rewards),
-                    "mean_reward": str(mean_reward),
-                },
-            )
+            pipe.hincrbyfloat(key, "pulls", 1.0)
+            pipe.hincrbyfloat(key, "rewards", reward)
+            await pipe.execute()
+
+    async def update_bandit_stats_batch(
+        self,
+        updates: list[tuple[str, float]],
+    ) -> None:
+        """Apply many (arm_id, reward) updates in one round trip."""
+        if not self.client or not updates:
+            return
+
+        # Fold repeated arms so each arm gets one pair of increments
+        totals: dict[str, list[float]] = {}
+        for arm_id, reward in updates:
+            arm_totals = totals.setdefault(arm_id, [0.0, 0.0])
+            arm_totals[0] += 1.0
+            arm_totals[1] += reward
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            for arm_id, (pulls, rewards) in totals.items():
+                key = self._key("bandit", arm_id)
+                pipe.hincrbyfloat(key, "pulls", pulls)
+                pipe.hincrbyfloat(key, "rewards", rewards)
+            await pipe.execute()
 
     # ─────────────────────────────────────────────────────────────────────────
     # Similarity Cache
@@ -232,7 +558,7 @@ class FeatureStore:
         data = await self.client.zrevrange(key, 0, limit - 1, withscores=True)
 
         if data:
-            return [(item, score) for item, score in data]
+            return [(item.decode(), score) for item, score in data]
         return None
 
     async def set_similar_learners(
@@ -248,9 +574,7 @@ class FeatureStore:
         key = self._key("similar", "learners", learner_id)
 
         if similar:
-            # Store as sorted set
-            await self.client.zadd(key, {lid: score for lid, score in similar})
-            await self.client.expire(key, ttl_seconds)
+            await self._replace_sorted_set(key, dict(similar), ttl_seconds)
 
     async def get_similar_items(
         self, item_id: str, limit: int = 10
@@ -263,7 +587,7 @@ class FeatureStore:
         data = await self.client.zrevrange(key, 0, limit - 1, withscores=True)
 
         if data:
-            return [(item, score) for item, score in data]
+            return [(item.decode(), score) for item, score in data]
         return None
 
     async def set_similar_items(
@@ -279,8 +603,7 @@ class FeatureStore:
         key = self._key("similar", "items", item_id)
 
         if similar:
-            await self.client.zadd(key, {iid: score for iid, score in similar})
-            await self.client.expire(key, ttl_seconds)
+            await self._replace_sorted_set(key, dict(similar), ttl_seconds)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Interaction History
@@ -297,15 +620,34 @@ class FeatureStore:
         if not self.client:
             return
 
-        # Add to learner's interaction history
         learner_key = self._key("interactions", learner_id)
-        await self.client.zadd(learner_key, {item_id: score})
-        await self.client.expire(learner_key, 86400 * 30)  # 30 days
-
-        # Add to item's interaction history
         item_key = self._key("item_interactions", item_id)
-        await self.client.zadd(item_key, {learner_id: score})
-        await self.client.expire(item_key, 86400 * 30)
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            # Add to learner's and item's interaction history
+            pipe.zadd(learner_key, {item_id: score})
+            pipe.zadd(item_key, {learner_id: score})
+
+            # Refreshing a 30-day TTL on every event is wasted work
+            for key in (learner_key, item_key):
+                if self._should_refresh_ttl(key):
+                    pipe.expire(key, self.INTERACTION_TTL_SECONDS)
+
+            await pipe.execute()
+
+    def _should_refresh_ttl(self, key: str) -> bool:
+        """Whether this process hasn't refreshed the key's TTL recently."""
+        now = time.monotonic()
+        last = self._ttl_refreshed_at.get(key)
+
+        if last is not None and now - last < self.TTL_REFRESH_INTERVAL_SECONDS:
+            return False
+
+        self._ttl_refreshed_at[key] = now
+        self._ttl_refreshed_at.move_to_end(key)
+        if len(self._ttl_refreshed_at) > self.TTL_REFRESH_TRACKED_KEYS:
+            self._ttl_refreshed_at.popitem(last=False)
+        return True
 
     async def get_learner_interactions(
         self, learner_id: str, limit: int = 100
@@ -317,4 +659,4 @@ class FeatureStore:
         key = self._key("interactions", learner_id)
         data = await self.client.zrevrange(key, 0, limit - 1, withscores=True)
 
-        return [(item, score) for item, score in data] if data else []
+        return [(item.decode(), score) for item, score in data] if data else []
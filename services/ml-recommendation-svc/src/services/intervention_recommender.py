@@ -10,18 +10,33 @@ Evidence-based intervention matching system for at-risk students:
 IMPORTANT: Interventions must be reviewed by qualified educators before implementation.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Optional
-import json
+import asyncio
+import hashlib
+import heapq
 import logging
-import random
 from collections import defaultdict
+from operator import attrgetter
+
+import numpy as np
+import orjson
+import xxhash
 
 logger = logging.getLogger(__name__)
 
 
+def _canonical_json(value: Any) -> bytes:
+    """Key-sorted JSON for hashing; unknown types fall back to str()."""
+    return orjson.dumps(
+        value,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+
+
 class InterventionType(str, Enum):
     """Types of interventions"""
     ACADEMIC = "academic"
@@ -57,7 +72,7 @@ class InterventionStatus(str, Enum):
     DECLINED = "declined"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterventionDefinition:
     """Definition of an intervention strategy"""
     id: str
@@ -76,9 +91,16 @@ class InterventionDefinition:
     resources_required: dict[str, Any]
     evidence_base: str
     effectiveness_score: float  # Historical effectiveness 0-1
+    # Derived once from the static fields above
+    implementation_notes: str = field(init=False, repr=False, compare=False)
+    effectiveness_percent: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "implementation_notes", "\n".join(self.implementation_steps))
+        object.__setattr__(self, "effectiveness_percent", int(self.effectiveness_score * 100))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecommendedIntervention:
     """A specific intervention recommendation for a student"""
     intervention_id: str
@@ -99,7 +121,7 @@ class RecommendedIntervention:
     experiment_group: Optional[str] = None  # For A/B testing
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterventionPlan:
     """Complete intervention plan for a student"""
     student_id: str
@@ -114,7 +136,7 @@ class InterventionPlan:
     educator_approval_required: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterventionOutcome:
     """Outcome tracking for an intervention"""
     intervention_id: str
@@ -130,8 +152,34 @@ class InterventionOutcome:
     effectiveness_rating: Optional[float]  # Educator-provided rating
 
 
+@dataclass(slots=True)
+class ScoredIntervention:
+    """Scoring of one catalog intervention for a student"""
+    intervention_id: str
+    definition: InterventionDefinition
+    score: float
+    relevance: float
+    effectiveness: float
+    matched_factors: list[str]
+    prereq_met: bool
+    recent_failure: bool
+    experiment_group: Optional[str] = None  # Set by A/B testing
+
+
+# Running average of effectiveness: KEYS[1] stats hash, ARGV[1] new
+# effectiveness, ARGV[2] update timestamp
+EFFECTIVENESS_STATS_SCRIPT = """
+local count = tonumber(redis.call('HGET', KEYS[1], 'count') or 0) + 1
+local avg = tonumber(redis.call('HGET', KEYS[1], 'avg') or 0)
+avg = avg + (tonumber(ARGV[1]) - avg) / count
+redis.call('HSET', KEYS[1], 'count', count, 'avg', string.format('%.17g', avg),
+           'last_updated', ARGV[2])
+return tostring(avg)
+"""
+
+
 # Evidence-based intervention catalog
-INTERVENTION_CATALOG: list[InterventionDefinition] = [
+INTERVENTION_CATALOG: tuple[InterventionDefinition, ...] = (
     # Academic interventions
     InterventionDefinition(
         id="int_targeted_practice",
@@ -396,7 +444,7 @@ INTERVENTION_CATALOG: list[InterventionDefinition] = [
         evidence_base="SEL interventions improve both emotional well-being and academics",
         effectiveness_score=0.72
     ),
-]
+)
 
 
 class InterventionRecommender:
@@ -410,20 +458,45 @@ class InterventionRecommender:
     - Interventions should never be punitive
     """
     
+    # Near-identical requests (dashboard polling) reuse a recent plan
+    PLAN_CACHE_TTL_SECONDS = 300
+    
     def __init__(
         self,
         redis_client: Optional[Any] = None,
         experiment_config: Optional[dict] = None
     ):
         self.redis = redis_client
+        self._effectiveness_script = (
+            redis_client.register_script(EFFECTIVENESS_STATS_SCRIPT)
+            if redis_client else None
+        )
         self.experiment_config = experiment_config or {}
+        self._experiment_key = _canonical_json(self.experiment_config)
         self.intervention_map = {i.id: i for i in INTERVENTION_CATALOG}
+        self._exclusions = {i.id: frozenset(i.exclusions) for i in INTERVENTION_CATALOG}
         
-        # Build risk factor to intervention index
-        self.risk_to_interventions: dict[str, list[str]] = defaultdict(list)
+        # Build risk factor to intervention index, frozen once populated
+        risk_to_interventions: dict[str, list[str]] = defaultdict(list)
         for intervention in INTERVENTION_CATALOG:
             for risk_factor in intervention.target_risk_factors:
-                self.risk_to_interventions[risk_factor].append(intervention.id)
+                risk_to_interventions[risk_factor].append(intervention.id)
+        self.risk_to_interventions: dict[str, tuple[str, ...]] = {
+            risk_factor: tuple(ids) for risk_factor, ids in risk_to_interventions.items()
+        }
+        
+        # Dense catalog tables for vectorized relevance scoring: one row per
+        # catalog entry, one column per targeted risk factor
+        self._factor_index = {
+            factor: i for i, factor in enumerate(self.risk_to_interventions)
+        }
+        self._target_mask = np.zeros((len(INTERVENTION_CATALOG), len(self._factor_index)))
+        for row, intervention in enumerate(INTERVENTION_CATALOG):
+            for risk_factor in intervention.target_risk_factors:
+                self._target_mask[row, self._factor_index[risk_factor]] = 1.0
+        self._target_counts = np.array(
+            [len(i.target_risk_factors) for i in INTERVENTION_CATALOG], dtype=np.float64
+        )
     
     async def recommend_interventions(
         self,
@@ -444,22 +517,94 @@ class InterventionRecommender:
         Returns:
             InterventionPlan with prioritized recommendations
         """
-        student_context = student_context or {}
-        
         # Get previous interventions to avoid repetition
         previous_interventions = await self._get_intervention_history(
             student_id, tenant_id
         )
-        active_interventions = [
-            i for i in previous_interventions 
+        
+        return await self._plan_interventions(
+            student_id,
+            tenant_id,
+            risk_prediction,
+            student_context or {},
+            previous_interventions
+        )
+    
+    async def recommend_interventions_batch(
+        self,
+        tenant_id: str,
+        risk_predictions: dict[str, Any],
+        student_contexts: Optional[dict[str, dict]] = None
+    ) -> dict[str, InterventionPlan]:
+        """
+        Generate intervention plans for many students at once.
+        
+        Histories for all students are fetched in one pipelined round trip,
+        relevance is scored for the whole batch in one matrix product, and
+        the per-student plans are built concurrently.
+        
+        Args:
+            tenant_id: Tenant context
+            risk_predictions: Risk predictions keyed by student id
+            student_contexts: Optional additional context keyed by student id
+        
+        Returns:
+            InterventionPlan per student id
+        """
+        student_contexts = student_contexts or {}
+        histories = await self._get_intervention_histories(
+            list(risk_predictions), tenant_id
+        )
+        matched_counts, relevances = self._relevance_matrix(
+            list(risk_predictions.values())
+        )
+        
+        plans = await asyncio.gather(*(
+            self._plan_interventions(
+                student_id,
+                tenant_id,
+                risk_prediction,
+                student_contexts.get(student_id) or {},
+                histories[student_id],
+                (matched_counts[i], relevances[i])
+            )
+            for i, (student_id, risk_prediction) in enumerate(risk_predictions.items())
+        ))
+        return dict(zip(risk_predictions, plans))
+    
+    async def _plan_interventions(
+        self,
+        student_id: str,
+        tenant_id: str,
+        risk_prediction: Any,
+        student_context: dict,
+        previous_interventions: list[dict],
+        relevance_row: Optional[tuple[np.ndarray, np.ndarray]] = None
+    ) -> InterventionPlan:
+        """Build (or load from cache) the plan for one student"""
+        fingerprint = self._plan_fingerprint(
+            student_id, tenant_id, risk_prediction, student_context, previous_interventions
+        )
+        now = datetime.utcnow()
+        cached = await self._get_cached_plan(fingerprint)
+        if cached:
+            # Same recommendations, but a new plan: record it for tracking
+            # without extending the cache entry's lifetime
+            plan = replace(cached, created_at=now, review_date=now + timedelta(days=7))
+            await self._store_plan(plan, tenant_id)
+            return plan
+        
+        active_ids = {
+            i.get("intervention_id") for i in previous_interventions
             if i.get("status") in ["approved", "in_progress"]
-        ]
+        }
         
         # Score all interventions
         scored_interventions = self._score_interventions(
             risk_prediction,
             previous_interventions,
-            student_context
+            student_context,
+            relevance_row
         )
         
         # Apply A/B testing if configured
@@ -468,99 +613,163 @@ class InterventionRecommender:
                 student_id, scored_interventions
             )
         
-        # Filter and sort
-        valid_interventions = [
-            i for i in scored_interventions
-            if i["score"] > 0.3 and not self._is_excluded(i, active_interventions)
-        ]
-        valid_interventions.sort(key=lambda x: x["score"], reverse=True)
+        # Filter, and identify excluded interventions with reasons
+        valid_interventions, excluded = self._partition_scored(
+            scored_interventions,
+            active_ids
+        )
+        # Only the top 6 are used, so skip sorting the rest
+        top = heapq.nlargest(6, valid_interventions, key=attrgetter("score"))
         
         # Create recommendations
         primary = self._create_recommendations(
-            valid_interventions[:3],
+            top[:3],
             risk_prediction
         )
         secondary = self._create_recommendations(
-            valid_interventions[3:6],
+            top[3:6],
             risk_prediction
         )
         
-        # Identify excluded interventions with reasons
-        excluded = self._get_excluded_interventions(
-            scored_interventions,
-            active_interventions
-        )
-        
         # Determine urgency
-        requires_immediate = risk_prediction.risk_level.value in ["critical", "high"]
+        risk_level = risk_prediction.risk_level.value
+        requires_immediate = risk_level in ["critical", "high"]
         educator_approval = any(
-            self.intervention_map[r.intervention_id].requires_educator_approval
+            r.requires_educator_approval
             for r in primary + secondary
         )
         
         plan = InterventionPlan(
             student_id=student_id,
-            created_at=datetime.utcnow(),
-            risk_level=risk_prediction.risk_level.value,
+            created_at=now,
+            risk_level=risk_level,
             primary_recommendations=primary,
             secondary_recommendations=secondary,
             excluded_interventions=excluded,
-            review_date=datetime.utcnow() + timedelta(days=7),
+            review_date=now + timedelta(days=7),
             notes=self._generate_plan_notes(risk_prediction, primary),
             requires_immediate_action=requires_immediate,
             educator_approval_required=educator_approval
         )
         
         # Store plan for tracking
-        await self._store_plan(plan, tenant_id)
+        await self._store_plan(plan, tenant_id, fingerprint)
         
         return plan
     
+    def _plan_fingerprint(
+        self,
+        student_id: str,
+        tenant_id: str,
+        risk_prediction: Any,
+        student_context: dict,
+        previous_interventions: list[dict]
+    ) -> str:
+        """
+        Digest of everything that shapes an intervention plan.
+        
+        Risk factor contributions are rounded to 2 decimals so that
+        near-identical predictions share a plan.
+        """
+        factors = sorted(
+            (f.feature, round(f.contribution, 2))
+            for f in risk_prediction.top_risk_factors
+        )
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{tenant_id}|{student_id}|{risk_prediction.risk_level.value}|"
+            f"{risk_prediction.risk_trend.value}|{risk_prediction.risk_score:.2f}|"
+            f"{risk_prediction.confidence:.2f}|{factors}".encode()
+        )
+        digest.update(_canonical_json(student_context))
+        digest.update(_canonical_json(previous_interventions))
+        digest.update(self._experiment_key)
+        return digest.hexdigest()
+    
+    async def _get_cached_plan(self, fingerprint: str) -> Optional[InterventionPlan]:
+        """Load a recent plan computed from the same inputs, if any"""
+        if not self.redis:
+            return None
+        
+        data = await self.redis.get(f"intervention_plan_cache:{fingerprint}")
+        if not data:
+            return None
+        
+        logger.debug(f"Serving cached intervention plan {fingerprint}")
+        return self._deserialize_plan(data)
+    
+    def _serialize_plan(self, plan: InterventionPlan) -> bytes:
+        """Serialize a full plan to JSON"""
+        # orjson encodes the nested dataclasses, enums and datetimes natively
+        return orjson.dumps(plan)
+    
+    def _deserialize_plan(self, data: str | bytes) -> InterventionPlan:
+        """Rebuild an InterventionPlan from its _serialize_plan JSON"""
+        raw = orjson.loads(data)
+        
+        def recommendations(items: list[dict]) -> list[RecommendedIntervention]:
+            return [
+                RecommendedIntervention(**{
+                    **r,
+                    "intervention_type": InterventionType(r["intervention_type"]),
+                    "intensity": InterventionIntensity(r["intensity"]),
+                    "urgency": InterventionUrgency(r["urgency"]),
+                })
+                for r in items
+            ]
+        
+        return InterventionPlan(**{
+            **raw,
+            "created_at": datetime.fromisoformat(raw["created_at"]),
+            "review_date": datetime.fromisoformat(raw["review_date"]),
+            "primary_recommendations": recommendations(raw["primary_recommendations"]),
+            "secondary_recommendations": recommendations(raw["secondary_recommendations"]),
+        })
+    
     def _score_interventions(
         self,
         risk_prediction: Any,
         previous_interventions: list[dict],
-        student_context: dict
-    ) -> list[dict]:
-        """Score all interventions based on relevance and expected effectiveness"""
+        student_context: dict,
+        relevance_row: Optional[tuple[np.ndarray, np.ndarray]] = None
+    ) -> list[ScoredIntervention]:
+        """
+        Score all interventions based on relevance and expected effectiveness.
+        
+        relevance_row is this student's row of _relevance_matrix, when the
+        caller has already computed it for a batch.
+        """
         scored = []
         
         # Extract active risk factors
         risk_factors = {f.feature: f.contribution for f in risk_prediction.top_risk_factors}
         
-        for intervention in INTERVENTION_CATALOG:
-            # Calculate relevance score based on matching risk factors
-            relevance = 0.0
-            matched_factors = []
-            for target in intervention.target_risk_factors:
-                if target in risk_factors:
-                    relevance += risk_factors[target]
-                    matched_factors.append(target)
-            
-            if not matched_factors:
-                continue
-            
-            # Normalize relevance
-            relevance = min(relevance / len(intervention.target_risk_factors), 1.0)
+        # Index the history once instead of rescanning it per intervention
+        completed_ids, recent_failures = self._index_history(previous_interventions)
+        
+        if relevance_row is None:
+            matched, relevant = self._relevance_matrix([risk_prediction])
+            relevance_row = (matched[0], relevant[0])
+        matched_counts, relevances = relevance_row
+        
+        # Only interventions targeting at least one present risk factor can
+        # be relevant; rows come back in catalog order
+        for row in np.flatnonzero(matched_counts).tolist():
+            intervention = INTERVENTION_CATALOG[row]
+            matched_factors = [
+                target for target in intervention.target_risk_factors
+                if target in risk_factors
+            ]
+            relevance = float(relevances[row])
             
             # Adjust for historical effectiveness
             effectiveness = intervention.effectiveness_score
             
             # Check if prerequisites are met
-            prereq_met = all(
-                any(p.get("intervention_id") == prereq and p.get("status") == "completed"
-                    for p in previous_interventions)
-                for prereq in intervention.prerequisites
-            ) if intervention.prerequisites else True
+            prereq_met = completed_ids.issuperset(intervention.prerequisites)
             
             # Penalize if recently tried unsuccessfully
-            recent_failure = any(
-                p.get("intervention_id") == intervention.id
-                and p.get("status") == "completed"
-                and p.get("effectiveness_rating", 1.0) < 0.5
-                and (datetime.utcnow() - datetime.fromisoformat(p.get("ended_at", datetime.min.isoformat()))).days < 30
-                for p in previous_interventions
-            )
+            recent_failure = intervention.id in recent_failures
             
             # Calculate final score
             score = relevance * 0.5 + effectiveness * 0.5
@@ -574,77 +783,115 @@ class InterventionRecommender:
             if student_context.get("has_iep") and intervention.intensity == InterventionIntensity.INTENSIVE:
                 score *= 1.1  # Boost intensive interventions for IEP students
             
-            scored.append({
-                "intervention_id": intervention.id,
-                "score": score,
-                "relevance": relevance,
-                "effectiveness": effectiveness,
-                "matched_factors": matched_factors,
-                "prereq_met": prereq_met,
-                "recent_failure": recent_failure
-            })
+            scored.append(ScoredIntervention(
+                intervention_id=intervention.id,
+                definition=intervention,
+                score=score,
+                relevance=relevance,
+                effectiveness=effectiveness,
+                matched_factors=matched_factors,
+                prereq_met=prereq_met,
+                recent_failure=recent_failure
+            ))
         
         return scored
     
+    def _relevance_matrix(
+        self,
+        risk_predictions: list[Any]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Matched-factor counts and relevance for every (student, intervention).
+        
+        Relevance is the summed contribution of an intervention's matching
+        risk factors normalized by its number of targets, computed for all
+        students and the whole catalog with two matrix products.
+        """
+        contributions = np.zeros((len(risk_predictions), len(self._factor_index)))
+        present = np.zeros_like(contributions)
+        for student, risk_prediction in enumerate(risk_predictions):
+            for f in risk_prediction.top_risk_factors:
+                column = self._factor_index.get(f.feature)
+                if column is not None:
+                    contributions[student, column] = f.contribution
+                    present[student, column] = 1.0
+        
+        matched_counts = present @ self._target_mask.T
+        relevances = np.minimum(
+            contributions @ self._target_mask.T / self._target_counts, 1.0
+        )
+        return matched_counts, relevances
+    
+    def _index_history(
+        self,
+        previous_interventions: list[dict]
+    ) -> tuple[set[str], set[str]]:
+        """Get completed intervention ids and ids that recently failed"""
+        completed_ids = set()
+        recent_failures = set()
+        recent_cutoff = datetime.utcnow() - timedelta(days=30)
+        
+        for p in previous_interventions:
+            if p.get("status") != "completed":
+                continue
+            completed_ids.add(p.get("intervention_id"))
+            
+            rating = p.get("effectiveness_rating", 1.0)
+            if rating is None or rating >= 0.5:
+                continue
+            ended_at = p.get("ended_at")
+            if ended_at and datetime.fromisoformat(ended_at) > recent_cutoff:
+                recent_failures.add(p.get("intervention_id"))
+        
+        return completed_ids, recent_failures
+    
     def _apply_experiments(
         self,
         student_id: str,
-        interventions: list[dict]
-    ) -> list[dict]:
+        interventions: list[ScoredIntervention]
+    ) -> list[ScoredIntervention]:
         """Apply A/B testing experiments to intervention selection"""
+        # Deterministic assignment based on student_id, once per experiment
+        in_treatment = {
+            experiment_name: xxhash.xxh3_64_intdigest(
+                f"{student_id}:{experiment_name}".encode()
+            ) % 100 < config.get("treatment_percent", 50)
+            for experiment_name, config in self.experiment_config.items()
+        }
+        
         for intervention in interventions:
             for experiment_name, config in self.experiment_config.items():
-                if intervention["intervention_id"] in config.get("interventions", []):
-                    # Deterministic assignment based on student_id
-                    hash_input = f"{student_id}:{experiment_name}"
-                    hash_val = int.from_bytes(hash_input.encode(), 'little') % 100
-                    
-                    if hash_val < config.get("treatment_percent", 50):
-                        intervention["experiment_group"] = f"{experiment_name}:treatment"
-                        intervention["score"] *= config.get("treatment_boost", 1.2)
+                if intervention.intervention_id in config.get("interventions", []):
+                    if in_treatment[experiment_name]:
+                        intervention.experiment_group = f"{experiment_name}:treatment"
+                        intervention.score *= config.get("treatment_boost", 1.2)
                     else:
-                        intervention["experiment_group"] = f"{experiment_name}:control"
+                        intervention.experiment_group = f"{experiment_name}:control"
         
         return interventions
     
-    def _is_excluded(
-        self,
-        intervention: dict,
-        active_interventions: list[dict]
-    ) -> bool:
-        """Check if intervention is excluded due to active interventions"""
-        int_def = self.intervention_map[intervention["intervention_id"]]
-        
-        active_ids = {a.get("intervention_id") for a in active_interventions}
-        
-        # Check if already active
-        if intervention["intervention_id"] in active_ids:
-            return True
-        
-        # Check for conflicting interventions
-        return any(exc in active_ids for exc in int_def.exclusions)
-    
     def _create_recommendations(
         self,
-        scored: list[dict],
+        scored: list[ScoredIntervention],
         risk_prediction: Any
     ) -> list[RecommendedIntervention]:
         """Create recommendation objects from scored interventions"""
         recommendations = []
         
+        # Determine urgency
+        risk_level = risk_prediction.risk_level.value
+        if risk_level == "critical":
+            urgency = InterventionUrgency.IMMEDIATE
+        elif risk_level == "high":
+            urgency = InterventionUrgency.SHORT_TERM
+        else:
+            urgency = InterventionUrgency.MEDIUM_TERM
+        
         for item in scored:
-            int_def = self.intervention_map[item["intervention_id"]]
-            
-            # Determine urgency
-            if risk_prediction.risk_level.value == "critical":
-                urgency = InterventionUrgency.IMMEDIATE
-            elif risk_prediction.risk_level.value == "high":
-                urgency = InterventionUrgency.SHORT_TERM
-            else:
-                urgency = InterventionUrgency.MEDIUM_TERM
+            int_def = item.definition
             
             # Generate rationale
-            rationale = self._generate_rationale(int_def, item["matched_factors"])
+            rationale = self._generate_rationale(int_def, item.matched_factors)
             
             recommendations.append(RecommendedIntervention(
                 intervention_id=int_def.id,
@@ -652,17 +899,17 @@ class InterventionRecommender:
                 intervention_type=int_def.intervention_type,
                 intensity=int_def.intensity,
                 urgency=urgency,
-                relevance_score=item["relevance"],
-                expected_effectiveness=item["effectiveness"],
-                confidence=item["relevance"] * 0.5 + item["effectiveness"] * 0.5,
-                target_risk_factors=item["matched_factors"],
+                relevance_score=item.relevance,
+                expected_effectiveness=item.effectiveness,
+                confidence=item.relevance * 0.5 + item.effectiveness * 0.5,
+                target_risk_factors=item.matched_factors,
                 rationale=rationale,
-                implementation_notes="\n".join(int_def.implementation_steps),
+                implementation_notes=int_def.implementation_notes,
                 estimated_duration_days=int_def.estimated_duration_days,
                 requires_parent_consent=int_def.requires_parent_consent,
                 requires_educator_approval=int_def.requires_educator_approval,
                 success_indicators=int_def.success_indicators,
-                experiment_group=item.get("experiment_group")
+                experiment_group=item.experiment_group
             ))
         
         return recommendations
@@ -679,55 +926,59 @@ class InterventionRecommender:
         
         return (
             f"Recommended based on concerns about {factors_text}. "
-            f"This intervention has shown {int(intervention.effectiveness_score * 100)}% "
+            f"This intervention has shown {intervention.effectiveness_percent}% "
             f"effectiveness in similar situations. {intervention.evidence_base}"
         )
     
-    def _get_excluded_interventions(
+    def _partition_scored(
         self,
-        all_scored: list[dict],
-        active: list[dict]
-    ) -> list[dict[str, str]]:
-        """Get list of excluded interventions with reasons"""
+        all_scored: list[ScoredIntervention],
+        active_ids: set[str]
+    ) -> tuple[list[ScoredIntervention], list[dict[str, str]]]:
+        """
+        Split scored interventions into recommendable ones and exclusions.
+        
+        Items scoring above the threshold are recommendable unless already
+        active or conflicting with an active intervention. Items with unmet
+        prerequisites or a recent failure stay recommendable (their score is
+        already discounted) but are also reported as excluded.
+        """
+        valid = []
         excluded = []
-        active_ids = {a.get("intervention_id") for a in active}
         
         for item in all_scored:
-            if item["score"] <= 0.3:
+            if item.score <= 0.3:
                 continue
             
-            int_def = self.intervention_map[item["intervention_id"]]
+            int_def = item.definition
+            is_active = item.intervention_id in active_ids
+            conflicts = not self._exclusions[item.intervention_id].isdisjoint(active_ids)
             
-            if item["intervention_id"] in active_ids:
-                excluded.append({
-                    "intervention_id": item["intervention_id"],
-                    "name": int_def.name,
-                    "reason": "Already active"
-                })
-            elif not item.get("prereq_met", True):
+            if not (is_active or conflicts):
+                valid.append(item)
+            
+            if is_active:
+                reason = "Already active"
+            elif not item.prereq_met:
                 prereq_names = [
                     self.intervention_map[p].name 
                     for p in int_def.prerequisites
                 ]
-                excluded.append({
-                    "intervention_id": item["intervention_id"],
-                    "name": int_def.name,
-                    "reason": f"Prerequisites not met: {', '.join(prereq_names)}"
-                })
-            elif item.get("recent_failure"):
-                excluded.append({
-                    "intervention_id": item["intervention_id"],
-                    "name": int_def.name,
-                    "reason": "Recently tried with limited success"
-                })
-            elif any(exc in active_ids for exc in int_def.exclusions):
-                excluded.append({
-                    "intervention_id": item["intervention_id"],
-                    "name": int_def.name,
-                    "reason": "Conflicts with active intervention"
-                })
+                reason = f"Prerequisites not met: {', '.join(prereq_names)}"
+            elif item.recent_failure:
+                reason = "Recently tried with limited success"
+            elif conflicts:
+                reason = "Conflicts with active intervention"
+            else:
+                continue
+            
+            excluded.append({
+                "intervention_id": item.intervention_id,
+                "name": int_def.name,
+                "reason": reason
+            })
         
-        return excluded
+        return valid, excluded
     
     def _generate_plan_notes(
         self,
@@ -740,9 +991,10 @@ class InterventionRecommender:
             f"Risk score: {risk_prediction.risk_score:.2f} (confidence: {risk_prediction.confidence:.2f})",
         ]
         
-        if risk_prediction.risk_trend.value == "increasing":
+        risk_trend = risk_prediction.risk_trend.value
+        if risk_trend == "increasing":
             notes.append("ALERT: Risk is trending upward.")
-        elif risk_prediction.risk_trend.value == "decreasing":
+        elif risk_trend == "decreasing":
             notes.append("Positive: Risk is trending downward.")
         
         if primary:
@@ -769,21 +1021,41 @@ class InterventionRecommender:
         key = f"intervention_history:{tenant_id}:{student_id}"
         history = await self.redis.lrange(key, 0, 50)
         
-        return [json.loads(h) for h in history] if history else []
+        return [orjson.loads(h) for h in history] if history else []
+    
+    async def _get_intervention_histories(
+        self,
+        student_ids: list[str],
+        tenant_id: str
+    ) -> dict[str, list[dict]]:
+        """Get historical interventions for many students in one round trip"""
+        if not self.redis or not student_ids:
+            return {student_id: [] for student_id in student_ids}
+        
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for student_id in student_ids:
+                pipe.lrange(f"intervention_history:{tenant_id}:{student_id}", 0, 50)
+            histories = await pipe.execute()
+        
+        return {
+            student_id: [orjson.loads(h) for h in history] if history else []
+            for student_id, history in zip(student_ids, histories)
+        }
     
     async def _store_plan(
         self,
         plan: InterventionPlan,
-        tenant_id: str
+        tenant_id: str,
+        fingerprint: Optional[str] = None
     ) -> None:
-        """Store intervention plan for tracking"""
+        """Store intervention plan for tracking, and cache it under fingerprint"""
         if not self.redis:
             return
         
         key = f"intervention_plans:{tenant_id}:{plan.student_id}"
         
         plan_data = {
-            "created_at": plan.created_at.isoformat(),
+            "created_at": plan.created_at,
             "risk_level": plan.risk_level,
             "recommendations": [
                 {
@@ -796,8 +1068,16 @@ class InterventionRecommender:
             ]
         }
         
-        await self.redis.lpush(key, json.dumps(plan_data))
-        await self.redis.ltrim(key, 0, 19)  # Keep last 20 plans
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.lpush(key, orjson.dumps(plan_data))
+            pipe.ltrim(key, 0, 19)  # Keep last 20 plans
+            if fingerprint:
+                pipe.setex(
+                    f"intervention_plan_cache:{fingerprint}",
+                    self.PLAN_CACHE_TTL_SECONDS,
+                    self._serialize_plan(plan)
+                )
+            await pipe.execute()
     
     async def record_outcome(
         self,
@@ -813,19 +1093,21 @@ class InterventionRecommender:
         
         outcome_data = {
             "intervention_id": outcome.intervention_id,
-            "started_at": outcome.started_at.isoformat(),
-            "ended_at": outcome.ended_at.isoformat() if outcome.ended_at else None,
+            "started_at": outcome.started_at,
+            "ended_at": outcome.ended_at,
             "status": outcome.status.value,
             "initial_risk_score": outcome.initial_risk_score,
             "final_risk_score": outcome.final_risk_score,
             "effectiveness_rating": outcome.effectiveness_rating
         }
         
-        await self.redis.lpush(history_key, json.dumps(outcome_data))
-        await self.redis.ltrim(history_key, 0, 99)  # Keep last 100 interventions
-        
-        # Update aggregated effectiveness data
-        await self._update_effectiveness_stats(outcome)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.lpush(history_key, orjson.dumps(outcome_data))
+            pipe.ltrim(history_key, 0, 99)  # Keep last 100 interventions
+            
+            # Update aggregated effectiveness data
+            await self._update_effectiveness_stats(outcome, pipe)
+            await pipe.execute()
         
         logger.info(
             f"Recorded intervention outcome: {outcome.intervention_id} "
@@ -834,9 +1116,10 @@ class InterventionRecommender:
     
     async def _update_effectiveness_stats(
         self,
-        outcome: InterventionOutcome
+        outcome: InterventionOutcome,
+        pipe: Any
     ) -> None:
-        """Update aggregated intervention effectiveness statistics"""
+        """Queue an update of aggregated intervention effectiveness statistics"""
         if outcome.status != InterventionStatus.COMPLETED:
             return
         
@@ -853,18 +1136,10 @@ class InterventionRecommender:
         else:
             return
         
-        # Update running average
-        stats_key = f"intervention_effectiveness:{outcome.intervention_id}"
-        
-        current = await self.redis.hgetall(stats_key)
-        count = int(current.get("count", 0)) + 1
-        avg = float(current.get("avg", 0))
-        
-        # Running average calculation
-        new_avg = avg + (effectiveness - avg) / count
-        
-        await self.redis.hset(stats_key, mapping={
-            "count": count,
-            "avg": new_avg,
-            "last_updated": datetime.utcnow().isoformat()
-        })
+        # Update running average server-side, so concurrent outcomes for
+        # the same intervention cannot lose updates
+        await self._effectiveness_script(
+            keys=[f"intervention_effectiveness:{outcome.intervention_id}"],
+            args=[effectiveness, datetime.utcnow().isoformat()],
+            client=pipe
+        )
@@ -2,13 +2,20 @@
 Message Consumer - RabbitMQ event consumer for real-time updates.
 """
 
-import json
+import asyncio
+import re
 from typing import Any
 
 import aio_pika
+import orjson
 import structlog
 from aio_pika import IncomingMessage
-from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractQueue
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractConnection,
+    AbstractQueue,
+    ConsumerTag,
+)
 
 from src.services.recommendation_engine import RecommendationEngine
 
@@ -31,15 +38,22 @@ class MessageConsumer:
         exchange: str,
         queue: str,
         engine: RecommendationEngine,
+        prefetch_count: int = 100,
     ) -> None:
         self.rabbitmq_url = rabbitmq_url
         self.exchange_name = exchange
         self.queue_name = queue
         self.engine = engine
+        self.prefetch_count = prefetch_count
         
         self.connection: AbstractConnection | None = None
         self.channel: AbstractChannel | None = None
         self.queue: AbstractQueue | None = None
+        self.consumer_tag: ConsumerTag | None = None
+        
+        # Handlers run concurrently, bounded to the prefetch window
+        self._semaphore = asyncio.Semaphore(prefetch_count)
+        self._tasks: set[asyncio.Task[None]] = set()
 
     async def start(self) -> None:
         """Start consuming messages."""
@@ -47,6 +61,10 @@ class MessageConsumer:
             self.connection = await aio_pika.connect_robust(self.rabbitmq_url)
             self.channel = await self.connection.channel()
             
+            # Let the broker keep several deliveries in flight instead of
+            # waiting for each ack before sending the next message
+            await self.channel.set_qos(prefetch_count=self.prefetch_count)
+            
             # Declare exchange
             exchange = await self.channel.declare_exchange(
                 self.exchange_name,
@@ -54,10 +72,23 @@ class MessageConsumer:
                 durable=True,
             )
             
+            # Dead-letter exchange and queue for rejected messages
+            dead_letter_exchange = await self.channel.declare_exchange(
+                f"{self.exchange_name}.dlx",
+                aio_pika.ExchangeType.FANOUT,
+                durable=True,
+            )
+            dead_letter_queue = await self.channel.declare_queue(
+                f"{self.queue_name}.dead",
+                durable=True,
+            )
+            await dead_letter_queue.bind(dead_letter_exchange)
+            
             # Declare queue
             self.queue = await self.channel.declare_queue(
                 self.queue_name,
                 durable=True,
+                arguments={"x-dead-letter-exchange": f"{self.exchange_name}.dlx"},
             )
             
             # Bind to relevant routing keys
@@ -73,14 +104,31 @@ class MessageConsumer:
                 await self.queue.bind(exchange, key)
             
             # Start consuming
-            await self.queue.consume(self._handle_message)
+            self.consumer_tag = await self.queue.consume(self._dispatch)
             
             logger.info(
                 "Message consumer started",
                 queue=self.queue_name,
                 routing_keys=routing_keys,
+                prefetch_count=self.prefetch_count,
             )
             
+        except aio_pika.exceptions.ChannelPreconditionFailed as e:
+            # A queue declared before dead-lettering was added has no
+            # x-dead-letter-exchange, and the broker refuses to redeclare it
+            logger.error(
+                "Message consumer queue exists with different arguments; "
+                "delete and recreate it, or apply the dead-letter exchange "
+                "with a broker policy",
+                queue=self.queue_name,
+                dead_letter_exchange=f"{self.exchange_name}.dlx",
+                policy={
+                    "pattern": f"^{re.escape(self.queue_name)}$",
+                    "definition": {"dead-letter-exchange": f"{self.exchange_name}.dlx"},
+                    "apply-to": "queues",
+                },
+                error=str(e),
+            )
         except Exception as e:
             logger.error("Failed to start message consumer", error=str(e))
             # Don't fail startup - service can work without events
@@ -88,16 +136,40 @@ class MessageConsumer:
 
     async def stop(self) -> None:
         """Stop consuming messages."""
+        if self.queue and self.consumer_tag:
+            await self.queue.cancel(self.consumer_tag)
+            self.consumer_tag = None
+        
+        # Let in-flight handlers finish and ack before closing the channel
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        
         if self.connection:
             await self.connection.close()
             logger.info("Message consumer stopped")
 
+    async def _dispatch(self, message: IncomingMessage) -> None:
+        """Hand a delivery to a background handler and return to the consumer."""
+        task = asyncio.create_task(self._bounded_handle(message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _bounded_handle(self, message: IncomingMessage) -> None:
+        """Handle a message once a concurrency slot is free."""
+        async with self._semaphore:
+            await self._handle_message(message)
+
     async def _handle_message(self, message: IncomingMessage) -> None:
-        """Handle incoming message."""
-        async with message.process():
+        """
+        Handle incoming message.
+        
+        Messages that fail to decode or process are rejected without
+        requeue, which routes them to the dead-letter queue.
+        """
+        async with message.process(requeue=False, ignore_processed=True):
             try:
                 routing_key = message.routing_key
-                body = json.loads(message.body.decode())
+                body = orjson.loads(message.body)
                 
                 logger.debug(
                     "Received message",
@@ -107,10 +179,12 @@ class MessageConsumer:
                 
                 await self._process_event(routing_key, body)
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error("Invalid JSON in message", error=str(e))
+                await message.reject(requeue=False)
             except Exception as e:
                 logger.error("Error processing message", error=str(e))
+                await message.reject(requeue=False)
 
     async def _process_event(
         self, routing_key: str | None, event: dict[str, Any]
@@ -140,17 +214,8 @@ class MessageConsumer:
         if not learner_id or not skill_id:
             return
         
-        # Update learner features in feature store
-        features = await self.engine.feature_store.get_learner_features(learner_id)
-        if features is None:
-            features = {}
-        
-        # Update practice count and accuracy
-        features["total_practices"] = features.get("total_practices", 0) + 1
-        features["correct_count"] = features.get("correct_count", 0) + (1 if is_correct else 0)
-        features["accuracy"] = features["correct_count"] / features["total_practices"]
-        
-        await self.engine.feature_store.set_learner_features(learner_id, features)
+        # Update practice count and accuracy in feature store
+        await self.engine.feature_store.record_learner_practice(learner_id, is_correct)
         
         logger.info(
             "Updated learner features after practice",
@@ -164,19 +229,13 @@ class MessageConsumer:
         skill_id = event.get("skillId")
         mastery = event.get("masteryLevel", 0)
         
-        if not learner_id:
+        if not learner_id or not skill_id:
             return
         
         # Update learner skill features
-        features = await self.engine.feature_store.get_learner_features(learner_id)
-        if features is None:
-            features = {}
-        
-        skill_masteries = features.get("skill_masteries", {})
-        skill_masteries[skill_id] = mastery
-        features["skill_masteries"] = skill_masteries
-        
-        await self.engine.feature_store.set_learner_features(learner_id, features)
+        await self.engine.feature_store.set_learner_skill_mastery(
+            learner_id, skill_id, mastery
+        )
 
     async def _handle_content_published(self, event: dict[str, Any]) -> None:
         """Handle new content published event."""
@@ -212,15 +271,8 @@ class MessageConsumer:
             return
         
         # Update session statistics
-        features = await self.engine.feature_store.get_learner_features(learner_id)
-        if features is None:
-            features = {}
-        
-        features["total_sessions"] = features.get("total_sessions", 0) + 1
-        features["last_session_duration"] = event.get("durationMinutes", 0)
-        features["activities_completed"] = (
-            features.get("activities_completed", 0) + 
-            event.get("activitiesCompleted", 0)
+        await self.engine.feature_store.record_learner_session(
+            learner_id,
+            duration_minutes=event.get("durationMinutes", 0),
+            activities_completed=int(event.get("activitiesCompleted", 0)),
         )
-        
-        await self.engine.feature_store.set_learner_features(learner_id, features)
@@ -2,14 +2,11 @@
 Recommendation Engine - Core ML recommendation logic.
 """
 
-import math
-import random
 from datetime import datetime
 from typing import Any
 
 import numpy as np
 import structlog
-from scipy.spatial.distance import cosine
 
 from src.config import Settings
 from src.models import (
@@ -26,6 +23,44 @@ from src.services.feature_store import FeatureStore
 logger = structlog.get_logger()
 
 
+_MOCK_DOMAINS = ("MATH", "ELA", "SCIENCE")
+
+
+def _build_mock_candidates() -> list[dict[str, Any]]:
+    """Generate mock candidates for demonstration."""
+    candidates: list[dict[str, Any]] = []
+    
+    for i in range(50):
+        domain = _MOCK_DOMAINS[i % len(_MOCK_DOMAINS)]
+        difficulty = 0.3 + (i % 10) * 0.07
+        
+        candidates.append({
+            "id": f"activity_{i:03d}",
+            "type": "activity",
+            "domain": domain,
+            "difficulty": difficulty,
+            "skill_ids": (f"skill_{(i % 20):03d}",),
+            "metadata": {
+                "title": f"Activity {i}",
+                "estimated_duration": 10 + (i % 20),
+            },
+        })
+    
+    return candidates
+
+
+# Mock candidates per domain filter (None for all domains), built once at
+# import and shared between requests, so callers must not mutate them
+_MOCK_CANDIDATES = _build_mock_candidates()
+_CANDIDATES_BY_DOMAIN: dict[str | None, list[dict[str, Any]]] = {
+    None: _MOCK_CANDIDATES,
+    **{
+        domain: [c for c in _MOCK_CANDIDATES if c["domain"] == domain]
+        for domain in _MOCK_DOMAINS
+    },
+}
+
+
 class RecommendationEngine:
     """
     Hybrid recommendation engine combining multiple strategies:
@@ -48,6 +83,7 @@ class RecommendationEngine:
         # Bandit settings
         self.epsilon = settings.epsilon
         self.ucb_c = settings.ucb_c
+        self._rng = np.random.default_rng()
 
     async def get_recommendations(
         self, request: RecommendationRequest
@@ -68,16 +104,47 @@ class RecommendationEngine:
                 processing_time_ms=0,
             )
         
+        exclude_ids = set(request.exclude_ids)
+        candidates = [c for c in candidates if c["id"] not in exclude_ids]
+        
+        # Component scores for all candidates at once
+        collaborative_scores = await self._collaborative_scores(
+            learner_id, [c["id"] for c in candidates]
+        )
+        difficulties, skill_matrix, skill_index = self._candidate_arrays(candidates)
+        content_scores = self._content_scores(
+            request, difficulties, skill_matrix, skill_index, request.skill_masteries
+        )
+        kt_scores = self._knowledge_tracing_scores(
+            skill_matrix, skill_index, request.skill_masteries
+        )
+        exploration_bonuses = await self._exploration_bonuses(
+            [c["id"] for c in candidates]
+        )
+        
+        # Confidence depends only on the learner's mastery data
+        confidence = self._compute_confidence(learner_id, request.skill_masteries)
+        
         # Score each candidate using hybrid approach
         scored_items: list[RecommendedItem] = []
         
-        for candidate in candidates:
-            if candidate["id"] in request.exclude_ids:
-                continue
-                
-            scores = await self._compute_scores(
-                request, candidate, request.skill_masteries
-            )
+        for (
+            candidate, collaborative_score, content_score, kt_score, exploration_bonus
+        ) in zip(
+            candidates,
+            collaborative_scores.tolist(),
+            content_scores.tolist(),
+            kt_scores.tolist(),
+            exploration_bonuses.tolist(),
+        ):
+            # Component scores come from the batch computations above,
+            # confidence once per request
+            scores = {
+                "collaborative": collaborative_score,
+                "content": content_score,
+                "knowledge_tracing": kt_score,
+                "confidence": confidence,
+            }
             
             # Combine scores with weights
             final_score = (
@@ -87,12 +154,8 @@ class RecommendationEngine:
             )
             
             # Apply exploration bonus using UCB
-            exploration_bonus = await self._compute_exploration_bonus(candidate["id"])
             final_score += exploration_bonus
             
-            # Apply diversity penalty for similar items
-            final_score = self._apply_diversity(final_score, scored_items, candidate)
-            
             scored_items.append(
                 RecommendedItem(
                     item_id=candidate["id"],
@@ -108,16 +171,26 @@ class RecommendationEngine:
                 )
             )
         
-        # Sort by score and take top N
-        scored_items.sort(key=lambda x: x.score, reverse=True)
-        top_items = scored_items[: request.limit]
-        
-        # Epsilon-greedy exploration
-        if random.random() < self.epsilon and len(scored_items) > request.limit:
-            # Replace one item with a random unexplored item
-            explore_idx = random.randint(0, len(top_items) - 1)
-            random_item = random.choice(scored_items[request.limit:])
-            top_items[explore_idx] = random_item
+        # Take top N, penalizing items similar to those already picked
+        selected = self._select_diverse(
+            np.array([item.score for item in scored_items]),
+            skill_matrix,
+            request.limit,
+        )
+        top_items = [scored_items[i] for i in selected]
+        
+        # Epsilon-greedy exploration: each slot is swapped for a random
+        # unexplored item with probability epsilon
+        selected_set = set(selected)
+        unexplored = [i for i in range(len(scored_items)) if i not in selected_set]
+        n_explore = min(
+            int(self._rng.binomial(len(top_items), self.epsilon)), len(unexplored)
+        )
+        if n_explore:
+            explore_slots = self._rng.choice(len(top_items), size=n_explore, replace=False)
+            explore_items = self._rng.choice(unexplored, size=n_explore, replace=False)
+            for slot, i in zip(explore_slots.tolist(), explore_items.tolist()):
+                top_items[slot] = scored_items[i]
         
         return RecommendationResponse(
             learner_id=learner_id,
@@ -141,99 +214,87 @@ class RecommendationEngine:
         # 2. Filter by domain, difficulty, prerequisites
         # 3. Apply business rules (e.g., not recently seen)
         
-        candidates: list[dict[str, Any]] = []
-        
-        # Generate mock candidates for demonstration
-        domains = ["MATH", "ELA", "SCIENCE"]
-        domain_filter = request.domain_filter
-        
-        for i in range(50):
-            domain = domains[i % len(domains)]
-            if domain_filter and domain != domain_filter:
-                continue
-                
-            difficulty = 0.3 + (i % 10) * 0.07
-            
-            candidates.append({
-                "id": f"activity_{i:03d}",
-                "type": "activity",
-                "domain": domain,
-                "difficulty": difficulty,
-                "skill_ids": [f"skill_{(i % 20):03d}"],
-                "metadata": {
-                    "title": f"Activity {i}",
-                    "estimated_duration": 10 + (i % 20),
-                },
-            })
-        
-        return candidates
+        return _CANDIDATES_BY_DOMAIN.get(request.domain_filter or None, [])
 
-    async def _compute_scores(
-        self,
-        request: RecommendationRequest,
-        candidate: dict[str, Any],
-        skill_masteries: list[SkillMastery],
-    ) -> dict[str, float]:
-        """
-        Compute component scores for a candidate item.
+    def _candidate_arrays(
+        self, candidates: list[dict[str, Any]]
+    ) -> tuple[np.ndarray, np.ndarray, dict[str, int]]:
         """
-        scores: dict[str, float] = {
-            "collaborative": 0.5,
-            "content": 0.5,
-            "knowledge_tracing": 0.5,
-            "confidence": 0.5,
-        }
+        Build the difficulty vector and candidate x skill incidence matrix.
         
-        # Collaborative filtering score
-        scores["collaborative"] = await self._collaborative_score(
-            request.learner.learner_id, candidate["id"]
-        )
+        Returns the difficulties, the 0/1 incidence matrix and the column
+        index of each skill in it.
+        """
+        skill_index: dict[str, int] = {}
+        rows: list[int] = []
+        cols: list[int] = []
         
-        # Content-based score
-        scores["content"] = self._content_score(
-            request, candidate, skill_masteries
-        )
+        for row, candidate in enumerate(candidates):
+            for skill_id in candidate.get("skill_ids", []):
+                rows.append(row)
+                cols.append(skill_index.setdefault(skill_id, len(skill_index)))
         
-        # Knowledge tracing score
-        scores["knowledge_tracing"] = self._knowledge_tracing_score(
-            candidate, skill_masteries
-        )
+        skill_matrix = np.zeros((len(candidates), len(skill_index)))
+        skill_matrix[rows, cols] = 1.0
         
-        # Compute confidence based on data availability
-        scores["confidence"] = self._compute_confidence(
-            request.learner.learner_id, candidate, skill_masteries
+        difficulties = np.array(
+            [c.get("difficulty", 0.5) for c in candidates], dtype=np.float64
         )
         
-        return scores
+        return difficulties, skill_matrix, skill_index
 
-    async def _collaborative_score(
-        self, learner_id: str, item_id: str
-    ) -> float:
+    async def _collaborative_scores(
+        self, learner_id: str, item_ids: list[str]
+    ) -> np.ndarray:
         """
-        Compute collaborative filtering score.
+        Compute collaborative filtering scores for a batch of items.
         
         Uses user-based CF: find similar learners and predict rating
-        based on their interactions with the item.
+        based on their interactions with the item. Scores are the cosine
+        similarity of the learner and item embeddings, computed with one
+        matrix-vector product over L2-normalized float32 vectors.
         """
+        # Neutral score when no data
+        scores = np.full(len(item_ids), 0.5)
+        if not item_ids:
+            return scores
+        
         # Get similar learners
         similar_learners = await self.feature_store.get_similar_learners(learner_id)
         
         if not similar_learners:
-            return 0.5  # Neutral score when no data
+            return scores
         
         # Get learner embedding
         learner_embedding = await self.feature_store.get_learner_embedding(learner_id)
-        item_embedding = await self.feature_store.get_item_embedding(item_id)
-        
-        if learner_embedding and item_embedding:
-            # Compute cosine similarity
-            try:
-                similarity = 1 - cosine(learner_embedding, item_embedding)
-                return float(np.clip(similarity, 0, 1))
-            except (ValueError, ZeroDivisionError):
-                return 0.5
+        if learner_embedding is None or not len(learner_embedding):
+            return scores
+        
+        learner_vec = np.asarray(learner_embedding, dtype=np.float32)
+        learner_norm = np.linalg.norm(learner_vec)
+        if learner_norm == 0:
+            return scores
+        
+        item_embeddings = await self.feature_store.get_items_embeddings(item_ids)
+        rows = [
+            row for row, item_id in enumerate(item_ids)
+            if len(item_embeddings.get(item_id, ())) == len(learner_vec)
+        ]
+        if not rows:
+            return scores
+        
+        item_matrix = np.stack(
+            [item_embeddings[item_ids[row]] for row in rows]
+        ).astype(np.float32, copy=False)
+        item_norms = np.linalg.norm(item_matrix, axis=1)
+        nonzero = item_norms > 0
+        
+        similarity = (item_matrix[nonzero] / item_norms[nonzero, None]) @ (
+            learner_vec / learner_norm
+        )
+        scores[np.asarray(rows)[nonzero]] = np.clip(similarity, 0, 1)
         
-        return 0.5
+        return scores
 
     def _content_score(
         self,
@@ -242,18 +303,30 @@ class RecommendationEngine:
         skill_masteries: list[SkillMastery],
     ) -> float:
         """
-        Compute content-based filtering score.
+        Compute content-based filtering score for a single candidate.
+        """
+        difficulties, skill_matrix, skill_index = self._candidate_arrays([candidate])
+        scores = self._content_scores(
+            request, difficulties, skill_matrix, skill_index, skill_masteries
+        )
+        return float(scores[0])
+
+    def _content_scores(
+        self,
+        request: RecommendationRequest,
+        difficulties: np.ndarray,
+        skill_matrix: np.ndarray,
+        skill_index: dict[str, int],
+        skill_masteries: list[SkillMastery],
+    ) -> np.ndarray:
+        """
+        Compute content-based filtering scores for a batch of candidates.
         
         Considers:
         - Difficulty appropriateness for learner level
         - Skill relevance
         - Neurodiverse accommodations
         """
-        score = 0.5
-        
-        # Difficulty matching
-        difficulty = candidate.get("difficulty", 0.5)
-        
         # Compute average mastery
         if skill_masteries:
             avg_mastery = sum(s.mastery_level for s in skill_masteries) / len(skill_masteries)
@@ -262,27 +335,28 @@ class RecommendationEngine:
         
         # Ideal difficulty is slightly above current mastery (zone of proximal development)
         ideal_difficulty = avg_mastery + 0.1
-        difficulty_match = 1 - abs(difficulty - ideal_difficulty)
-        score = 0.3 + 0.7 * difficulty_match
+        difficulty_match = 1 - np.abs(difficulties - ideal_difficulty)
+        scores = 0.3 + 0.7 * difficulty_match
         
         # Skill relevance
-        candidate_skills = set(candidate.get("skill_ids", []))
         if skill_masteries:
             # Boost items targeting low-mastery skills
-            low_mastery_skills = {
-                s.skill_id for s in skill_masteries if s.mastery_level < 0.7
-            }
-            overlap = candidate_skills & low_mastery_skills
-            if overlap:
-                score += 0.2 * len(overlap) / max(len(candidate_skills), 1)
+            low_mastery = np.zeros(len(skill_index))
+            for s in skill_masteries:
+                if s.mastery_level < 0.7 and s.skill_id in skill_index:
+                    low_mastery[skill_index[s.skill_id]] = 1.0
+            
+            overlap = skill_matrix @ low_mastery
+            skill_counts = skill_matrix.sum(axis=1)
+            scores += 0.2 * overlap / np.maximum(skill_counts, 1)
         
         # Neurodiverse accommodations
         if request.learner.neurodiverse_profile:
             # Boost items with appropriate accommodations
             # This is simplified - real implementation would check item metadata
-            score += 0.1
+            scores += 0.1
         
-        return min(1.0, max(0.0, score))
+        return np.clip(scores, 0.0, 1.0)
 
     def _knowledge_tracing_score(
         self,
@@ -290,7 +364,20 @@ class RecommendationEngine:
         skill_masteries: list[SkillMastery],
     ) -> float:
         """
-        Compute knowledge tracing-based score.
+        Compute knowledge tracing-based score for a single candidate.
+        """
+        _, skill_matrix, skill_index = self._candidate_arrays([candidate])
+        scores = self._knowledge_tracing_scores(skill_matrix, skill_index, skill_masteries)
+        return float(scores[0])
+
+    def _knowledge_tracing_scores(
+        self,
+        skill_matrix: np.ndarray,
+        skill_index: dict[str, int],
+        skill_masteries: list[SkillMastery],
+    ) -> np.ndarray:
+        """
+        Compute knowledge tracing-based scores for a batch of candidates.
         
         Prioritizes items that:
         - Target skills with low but non-zero mastery (learning zone)
@@ -298,96 +385,100 @@ class RecommendationEngine:
         - Maximize expected learning gain
         """
         if not skill_masteries:
-            return 0.5
+            return np.full(skill_matrix.shape[0], 0.5)
         
-        candidate_skills = set(candidate.get("skill_ids", []))
-        mastery_map = {s.skill_id: s for s in skill_masteries}
+        # New skills - moderate priority
+        skill_scores = np.full(len(skill_index), 0.5)
         
-        total_score = 0.0
-        skill_count = 0
+        mastery_map = {s.skill_id: s for s in skill_masteries}
+        practiced = [s for skill_id, s in mastery_map.items() if skill_id in skill_index]
         
-        for skill_id in candidate_skills:
-            mastery = mastery_map.get(skill_id)
+        if practiced:
+            m = np.array([s.mastery_level for s in practiced])
+            p_know = np.array(
+                [np.nan if s.bkt_p_know is None else s.bkt_p_know for s in practiced]
+            )
+            
+            # Score based on learning potential
+            # Highest score for skills with mastery 0.3-0.7 (learning zone)
+            learning_scores = np.select(
+                [m < 0.3, m < 0.7],
+                [
+                    0.3 + m,  # Low but increasing
+                    0.8 + 0.2 * (1 - np.abs(0.5 - m) / 0.2),  # Peak at 0.5
+                ],
+                default=0.6 - (m - 0.7) * 2,  # Decreasing for mastered skills
+            )
+            
+            # Boost based on BKT p_know if available
+            learning_scores = np.where(
+                np.isnan(p_know), learning_scores, learning_scores * (0.5 + 0.5 * p_know)
+            )
             
-            if mastery:
-                # Score based on learning potential
-                # Highest score for skills with mastery 0.3-0.7 (learning zone)
-                m = mastery.mastery_level
-                if m < 0.3:
-                    skill_score = 0.3 + m  # Low but increasing
-                elif m < 0.7:
-                    skill_score = 0.8 + 0.2 * (1 - abs(0.5 - m) / 0.2)  # Peak at 0.5
-                else:
-                    skill_score = 0.6 - (m - 0.7) * 2  # Decreasing for mastered skills
-                
-                # Boost based on BKT p_know if available
-                if mastery.bkt_p_know is not None:
-                    learning_rate = mastery.bkt_p_know
-                    skill_score *= (0.5 + 0.5 * learning_rate)
-                
-                total_score += max(0, skill_score)
-                skill_count += 1
-            else:
-                # New skill - moderate priority
-                total_score += 0.5
-                skill_count += 1
-        
-        if skill_count == 0:
-            return 0.5
-        
-        return min(1.0, total_score / skill_count)
+            cols = [skill_index[s.skill_id] for s in practiced]
+            skill_scores[cols] = np.maximum(0, learning_scores)
+        
+        skill_counts = skill_matrix.sum(axis=1)
+        mean_scores = (skill_matrix @ skill_scores) / np.maximum(skill_counts, 1)
+        
+        return np.where(skill_counts > 0, np.minimum(1.0, mean_scores), 0.5)
 
-    async def _compute_exploration_bonus(self, item_id: str) -> float:
+    async def _exploration_bonuses(self, item_ids: list[str]) -> np.ndarray:
         """
-        Compute UCB exploration bonus for an item.
+        Compute UCB exploration bonuses for a batch of items.
         
         Uses Upper Confidence Bound to balance exploration/exploitation.
         """
-        stats = await self.feature_store.get_bandit_stats(item_id)
-        
-        if not stats or stats["pulls"] == 0:
-            # Never shown - high exploration bonus
-            return self.ucb_c
-        
-        pulls = stats["pulls"]
-        mean_reward = stats["mean_reward"]
+        stats = await self.feature_store.get_bandit_stats_many(item_ids)
+        pulls = np.array(
+            [stats[item_id]["pulls"] if item_id in stats else 0.0 for item_id in item_ids]
+        )
         
         # UCB formula: mean + c * sqrt(ln(total) / pulls)
         # Approximate total with pulls * 10 for now
         total = pulls * 10
-        bonus = self.ucb_c * math.sqrt(math.log(total + 1) / (pulls + 1))
+        bonuses = self.ucb_c * np.sqrt(np.log(total + 1) / (pulls + 1))
         
-        return min(0.3, bonus)  # Cap exploration bonus
+        # Never shown - high exploration bonus; otherwise cap the bonus
+        return np.where(pulls == 0, self.ucb_c, np.minimum(0.3, bonuses))
 
-    def _apply_diversity(
+    def _select_diverse(
         self,
-        score: float,
-        already_selected: list[RecommendedItem],
-        candidate: dict[str, Any],
-    ) -> float:
+        scores: np.ndarray,
+        skill_matrix: np.ndarray,
+        limit: int,
+    ) -> list[int]:
         """
-        Apply diversity penalty to avoid recommending too similar items.
-        """
-        if not already_selected:
-            return score
-        
-        candidate_skills = set(candidate.get("skill_ids", []))
+        Pick up to limit candidates by maximal marginal relevance.
         
-        max_overlap = 0.0
-        for item in already_selected[-5:]:  # Check last 5 items
-            item_skills = set(item.metadata.get("skill_ids", []))
-            if candidate_skills and item_skills:
-                overlap = len(candidate_skills & item_skills) / len(candidate_skills | item_skills)
-                max_overlap = max(max_overlap, overlap)
+        Each step takes the candidate whose score, minus a diversity
+        penalty for its highest skill Jaccard similarity to the items
+        already picked, is largest. Ties go to the earlier candidate.
+        """
+        skill_counts = skill_matrix.sum(axis=1)
+        max_similarity = np.zeros(len(scores))
+        available = np.ones(len(scores), dtype=bool)
+        selected: list[int] = []
+        
+        for _ in range(min(limit, len(scores))):
+            adjusted = scores - self.settings.diversity_factor * max_similarity
+            best = int(np.argmax(np.where(available, adjusted, -np.inf)))
+            selected.append(best)
+            available[best] = False
+            
+            # Jaccard similarity of every candidate's skills to the new pick
+            intersection = skill_matrix @ skill_matrix[best]
+            union = skill_counts + skill_counts[best] - intersection
+            similarity = np.divide(
+                intersection, union, out=np.zeros_like(intersection), where=union > 0
+            )
+            max_similarity = np.maximum(max_similarity, similarity)
         
-        # Apply penalty for high overlap
-        diversity_penalty = max_overlap * self.settings.diversity_factor
-        return score - diversity_penalty
+        return selected
 
     def _compute_confidence(
         self,
         learner_id: str,
-        candidate: dict[str, Any],
         skill_masteries: list[SkillMastery],
     ) -> float:
         """
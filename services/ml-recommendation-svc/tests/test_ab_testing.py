@@ -0,0 +1,221 @@
+"""
+Tests for A/B Testing Service
+
+Covers:
+- Outcome timestamp handling
+- Concurrent analysis of active experiments
+- Streaming outcome moments across chunks
+"""
+
+import asyncio
+import math
+import pytest
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+from scipy import stats
+
+from src.services.ab_testing import (
+    ABTestingService,
+    ExperimentConfig,
+    ExperimentVariant,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def ab_service():
+    """Create an ABTestingService whose outcome writes are captured"""
+    service = ABTestingService(db_connection=None)
+    service._store_outcome = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def non_utc_timezone(monkeypatch):
+    """Run the test with a local timezone that is not UTC"""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture
+def chunked_outcomes(ab_service):
+    """
+    Shuffled outcomes for two variants and two metrics, streamed three at a
+    time so the moments are merged across many chunks. Values sit on a large
+    offset, where a naive sum-of-squares variance loses its precision.
+    """
+    rng = np.random.default_rng(42)
+    outcomes = []
+    for variant, shift in (("control", 0.0), ("treatment", 0.4)):
+        for metric, n in (("risk_score_improvement", 47), ("engagement_improvement", 31)):
+            values = 1e6 + shift + rng.normal(0.0, 1.0, n)
+            outcomes.extend(
+                {
+                    "variant_name": variant,
+                    "metric_name": metric,
+                    "value": float(value),
+                    "student_id": f"{variant}_{i % 20}",
+                }
+                for i, value in enumerate(values)
+            )
+    outcomes = [outcomes[i] for i in rng.permutation(len(outcomes))]
+    
+    ab_service.OUTCOME_CHUNK_SIZE = 3
+    ab_service._get_experiment_outcomes = MagicMock(return_value=outcomes)
+    return outcomes
+
+
+def outcome_values(outcomes: list[dict], variant: str, metric: str) -> np.ndarray:
+    """Values recorded for one variant/metric pair"""
+    return np.array([
+        o["value"] for o in outcomes
+        if o["variant_name"] == variant and o["metric_name"] == metric
+    ])
+
+
+# ============================================================================
+# Outcome Tracking Tests
+# ============================================================================
+
+class TestTrackOutcome:
+    """Tests for outcome tracking"""
+    
+    @pytest.mark.asyncio
+    async def test_naive_timestamp_is_utc(self, ab_service, non_utc_timezone):
+        """Test that naive datetimes are stored as UTC, not local time"""
+        await ab_service.track_outcome(
+            "exp_1", "student_1", "engagement_improvement", 0.2,
+            timestamp=datetime(2026, 1, 15, 12, 0, 0, 250000),
+        )
+        
+        outcome = ab_service._store_outcome.call_args.args[0]
+        assert outcome.timestamp == datetime(2026, 1, 15, 12, 0, 0, 250000, tzinfo=timezone.utc)
+    
+    @pytest.mark.asyncio
+    async def test_aware_timestamp_is_converted_to_utc(self, ab_service, non_utc_timezone):
+        """Test that aware datetimes keep their instant"""
+        timestamp = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc).astimezone()
+        
+        await ab_service.track_outcome(
+            "exp_1", "student_1", "engagement_improvement", 0.2, timestamp=timestamp
+        )
+        
+        outcome = ab_service._store_outcome.call_args.args[0]
+        assert outcome.timestamp == datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+# ============================================================================
+# Active Experiment Analysis Tests
+# ============================================================================
+
+class TestAnalyzeAllActive:
+    """Tests for analyzing every active experiment at once"""
+    
+    @pytest.mark.asyncio
+    async def test_failed_analysis_is_left_out(self, ab_service):
+        """Test that an experiment that fails to analyze is skipped"""
+        ab_service._active_experiments = {"exp_ok": object(), "exp_bad": object()}
+        
+        async def analyze(experiment_id, interim=False):
+            if experiment_id == "exp_bad":
+                raise ValueError("no outcomes")
+            return f"results:{experiment_id}"
+        
+        ab_service.analyze_results = analyze
+        
+        assert await ab_service.analyze_all_active() == {"exp_ok": "results:exp_ok"}
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_analysis_propagates(self, ab_service):
+        """Test that a cancelled analysis is not returned as a result"""
+        ab_service._active_experiments = {"exp_ok": object(), "exp_cancelled": object()}
+        
+        async def analyze(experiment_id, interim=False):
+            if experiment_id == "exp_cancelled":
+                raise asyncio.CancelledError()
+            return f"results:{experiment_id}"
+        
+        ab_service.analyze_results = analyze
+        
+        with pytest.raises(asyncio.CancelledError):
+            await ab_service.analyze_all_active()
+
+
+# ============================================================================
+# Streaming Moment Tests
+# ============================================================================
+
+class TestStreamingMoments:
+    """Tests for folding outcome chunks into per-pair moments"""
+    
+    @pytest.mark.asyncio
+    async def test_chunked_moments_match_direct_computation(self, ab_service, chunked_outcomes):
+        """Test that merged chunk moments equal moments over all values"""
+        merge = MagicMock(wraps=ab_service._merge_chunk_moments)
+        ab_service._merge_chunk_moments = merge
+        
+        table = await ab_service._build_outcome_table("exp_1", {"control": 0, "treatment": 1})
+        
+        assert merge.call_count == math.ceil(len(chunked_outcomes) / 3)
+        for variant in ("control", "treatment"):
+            for metric in ("risk_score_improvement", "engagement_improvement"):
+                values = outcome_values(chunked_outcomes, variant, metric)
+                moments = table.moments(variant, metric)
+                
+                assert moments.n == len(values)
+                assert moments.mean == pytest.approx(values.mean(), rel=1e-12)
+                assert moments.m2 == pytest.approx(
+                    np.sum((values - values.mean()) ** 2), rel=1e-9
+                )
+                assert moments.variance(ddof=1) == pytest.approx(values.var(ddof=1), rel=1e-9)
+        
+        assert table.participants.tolist() == [20, 20]
+    
+    @pytest.mark.asyncio
+    async def test_chunked_analysis_matches_scipy(self, ab_service, chunked_outcomes):
+        """Test that test statistics from merged moments match scipy on raw values"""
+        config = ExperimentConfig(
+            experiment_id="exp_1",
+            name="Chunked",
+            description="Chunked outcome stream",
+            tenant_id="tenant_1",
+            target_risk_levels=["high"],
+            variants=[
+                ExperimentVariant(name="control", weight=0.5),
+                ExperimentVariant(name="treatment", weight=0.5),
+            ],
+            min_sample_size=10,
+        )
+        ab_service._get_experiment = AsyncMock(return_value=config)
+        
+        results = await ab_service.analyze_results("exp_1")
+        
+        metric = "risk_score_improvement"
+        control = outcome_values(chunked_outcomes, "control", metric)
+        treatment = outcome_values(chunked_outcomes, "treatment", metric)
+        
+        expected = stats.ttest_ind(treatment, control)
+        assert results.p_value == pytest.approx(expected.pvalue, rel=1e-6)
+        
+        pooled_std = math.sqrt((control.var() + treatment.var()) / 2)
+        diff = treatment.mean() - control.mean()
+        assert results.effect_size == pytest.approx(diff / pooled_std, rel=1e-6)
+        
+        se = pooled_std * math.sqrt(1 / len(control) + 1 / len(treatment))
+        z = stats.norm.ppf(1 - config.significance_level / 2)
+        assert results.confidence_interval == pytest.approx(
+            (diff - z * se, diff + z * se), rel=1e-6
+        )
+        assert results.primary_metric_by_variant == pytest.approx({
+            "control": control.mean(),
+            "treatment": treatment.mean(),
+        }, rel=1e-12)
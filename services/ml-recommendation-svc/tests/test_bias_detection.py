@@ -10,10 +10,16 @@ Comprehensive tests covering:
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 import json
 
+import msgspec
+import orjson
+
+from src.services import bias_detection
+
 from src.services.bias_detection import (
     BiasDetectionService,
     BiasReport,
@@ -41,12 +47,20 @@ def bias_service():
 def mock_redis():
     """Mock Redis client"""
     mock = AsyncMock()
+    mock.get = AsyncMock(return_value=None)
     mock.lpush = AsyncMock()
     mock.ltrim = AsyncMock()
     mock.setex = AsyncMock()
     mock.lrange = AsyncMock(return_value=[])
     mock.hgetall = AsyncMock(return_value={})
     mock.hset = AsyncMock()
+    mock.register_script = MagicMock(return_value=AsyncMock(return_value=1))
+    
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    mock.pipeline = MagicMock(return_value=pipe)
     return mock
 
 
@@ -137,9 +151,10 @@ class TestGroupStatistics:
     def test_calculates_mean_prediction(self, bias_service, balanced_predictions):
         """Test mean prediction calculation"""
         groups = bias_service._group_by_demographics(balanced_predictions)
+        arrays = bias_service._build_prediction_arrays(balanced_predictions)
         gender_groups = groups["gender"]
         
-        stats = bias_service._calculate_group_statistics(gender_groups, {})
+        stats = bias_service._calculate_group_statistics(gender_groups, arrays).to_group_statistics()
         
         male_stats = next(s for s in stats if s.group_name == "male")
         female_stats = next(s for s in stats if s.group_name == "female")
@@ -150,9 +165,10 @@ class TestGroupStatistics:
     def test_calculates_positive_rate(self, bias_service, balanced_predictions):
         """Test positive rate calculation"""
         groups = bias_service._group_by_demographics(balanced_predictions)
+        arrays = bias_service._build_prediction_arrays(balanced_predictions)
         gender_groups = groups["gender"]
         
-        stats = bias_service._calculate_group_statistics(gender_groups, {})
+        stats = bias_service._calculate_group_statistics(gender_groups, arrays).to_group_statistics()
         
         for s in stats:
             assert 0.0 <= s.positive_rate <= 1.0
@@ -160,9 +176,10 @@ class TestGroupStatistics:
     def test_calculates_sample_size(self, bias_service, balanced_predictions):
         """Test sample size tracking"""
         groups = bias_service._group_by_demographics(balanced_predictions)
+        arrays = bias_service._build_prediction_arrays(balanced_predictions)
         gender_groups = groups["gender"]
         
-        stats = bias_service._calculate_group_statistics(gender_groups, {})
+        stats = bias_service._calculate_group_statistics(gender_groups, arrays).to_group_statistics()
         
         total = sum(s.sample_size for s in stats)
         assert total == len(balanced_predictions)
@@ -178,9 +195,10 @@ class TestStatisticalParity:
     def test_detects_no_bias_when_balanced(self, bias_service, balanced_predictions):
         """Test no significant bias in balanced predictions"""
         groups = bias_service._group_by_demographics(balanced_predictions)
+        arrays = bias_service._build_prediction_arrays(balanced_predictions)
         gender_groups = groups["gender"]
         
-        stats = bias_service._calculate_group_statistics(gender_groups, {})
+        stats = bias_service._calculate_group_statistics(gender_groups, arrays).to_group_statistics()
         
         reference = stats[0]
         comparison = stats[1]
@@ -197,9 +215,10 @@ class TestStatisticalParity:
     def test_detects_bias_when_unbalanced(self, bias_service, biased_predictions):
         """Test bias detection in biased predictions"""
         groups = bias_service._group_by_demographics(biased_predictions)
+        arrays = bias_service._build_prediction_arrays(biased_predictions)
         race_groups = groups["race_ethnicity"]
         
-        stats = bias_service._calculate_group_statistics(race_groups, {})
+        stats = bias_service._calculate_group_statistics(race_groups, arrays).to_group_statistics()
         
         group_a = next(s for s in stats if s.group_name == "group_a")
         group_b = next(s for s in stats if s.group_name == "group_b")
@@ -216,9 +235,10 @@ class TestStatisticalParity:
     def test_result_includes_explanation(self, bias_service, biased_predictions):
         """Test that results include human-readable explanation"""
         groups = bias_service._group_by_demographics(biased_predictions)
+        arrays = bias_service._build_prediction_arrays(biased_predictions)
         race_groups = groups["race_ethnicity"]
         
-        stats = bias_service._calculate_group_statistics(race_groups, {})
+        stats = bias_service._calculate_group_statistics(race_groups, arrays).to_group_statistics()
         
         result = bias_service._evaluate_statistical_parity(
             ProtectedAttribute.RACE_ETHNICITY,
@@ -241,9 +261,10 @@ class TestDisparateImpact:
     def test_calculates_disparate_impact_ratio(self, bias_service, biased_predictions):
         """Test disparate impact ratio calculation"""
         groups = bias_service._group_by_demographics(biased_predictions)
+        arrays = bias_service._build_prediction_arrays(biased_predictions)
         race_groups = groups["race_ethnicity"]
         
-        stats = bias_service._calculate_group_statistics(race_groups, {})
+        stats = bias_service._calculate_group_statistics(race_groups, arrays).to_group_statistics()
         
         result = bias_service._evaluate_disparate_impact(
             ProtectedAttribute.RACE_ETHNICITY,
@@ -612,7 +633,8 @@ class TestAlertManagement:
         
         # If high/critical severity was found, alerts should be created
         if report.overall_bias_severity in [BiasSeverity.HIGH, BiasSeverity.CRITICAL]:
-            mock_redis.lpush.assert_called()
+            pushed_keys = [c.args[0] for c in mock_redis.pipeline.return_value.lpush.call_args_list]
+            assert "bias_alerts:tenant_123:pending" in pushed_keys
     
     @pytest.mark.asyncio
     async def test_get_pending_alerts(self, mock_redis):
@@ -637,7 +659,7 @@ class TestAlertManagement:
                 "resolved": True  # Already resolved
             }),
         ]
-        mock_redis.lrange = AsyncMock(return_value=alerts_data)
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[alerts_data, []])
         
         service = BiasDetectionService(redis_client=mock_redis)
         alerts = await service.get_pending_alerts("tenant_123")
@@ -646,6 +668,18 @@ class TestAlertManagement:
         assert len(alerts) == 1
         assert alerts[0]["alert_id"] == "alert_1"
     
+    @pytest.mark.asyncio
+    async def test_get_pending_alerts_without_alerts(self, mock_redis):
+        """Test that a tenant with no alerts is served in one round trip"""
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[[], []])
+        
+        service = BiasDetectionService(redis_client=mock_redis)
+        alerts = await service.get_pending_alerts("tenant_123")
+        
+        assert alerts == []
+        mock_redis.pipeline.return_value.execute.assert_awaited_once()
+        mock_redis.lrange.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_acknowledge_alert(self, mock_redis):
         """Test acknowledging an alert"""
@@ -660,8 +694,39 @@ class TestAlertManagement:
         assert result is True
     
     @pytest.mark.asyncio
-    async def test_resolve_alert(self, mock_redis):
-        """Test resolving an alert"""
+    async def test_get_pending_alerts_merges_legacy_list(self, mock_redis):
+        """Test that legacy alerts stay visible next to new pending alerts"""
+        pending = [json.dumps({"alert_id": "alert_new", "resolved": False})]
+        legacy = [
+            json.dumps({"alert_id": "alert_old", "resolved": False}),
+            json.dumps({"alert_id": "alert_done", "resolved": True}),
+        ]
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[pending, legacy])
+        
+        service = BiasDetectionService(redis_client=mock_redis)
+        alerts = await service.get_pending_alerts("tenant_123")
+        
+        assert [a["alert_id"] for a in alerts] == ["alert_new", "alert_old"]
+    
+    @pytest.mark.asyncio
+    async def test_get_pending_alerts_caps_combined_lists(self, mock_redis):
+        """Test that pending and legacy alerts together stay within the limit"""
+        limit = BiasDetectionService.MAX_PENDING_ALERTS
+        pending = [json.dumps({"alert_id": f"new_{i}"}) for i in range(limit)]
+        legacy = [json.dumps({"alert_id": f"old_{i}"}) for i in range(limit)]
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[pending, legacy])
+        
+        service = BiasDetectionService(redis_client=mock_redis)
+        alerts = await service.get_pending_alerts("tenant_123")
+        
+        assert [a["alert_id"] for a in alerts] == [f"new_{i}" for i in range(limit)]
+        pipe = mock_redis.pipeline.return_value
+        assert [c.args[1:] for c in pipe.lrange.call_args_list] == [(0, limit - 1)] * 2
+    
+    @pytest.mark.asyncio
+    async def test_resolve_unknown_alert_returns_false(self, mock_redis):
+        """Test that resolving an alert that does not exist reports failure"""
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[[], []])
         service = BiasDetectionService(redis_client=mock_redis)
         
         result = await service.resolve_alert(
@@ -671,7 +736,246 @@ class TestAlertManagement:
             resolution_notes="Reviewed and addressed by retraining model"
         )
         
+        assert result is False
+        mock_redis.register_script.return_value.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_resolve_alert_moves_alert_to_resolved_list(self, mock_redis):
+        """Test that resolving moves the alert out of the pending list"""
+        pending = json.dumps({"alert_id": "alert_1", "resolved": False})
+        legacy = json.dumps({"alert_id": "alert_2", "resolved": False})
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[[pending], [legacy]])
+        service = BiasDetectionService(redis_client=mock_redis)
+        
+        result = await service.resolve_alert(
+            tenant_id="tenant_123",
+            alert_id="alert_1",
+            user_id="user_456",
+            resolution_notes="Retrained"
+        )
+        
         assert result is True
+        script = mock_redis.register_script.return_value
+        script.assert_awaited_once()
+        assert script.await_args.kwargs["keys"] == [
+            "bias_alerts:tenant_123:pending",
+            "bias_alerts:tenant_123:resolved",
+        ]
+        raw, payload, limit = script.await_args.kwargs["args"]
+        assert raw == pending
+        assert json.loads(payload)["resolved"] is True
+        assert limit == BiasDetectionService.MAX_STORED_ALERTS
+    
+    @pytest.mark.asyncio
+    async def test_resolve_legacy_alert(self, mock_redis):
+        """Test that alerts from the pre-split list can be resolved"""
+        pending = json.dumps({"alert_id": "alert_1", "resolved": False})
+        legacy = json.dumps({"alert_id": "alert_2", "resolved": False})
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[[pending], [legacy]])
+        service = BiasDetectionService(redis_client=mock_redis)
+        
+        result = await service.resolve_alert(
+            tenant_id="tenant_123",
+            alert_id="alert_2",
+            user_id="user_456",
+            resolution_notes="Retrained"
+        )
+        
+        assert result is True
+        script = mock_redis.register_script.return_value
+        assert script.await_args.kwargs["keys"] == [
+            "bias_alerts:tenant_123",
+            "bias_alerts:tenant_123:resolved",
+        ]
+        raw, payload, _ = script.await_args.kwargs["args"]
+        assert raw == legacy
+        assert json.loads(payload)["resolution_notes"] == "Retrained"
+    
+    @pytest.mark.asyncio
+    async def test_concurrently_resolved_alert_returns_false(self, mock_redis):
+        """Test that losing a resolve race does not report success"""
+        pending = json.dumps({"alert_id": "alert_1", "resolved": False})
+        mock_redis.pipeline.return_value.execute = AsyncMock(return_value=[[pending], []])
+        mock_redis.register_script.return_value = AsyncMock(return_value=0)
+        service = BiasDetectionService(redis_client=mock_redis)
+        
+        result = await service.resolve_alert(
+            tenant_id="tenant_123",
+            alert_id="alert_1",
+            user_id="user_456",
+            resolution_notes="Retrained"
+        )
+        
+        assert result is False
+        mock_redis.register_script.return_value.assert_awaited_once()
+
+
+# ============================================================================
+# Report Cache Tests
+# ============================================================================
+
+class TestReportCache:
+    """Tests for content-addressed bias report caching"""
+    
+    @pytest.mark.asyncio
+    async def test_serves_cached_report_for_same_inputs(self, mock_redis, biased_predictions):
+        """Test that a repeated analysis is served from the cache"""
+        store = {}
+        pipe = mock_redis.pipeline.return_value
+        pipe.setex = MagicMock(side_effect=lambda k, ttl, v: store.__setitem__(k, v))
+        mock_redis.get = AsyncMock(side_effect=lambda k: store.get(k))
+        service = BiasDetectionService(redis_client=mock_redis)
+        
+        first = await service.analyze_bias(
+            tenant_id="tenant_123",
+            model_version="1.0.0",
+            predictions=biased_predictions
+        )
+        pipeline_calls = mock_redis.pipeline.call_count
+        lpush_calls = mock_redis.lpush.call_count
+        
+        second = await service.analyze_bias(
+            tenant_id="tenant_123",
+            model_version="1.0.0",
+            predictions=biased_predictions
+        )
+        
+        assert replace(
+            second,
+            report_id=first.report_id,
+            generated_at=first.generated_at,
+            analysis_period_start=first.analysis_period_start,
+            analysis_period_end=first.analysis_period_end,
+        ) == first
+        # Only the report history is written; alerts are not raised again
+        assert mock_redis.pipeline.call_count == pipeline_calls + 1
+        assert mock_redis.lpush.call_count == lpush_calls
+        assert pipe.lpush.call_args.args[0] == "bias_reports:tenant_123"
+    
+    @pytest.mark.asyncio
+    async def test_cached_report_is_restamped(self, mock_redis, biased_predictions, monkeypatch):
+        """Test that a cache hit gets a fresh id, timestamp and period"""
+        store = {}
+        pipe = mock_redis.pipeline.return_value
+        pipe.setex = MagicMock(side_effect=lambda k, ttl, v: store.__setitem__(k, v))
+        mock_redis.get = AsyncMock(side_effect=lambda k: store.get(k))
+        service = BiasDetectionService(redis_client=mock_redis)
+        
+        first = await service.analyze_bias(
+            tenant_id="tenant_123",
+            model_version="1.0.0",
+            predictions=biased_predictions
+        )
+        
+        later = first.generated_at + timedelta(hours=2)
+        
+        class FrozenDatetime(datetime):
+            @classmethod
+            def utcnow(cls):
+                return later
+        
+        monkeypatch.setattr(bias_detection, "datetime", FrozenDatetime)
+        second = await service.analyze_bias(
+            tenant_id="tenant_123",
+            model_version="1.0.0",
+            predictions=biased_predictions,
+            analysis_period_days=30
+        )
+        
+        assert second.report_id != first.report_id
+        assert second.generated_at == later
+        assert second.analysis_period_end == later
+        assert second.analysis_period_start == later - timedelta(days=30)
+        assert second.fairness_results == first.fairness_results
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_is_recorded_in_history(self, mock_redis, biased_predictions, monkeypatch):
+        """Test that a cache hit stores its own history entry and full report"""
+        store = {}
+        pipe = mock_redis.pipeline.return_value
+        pipe.setex = MagicMock(side_effect=lambda k, ttl, v: store.__setitem__(k, v))
+        mock_redis.get = AsyncMock(side_effect=lambda k: store.get(k))
+        service = BiasDetectionService(redis_client=mock_redis)
+        
+        first = await service.analyze_bias(
+            tenant_id="tenant_123",
+            model_version="1.0.0",
+            predictions=biased_predictions
+        )
+        cache_entries = {k: v for k, v in store.items() if k.startswith("bias_report_cache:")}
+        
+        later = first.generated_at + timedelta(hours=2)
+        
+        class FrozenDatetime(datetime):
+            @classmethod
+            def utcnow(cls):
+                return later
+        
+        monkeypatch.setattr(bias_detection, "datetime", FrozenDatetime)
+        pipe.lpush.reset_mock()
+        pipe.setex.reset_mock()
+        second = await service.analyze_bias(
+            tenant_id="tenant_123",
+            model_version="1.0.0",
+            predictions=biased_predictions
+        )
+        
+        key, entry = pipe.lpush.call_args.args
+        assert key == "bias_reports:tenant_123"
+        assert orjson.loads(entry)["report_id"] == second.report_id
+        
+        stored = service._deserialize_full_report(store[f"bias_report_full:{second.report_id}"])
+        assert stored == second
+        
+        # The cache entry is not rewritten, so repeated hits cannot keep it alive
+        assert [c.args[0] for c in pipe.setex.call_args_list] == [
+            f"bias_report_full:{second.report_id}"
+        ]
+        assert {k: v for k, v in store.items() if k.startswith("bias_report_cache:")} == cache_entries
+    
+    @pytest.mark.asyncio
+    async def test_store_report_pipelines_writes(self, mock_redis, balanced_predictions):
+        """Test that report storage is a single pipelined round trip"""
+        report = await BiasDetectionService().analyze_bias(
+            tenant_id="tenant_123",
+            model_version="1.0.0",
+            predictions=balanced_predictions
+        )
+        service = BiasDetectionService(redis_client=mock_redis)
+        
+        await service._store_report(report, "abc")
+        
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.assert_awaited_once()
+        assert pipe.setex.call_count == 2
+        mock_redis.lpush.assert_not_called()
+        mock_redis.setex.assert_not_called()
+    
+    def test_fingerprint_changes_with_scores(self, bias_service, balanced_predictions):
+        """Test that changing a single score changes the cache key"""
+        arrays = bias_service._build_prediction_arrays(balanced_predictions)
+        groups = bias_service._group_by_demographics(balanced_predictions)
+        key = bias_service._report_fingerprint("t", "1.0.0", 30, arrays, groups, False)
+        
+        arrays.scores[0] += 0.01
+        
+        assert bias_service._report_fingerprint("t", "1.0.0", 30, arrays, groups, False) != key
+
+    @pytest.mark.asyncio
+    async def test_reads_msgpack_and_legacy_json_reports(self, bias_service, biased_predictions):
+        """Test that stored reports round-trip in both blob formats"""
+        report = await bias_service.analyze_bias(
+            tenant_id="tenant_123",
+            model_version="1.0.0",
+            predictions=biased_predictions
+        )
+        blob = bias_service._serialize_full_report(report)
+        legacy = orjson.dumps(msgspec.msgpack.decode(blob[1:]))
+
+        assert blob[:1] == b"\x01"
+        assert legacy[:1] == b"{"
+        assert bias_service._deserialize_full_report(blob) == report
+        assert bias_service._deserialize_full_report(legacy) == report
 
 
 # ============================================================================
@@ -716,6 +1020,30 @@ class TestMinimumSampleSize:
             if r.attribute == ProtectedAttribute.GENDER
         ]
         assert len(gender_results) == 0
+    
+    @pytest.mark.asyncio
+    async def test_short_circuits_too_few_predictions(self, mock_redis):
+        """Test that samples too small for any comparison are not analyzed"""
+        predictions = [
+            {
+                "student_id": f"s_{i}",
+                "risk_score": 0.9 if i % 2 else 0.1,
+                "demographics": {"gender": "male" if i % 2 else "female"}
+            }
+            for i in range(BiasDetectionService.MINIMUM_GROUP_SIZE * 2 - 1)
+        ]
+        service = BiasDetectionService(redis_client=mock_redis)
+        
+        report = await service.analyze_bias(
+            tenant_id="tenant_123",
+            model_version="1.0.0",
+            predictions=predictions
+        )
+        
+        assert report.fairness_results == []
+        assert report.demographic_coverage["gender"] == len(predictions)
+        assert report.requires_review is False
+        mock_redis.pipeline.assert_not_called()
 
 
 # ============================================================================
@@ -0,0 +1,190 @@
+"""
+Tests for Feature Store
+
+Covers:
+- Learner feature hash encoding
+- Atomic learner feature updates
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+
+from src.services.feature_store import (
+    FeatureStore,
+    _pack_learner_fields,
+    _unpack_learner_fields,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def feature_store():
+    """FeatureStore with a mocked Redis client, pipeline and practice script"""
+    store = FeatureStore("redis://localhost:6379/0")
+    store.client = MagicMock()
+    
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    store.client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    store.client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    store.client.pipeline.return_value.pipe = pipe
+    
+    store._record_practice = AsyncMock()
+    return store
+
+
+def hash_of(fields: dict[str, bytes]) -> dict[bytes, bytes]:
+    """Fields as Redis returns them from HGETALL"""
+    return {name.encode(): value for name, value in fields.items()}
+
+
+# ============================================================================
+# Learner Field Encoding Tests
+# ============================================================================
+
+class TestLearnerFieldEncoding:
+    """Tests for flattening learner features into hash fields"""
+    
+    def test_round_trip(self):
+        """Test that scalars and nested dicts survive a round trip"""
+        features = {
+            "total_practices": 12,
+            "accuracy": 0.75,
+            "grade": "5",
+            "skill_masteries": {"skill_001": 0.4, "skill:002": 1},
+            "tags": ["visual"],
+        }
+        
+        fields = _pack_learner_fields(features)
+        
+        assert fields["skill_masteries:skill_001"] == b"0.4"
+        assert _unpack_learner_fields(hash_of(fields)) == features
+    
+    def test_empty_nested_dict_round_trips(self):
+        """Test that an empty nested dict is not dropped"""
+        fields = _pack_learner_fields({"skill_masteries": {}, "total_sessions": 1})
+        
+        assert _unpack_learner_fields(hash_of(fields)) == {
+            "skill_masteries": {},
+            "total_sessions": 1,
+        }
+    
+    def test_empty_nested_dict_merges_later_entries(self):
+        """Test that entries added after an empty dict was stored are kept"""
+        fields = _pack_learner_fields({"skill_masteries": {}})
+        fields["skill_masteries:skill_001"] = b"0.9"
+        
+        assert _unpack_learner_fields(hash_of(fields)) == {
+            "skill_masteries": {"skill_001": 0.9},
+        }
+    
+    def test_rejects_separator_in_name(self):
+        """Test that top-level names cannot be confused with nested fields"""
+        with pytest.raises(ValueError):
+            _pack_learner_fields({"skill:001": 0.5})
+    
+    def test_counters_written_as_integers(self):
+        """Test that float counters are stored so HINCRBY can update them"""
+        fields = _pack_learner_fields({"total_practices": 5.0, "accuracy": 1.0})
+        
+        assert fields["total_practices"] == b"5"
+        assert fields["accuracy"] == b"1.0"
+    
+    def test_rejects_fractional_counter(self):
+        """Test that a non-integral counter is refused"""
+        with pytest.raises(ValueError):
+            _pack_learner_fields({"total_sessions": 2.5})
+
+
+# ============================================================================
+# Atomic Learner Update Tests
+# ============================================================================
+
+class TestAtomicLearnerUpdates:
+    """Tests for single-call learner feature updates"""
+    
+    @pytest.mark.asyncio
+    async def test_set_learner_features_replaces_hash(self, feature_store):
+        """Test that setting features rewrites the hash in one transaction"""
+        await feature_store.set_learner_features("l1", {"total_practices": 3.0}, ttl_seconds=60)
+        
+        key = "ml:features:learner_features:l1"
+        pipe = feature_store.client.pipeline.return_value.pipe
+        feature_store.client.pipeline.assert_called_once_with(transaction=True)
+        pipe.delete.assert_called_once_with(key)
+        pipe.hset.assert_called_once_with(key, mapping={"total_practices": b"3"})
+        pipe.expire.assert_called_once_with(key, 60)
+        pipe.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_learner_features_reads_hash(self, feature_store):
+        """Test that features are rebuilt from HGETALL"""
+        feature_store.client.hgetall = AsyncMock(return_value={
+            b"total_practices": b"3",
+            b"skill_masteries:skill_001": b"0.5",
+        })
+        
+        features = await feature_store.get_learner_features("l1")
+        
+        feature_store.client.hgetall.assert_awaited_once_with("ml:features:learner_features:l1")
+        assert features == {"total_practices": 3, "skill_masteries": {"skill_001": 0.5}}
+    
+    @pytest.mark.asyncio
+    async def test_record_learner_practice_runs_script(self, feature_store):
+        """Test that a practice attempt is one script call"""
+        await feature_store.record_learner_practice("l1", is_correct=True, ttl_seconds=60)
+        await feature_store.record_learner_practice("l1", is_correct=False, ttl_seconds=60)
+        
+        calls = feature_store._record_practice.await_args_list
+        assert [c.kwargs for c in calls] == [
+            {"keys": ["ml:features:learner_features:l1"], "args": [1, 60]},
+            {"keys": ["ml:features:learner_features:l1"], "args": [0, 60]},
+        ]
+        feature_store.client.pipeline.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_set_learner_skill_mastery_sets_one_field(self, feature_store):
+        """Test that a skill update writes only its own field"""
+        await feature_store.set_learner_skill_mastery("l1", "skill_001", 0.8, ttl_seconds=60)
+        
+        key = "ml:features:learner_features:l1"
+        pipe = feature_store.client.pipeline.return_value.pipe
+        feature_store.client.pipeline.assert_called_once_with(transaction=True)
+        pipe.hset.assert_called_once_with(key, "skill_masteries:skill_001", b"0.8")
+        pipe.expire.assert_called_once_with(key, 60)
+        pipe.delete.assert_not_called()
+        pipe.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_record_learner_session_increments_counters(self, feature_store):
+        """Test that a session end is counted in one transaction"""
+        await feature_store.record_learner_session(
+            "l1", duration_minutes=25, activities_completed=4, ttl_seconds=60
+        )
+        
+        key = "ml:features:learner_features:l1"
+        pipe = feature_store.client.pipeline.return_value.pipe
+        feature_store.client.pipeline.assert_called_once_with(transaction=True)
+        assert [c.args for c in pipe.hincrby.call_args_list] == [
+            (key, "total_sessions", 1),
+            (key, "activities_completed", 4),
+        ]
+        pipe.hset.assert_called_once_with(key, "last_session_duration", orjson.dumps(25))
+        pipe.expire.assert_called_once_with(key, 60)
+        pipe.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_updates_are_noops_without_client(self):
+        """Test that updates do nothing before connect()"""
+        store = FeatureStore("redis://localhost:6379/0")
+        
+        await store.record_learner_practice("l1", is_correct=True)
+        await store.set_learner_skill_mastery("l1", "skill_001", 0.8)
+        await store.record_learner_session("l1", duration_minutes=5, activities_completed=1)
+        
+        assert await store.get_learner_features("l1") is None
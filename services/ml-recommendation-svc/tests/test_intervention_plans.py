@@ -0,0 +1,339 @@
+"""
+Tests for Intervention Recommender plan handling
+
+Covers:
+- Plan caching
+- Plan serialization
+- Batch recommendations
+- Outcome recording
+"""
+
+import pytest
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+
+from src.models.student_risk_model import (
+    FeatureCategory,
+    RiskFactor,
+    RiskLevel,
+    RiskPrediction,
+    RiskTrend,
+)
+from src.services import intervention_recommender
+from src.services.intervention_recommender import (
+    InterventionOutcome,
+    InterventionRecommender,
+    InterventionStatus,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def make_prediction(
+    student_id: str,
+    risk_level: RiskLevel,
+    factors: dict[str, float]
+) -> RiskPrediction:
+    """Risk prediction with the given factor contributions"""
+    return RiskPrediction(
+        student_id=student_id,
+        timestamp=datetime.utcnow(),
+        risk_score=0.7,
+        risk_level=risk_level,
+        confidence=0.8,
+        category_scores={"academic": 0.7, "engagement": 0.5},
+        top_risk_factors=[
+            RiskFactor(
+                feature=feature,
+                category=FeatureCategory.ACADEMIC,
+                description=feature,
+                current_value=0.3,
+                contribution=contribution,
+                severity="high",
+            )
+            for feature, contribution in factors.items()
+        ],
+        protective_factors=[],
+        risk_trend=RiskTrend.INCREASING,
+    )
+
+
+@pytest.fixture
+def risk_predictions():
+    """Predictions for a small batch of students"""
+    return {
+        "student_001": make_prediction("student_001", RiskLevel.HIGH, {
+            "current_mastery": 0.6,
+            "skill_gaps_count": 0.4,
+            "frustration_signals": 0.3,
+        }),
+        "student_002": make_prediction("student_002", RiskLevel.MODERATE, {
+            "days_since_last_session": 0.5,
+            "completion_rate": 0.2,
+        }),
+        "student_003": make_prediction("student_003", RiskLevel.CRITICAL, {
+            "session_abandonment_rate": 0.9,
+            "mastery_vs_class": 0.35,
+            "help_request_rate": 0.1,
+        }),
+    }
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client with a key/value cache and a recording pipeline"""
+    store = {}
+    mock = MagicMock()
+    mock.store = store
+    mock.get = AsyncMock(side_effect=lambda key: store.get(key))
+    mock.lrange = AsyncMock(return_value=[])
+    mock.register_script.return_value = AsyncMock()
+    
+    pipe = MagicMock()
+    pipe.setex = MagicMock(side_effect=lambda key, ttl, value: store.__setitem__(key, value))
+    pipe.execute = AsyncMock(return_value=[])
+    mock.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    mock.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    mock.pipe = pipe
+    return mock
+
+
+def without_timestamps(plan):
+    """Plan with its creation-time fields cleared, for comparisons"""
+    return replace(plan, created_at=None, review_date=None)
+
+
+# ============================================================================
+# Plan Cache Tests
+# ============================================================================
+
+class TestPlanCache:
+    """Tests for reusing plans computed from the same inputs"""
+    
+    @pytest.mark.asyncio
+    async def test_cache_miss_computes_and_stores_plan(self, mock_redis, risk_predictions):
+        """Test that a new plan is cached under its fingerprint"""
+        recommender = InterventionRecommender(redis_client=mock_redis)
+        
+        plan = await recommender.recommend_interventions(
+            "student_001", "tenant_123", risk_predictions["student_001"]
+        )
+        
+        assert plan.primary_recommendations
+        cache_keys = [k for k in mock_redis.store if k.startswith("intervention_plan_cache:")]
+        assert len(cache_keys) == 1
+        mock_redis.pipe.lpush.assert_called_once()
+        assert mock_redis.pipe.setex.call_args.args[1] == InterventionRecommender.PLAN_CACHE_TTL_SECONDS
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_reuses_recommendations(self, mock_redis, risk_predictions, monkeypatch):
+        """Test that a repeated request reuses the cached plan as a new plan"""
+        recommender = InterventionRecommender(redis_client=mock_redis)
+        
+        first = await recommender.recommend_interventions(
+            "student_001", "tenant_123", risk_predictions["student_001"]
+        )
+        cache_entries = dict(mock_redis.store)
+        mock_redis.pipe.lpush.reset_mock()
+        mock_redis.pipe.setex.reset_mock()
+        
+        later = first.created_at + timedelta(minutes=2)
+        
+        class FrozenDatetime(datetime):
+            @classmethod
+            def utcnow(cls):
+                return later
+        
+        monkeypatch.setattr(intervention_recommender, "datetime", FrozenDatetime)
+        monkeypatch.setattr(
+            recommender, "_score_interventions",
+            MagicMock(side_effect=AssertionError("cache hit should not rescore"))
+        )
+        second = await recommender.recommend_interventions(
+            "student_001", "tenant_123", risk_predictions["student_001"]
+        )
+        
+        assert without_timestamps(second) == without_timestamps(first)
+        assert second.created_at == later
+        assert second.review_date == later + timedelta(days=7)
+        
+        # The plan is tracked, but the cache entry is not rewritten
+        key, entry = mock_redis.pipe.lpush.call_args.args
+        assert key == "intervention_plans:tenant_123:student_001"
+        assert orjson.loads(entry)["created_at"] == later.isoformat()
+        mock_redis.pipe.setex.assert_not_called()
+        assert mock_redis.store == cache_entries
+    
+    @pytest.mark.asyncio
+    async def test_changed_inputs_miss_the_cache(self, mock_redis, risk_predictions):
+        """Test that a different context produces a new cache entry"""
+        recommender = InterventionRecommender(redis_client=mock_redis)
+        prediction = risk_predictions["student_001"]
+        
+        await recommender.recommend_interventions("student_001", "tenant_123", prediction)
+        await recommender.recommend_interventions(
+            "student_001", "tenant_123", prediction, {"has_iep": True}
+        )
+        
+        cache_keys = [k for k in mock_redis.store if k.startswith("intervention_plan_cache:")]
+        assert len(cache_keys) == 2
+
+
+# ============================================================================
+# Plan Serialization Tests
+# ============================================================================
+
+class TestPlanSerialization:
+    """Tests for the cached plan encoding"""
+    
+    @pytest.mark.asyncio
+    async def test_plan_round_trip(self, risk_predictions):
+        """Test that a serialized plan deserializes to an equal plan"""
+        recommender = InterventionRecommender()
+        
+        for student_id, prediction in risk_predictions.items():
+            plan = await recommender.recommend_interventions(student_id, "tenant_123", prediction)
+            
+            data = recommender._serialize_plan(plan)
+            
+            assert isinstance(data, bytes)
+            assert orjson.loads(data)["student_id"] == student_id
+            assert recommender._deserialize_plan(data) == plan
+    
+    @pytest.mark.asyncio
+    async def test_round_trip_keeps_enums_and_datetimes(self, risk_predictions):
+        """Test that nested enum and datetime fields are restored as such"""
+        recommender = InterventionRecommender()
+        plan = await recommender.recommend_interventions(
+            "student_003", "tenant_123", risk_predictions["student_003"]
+        )
+        
+        restored = recommender._deserialize_plan(recommender._serialize_plan(plan).decode())
+        
+        assert isinstance(restored.created_at, datetime)
+        assert restored.review_date - restored.created_at == timedelta(days=7)
+        for original, copy in zip(plan.primary_recommendations, restored.primary_recommendations):
+            assert copy.intervention_type is original.intervention_type
+            assert copy.intensity is original.intensity
+            assert copy.urgency is original.urgency
+
+
+# ============================================================================
+# Batch Recommendation Tests
+# ============================================================================
+
+class TestBatchRecommendations:
+    """Tests for planning many students at once"""
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_student_plans(self, risk_predictions):
+        """Test that batch plans equal one-at-a-time plans"""
+        recommender = InterventionRecommender()
+        contexts = {"student_002": {"has_iep": True}}
+        
+        batch = await recommender.recommend_interventions_batch(
+            "tenant_123", risk_predictions, contexts
+        )
+        
+        assert list(batch) == list(risk_predictions)
+        for student_id, prediction in risk_predictions.items():
+            single = await recommender.recommend_interventions(
+                student_id, "tenant_123", prediction, contexts.get(student_id)
+            )
+            assert without_timestamps(batch[student_id]) == without_timestamps(single)
+    
+    @pytest.mark.asyncio
+    async def test_batch_reads_histories_in_one_pipeline(self, mock_redis, risk_predictions):
+        """Test that histories for the batch are fetched together"""
+        mock_redis.pipe.execute = AsyncMock(side_effect=[
+            [[] for _ in risk_predictions],
+        ] + [[] for _ in risk_predictions])
+        recommender = InterventionRecommender(redis_client=mock_redis)
+        
+        await recommender.recommend_interventions_batch("tenant_123", risk_predictions)
+        
+        assert [c.args[0] for c in mock_redis.pipe.lrange.call_args_list] == [
+            f"intervention_history:tenant_123:{student_id}" for student_id in risk_predictions
+        ]
+        mock_redis.lrange.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test that an empty batch returns no plans"""
+        recommender = InterventionRecommender()
+        
+        assert await recommender.recommend_interventions_batch("tenant_123", {}) == {}
+
+
+# ============================================================================
+# Outcome Recording Tests
+# ============================================================================
+
+class TestOutcomeRecording:
+    """Tests for recording intervention outcomes"""
+    
+    def make_outcome(self, **overrides) -> InterventionOutcome:
+        values = dict(
+            intervention_id="int_targeted_practice",
+            student_id="student_001",
+            tenant_id="tenant_123",
+            started_at=datetime(2024, 1, 1),
+            ended_at=datetime(2024, 1, 15),
+            status=InterventionStatus.COMPLETED,
+            initial_risk_score=0.7,
+            final_risk_score=0.4,
+            success_indicators_met={"mastery_improvement": True},
+            educator_notes=None,
+            effectiveness_rating=0.8,
+        )
+        values.update(overrides)
+        return InterventionOutcome(**values)
+    
+    @pytest.mark.asyncio
+    async def test_queues_effectiveness_script_on_pipeline(self, mock_redis):
+        """Test that the stats update runs in the same pipeline as the history write"""
+        recommender = InterventionRecommender(redis_client=mock_redis)
+        script = mock_redis.register_script.return_value
+        
+        await recommender.record_outcome(self.make_outcome())
+        
+        pipe = mock_redis.pipe
+        history_key = "intervention_history:tenant_123:student_001"
+        assert pipe.lpush.call_args.args[0] == history_key
+        pipe.ltrim.assert_called_once_with(history_key, 0, 99)
+        script.assert_awaited_once()
+        assert script.await_args.kwargs["keys"] == [
+            "intervention_effectiveness:int_targeted_practice"
+        ]
+        assert script.await_args.kwargs["args"][0] == 0.8
+        assert script.await_args.kwargs["client"] is pipe
+        pipe.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_effectiveness_from_risk_reduction(self, mock_redis):
+        """Test that a missing rating falls back to the risk reduction"""
+        recommender = InterventionRecommender(redis_client=mock_redis)
+        script = mock_redis.register_script.return_value
+        
+        await recommender.record_outcome(self.make_outcome(effectiveness_rating=None))
+        
+        assert script.await_args.kwargs["args"][0] == pytest.approx(0.8)
+    
+    @pytest.mark.asyncio
+    async def test_incomplete_outcome_skips_script(self, mock_redis):
+        """Test that only completed interventions update effectiveness"""
+        recommender = InterventionRecommender(redis_client=mock_redis)
+        script = mock_redis.register_script.return_value
+        
+        await recommender.record_outcome(
+            self.make_outcome(status=InterventionStatus.IN_PROGRESS)
+        )
+        
+        script.assert_not_awaited()
+        mock_redis.pipe.lpush.assert_called_once()
+        mock_redis.pipe.execute.assert_awaited_once()
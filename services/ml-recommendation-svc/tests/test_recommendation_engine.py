@@ -28,12 +28,18 @@ class MockFeatureStore:
     async def get_item_embedding(self, item_id: str):
         return [0.15, 0.25, 0.35, 0.45, 0.55]
 
+    async def get_items_embeddings(self, item_ids: list[str]):
+        return {item_id: [0.15, 0.25, 0.35, 0.45, 0.55] for item_id in item_ids}
+
     async def get_similar_learners(self, learner_id: str, limit: int = 10):
         return [("learner_002", 0.9), ("learner_003", 0.8)]
 
     async def get_bandit_stats(self, arm_id: str):
         return {"pulls": 10, "rewards": 7, "mean_reward": 0.7}
 
+    async def get_bandit_stats_many(self, arm_ids: list[str]):
+        return {arm_id: {"pulls": 10, "rewards": 7, "mean_reward": 0.7} for arm_id in arm_ids}
+
     async def update_bandit_stats(self, arm_id: str, reward: float):
         pass
 
@@ -199,3 +205,49 @@ class TestRecommendationEngine:
         # Good difficulty should score higher than extremes
         assert score_good > score_easy
         assert score_good > score_hard
+
+    @pytest.mark.asyncio
+    async def test_collaborative_scores_batch(self, feature_store, settings):
+        """Test batched cosine scoring and neutral fallbacks."""
+        import numpy as np
+
+        from src.services.recommendation_engine import RecommendationEngine
+
+        async def get_items_embeddings(item_ids):
+            return {
+                "same": [0.2, 0.4, 0.6, 0.8, 1.0],
+                "opposite": [-0.1, -0.2, -0.3, -0.4, -0.5],
+                "zero": [0.0, 0.0, 0.0, 0.0, 0.0],
+                "short": [0.1, 0.2],
+            }
+
+        feature_store.get_items_embeddings = get_items_embeddings
+        engine = RecommendationEngine(feature_store, settings)
+
+        scores = await engine._collaborative_scores(
+            "learner_001", ["same", "opposite", "zero", "short", "missing"]
+        )
+
+        np.testing.assert_allclose(scores, [1.0, 0.0, 0.5, 0.5, 0.5], atol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_select_diverse_penalizes_shared_skills(self, feature_store, settings):
+        """Test that selection prefers items covering new skills."""
+        import numpy as np
+
+        from src.services.recommendation_engine import RecommendationEngine
+
+        engine = RecommendationEngine(feature_store, settings)
+
+        candidates = [
+            {"id": "a", "skill_ids": ["skill_001"]},
+            {"id": "b", "skill_ids": ["skill_001"]},
+            {"id": "c", "skill_ids": ["skill_002"]},
+        ]
+        _, skill_matrix, _ = engine._candidate_arrays(candidates)
+        scores = np.array([0.9, 0.85, 0.8])
+
+        selected = engine._select_diverse(scores, skill_matrix, 2)
+
+        # "b" outscores "c" but repeats the skill of "a"
+        assert selected == [0, 2]